@@ -1,16 +1,23 @@
 """ Update this doc"""
 import re
+import time
 
+from six.moves.urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from widgetastic.widget import Checkbox, TextInput, Widget
 from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    WebDriverException
+)
 from kiali_qe.components.enums import (
     HelpMenuEnum,
     ApplicationVersionEnum,
     IstioConfigObjectType,
     HealthType,
     IstioConfigValidation,
-    MeshWideTLSType
+    MeshWideTLSType,
+    PaginationPerPage
 )
 from kiali_qe.entities.service import (
     Service,
@@ -30,33 +37,262 @@ from kiali_qe.entities.workload import (
 from kiali_qe.entities.applications import Application, ApplicationDetails, AppWorkload
 from kiali_qe.entities.overview import Overview
 from kiali_qe.utils.date import parse_from_ui
-from wait_for import wait_for
+from wait_for import wait_for, TimedOutError
 from kiali_qe.utils import (
     get_validation,
     to_linear_string,
     get_texts_of_elements
 )
 
+# Evaluates XPath queries on each item of a list in one round trip.
+# arguments[0]: root element or null for the document, arguments[1]: {items: xpath of items,
+#   texts: {key: xpath}, counts: {key: xpath}, lists: {key: xpath}}
+# returns list of {texts: {key: text of first match or null},
+#   counts: {key: number of matches}, lists: {key: texts of all matches}}
+ITEMS_DATA_SCRIPT = """
+var root = arguments[0] || document, query = arguments[1];
+function evaluate(xpath, context, type) {
+    return document.evaluate(xpath, context, null, type, null);
+}
+function text(node) {
+    return (node.innerText || node.textContent || '').trim();
+}
+var items = evaluate(query.items, root, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE);
+var result = [];
+for (var i = 0; i < items.snapshotLength; i++) {
+    var item = items.snapshotItem(i);
+    var data = {texts: {}, counts: {}, lists: {}};
+    for (var key in query.texts) {
+        var node = evaluate(query.texts[key], item,
+                            XPathResult.FIRST_ORDERED_NODE_TYPE).singleNodeValue;
+        data.texts[key] = node ? text(node) : null;
+    }
+    for (var key in query.counts) {
+        data.counts[key] = evaluate('count(' + query.counts[key] + ')', item,
+                                    XPathResult.NUMBER_TYPE).numberValue;
+    }
+    for (var key in query.lists) {
+        var nodes = evaluate(query.lists[key], item, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE);
+        data.lists[key] = [];
+        for (var j = 0; j < nodes.snapshotLength; j++) {
+            data.lists[key].push(text(nodes.snapshotItem(j)));
+        }
+    }
+    result.push(data);
+}
+return result;
+"""
+
+
+# Reads and sets the checkboxes of a popover in one round trip.
+# arguments[0]: root element, arguments[1]: {inputs: xpath of checkboxes,
+#   name: xpath of the item name relative to the checkbox, checked: names to check or null}
+# with checked, clicks the checkboxes whose state differs, other names are unchecked
+# returns list of [name, checked] of all the items
+CHECKBOX_STATES_SCRIPT = """
+var root = arguments[0], query = arguments[1];
+function items() {
+    var inputs = document.evaluate(query.inputs, root, null,
+                                   XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var result = [];
+    for (var i = 0; i < inputs.snapshotLength; i++) {
+        var input = inputs.snapshotItem(i);
+        var node = document.evaluate(query.name, input, null,
+                                     XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        var name = node ? (node.innerText || node.textContent || '') : '';
+        result.push({name: name.replace(/\\s+/g, ' ').trim(), input: input});
+    }
+    return result;
+}
+if (query.checked !== null) {
+    items().map(function (item) { return item.name; }).forEach(function (name) {
+        // the list can be rendered again after a click, the item is looked up again
+        var item = items().filter(function (item) { return item.name === name; })[0];
+        if (item && item.input.checked !== (query.checked.indexOf(name) >= 0)) {
+            item.input.click();
+        }
+    });
+}
+return items().map(function (item) { return [item.name, item.input.checked]; });
+"""
+
+
+# Waits until the page is idle: no pending XHR / fetch request, no DOM mutation
+# during the quiet period and the optional XPath conditions are met.
+# The observer and the request counter are installed once per page load.
+# arguments[0]: {timeout: ms, quiet: ms, absent: xpath or null, present: xpath or null}
+# returns true when the page is idle, false on timeout
+PAGE_IDLE_SCRIPT = """
+var options = arguments[0], done = arguments[arguments.length - 1];
+var state = window.__kialiQeIdle;
+if (!state) {
+    state = window.__kialiQeIdle = {pending: 0, last: Date.now(), listeners: []};
+    var notify = function () {
+        state.last = Date.now();
+        state.listeners.slice().forEach(function (listener) { listener(); });
+    };
+    var finished = function () {
+        state.pending--;
+        notify();
+    };
+    new MutationObserver(notify).observe(document, {
+        childList: true, subtree: true, attributes: true, characterData: true});
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        state.pending++;
+        try {
+            this.addEventListener('loadend', finished);
+            return send.apply(this, arguments);
+        } catch (error) {
+            this.removeEventListener('loadend', finished);
+            state.pending--;
+            throw error;
+        }
+    };
+    if (window.fetch) {
+        var fetch = window.fetch;
+        window.fetch = function () {
+            state.pending++;
+            return fetch.apply(this, arguments).then(
+                function (response) { finished(); return response; },
+                function (error) { finished(); throw error; });
+        };
+    }
+}
+function count(xpath) {
+    return document.evaluate('count(' + xpath + ')', document, null,
+                             XPathResult.NUMBER_TYPE, null).numberValue;
+}
+var timer = null, deadline = null, completed = false;
+function complete(result) {
+    if (completed) {
+        return;
+    }
+    completed = true;
+    clearTimeout(timer);
+    clearTimeout(deadline);
+    state.listeners.splice(state.listeners.indexOf(check), 1);
+    done(result);
+}
+function check() {
+    clearTimeout(timer);
+    if (state.pending > 0) {
+        return;
+    }
+    var elapsed = Date.now() - state.last;
+    if (elapsed < options.quiet) {
+        timer = setTimeout(check, options.quiet - elapsed);
+        return;
+    }
+    if ((options.absent && count(options.absent) > 0) ||
+            (options.present && count(options.present) === 0)) {
+        return;
+    }
+    complete(true);
+}
+state.listeners.push(check);
+deadline = setTimeout(function () { complete(false); }, options.timeout);
+check();
+"""
+# DOM has to be unchanged for this period (milliseconds) to be idle
+PAGE_IDLE_QUIET = 100
+# key and value of a label pair, relative to the pair
+LABEL_KEY = './/*[contains(@class, "label-key")]'
+LABEL_VALUE = './/*[contains(@class, "label-value")]'
+# the condition of wait_until is checked at least once per this period (seconds)
+PAGE_IDLE_SLICE = 1
+SPINNER = '//*[contains(@class, " spinner ")]'
+NAVBAR_SPINNER = '//*[contains(@class, "navbar")]' + SPINNER
+
+
+def items_data(browser, items, root=None, texts={}, counts={}, lists={}):
+    """Returns data of the items in one script call, see ITEMS_DATA_SCRIPT.
+    Texts are innerText of the live page, as the text of WebElement.
+    Args:
+        browser: widgetastic browser
+        items: XPath of the items, relative to root
+        root: element or widget, the document when None
+        texts, counts, lists: key: XPath relative to the item
+    """
+    return browser.execute_script(
+        ITEMS_DATA_SCRIPT, root,
+        {'items': items, 'texts': texts, 'counts': counts, 'lists': lists})
+
+
+def _timeout_seconds(timeout):
+    if isinstance(timeout, str):
+        _value, _unit = re.match(r'\s*([\d.]+)\s*(ms|s|m)?\s*$', timeout).groups()
+        return float(_value) * {'ms': 0.001, 's': 1, 'm': 60}.get(_unit, 1)
+    return float(timeout)
+
+
+def wait_page_idle(browser, timeout='10s', absent=None, present=None):
+    """Returns True when the page became idle, False on timeout,
+    None when the browser can not run the idle script.
+    Blocks on one asynchronous script call instead of polling.
+    Args:
+        browser: widgetastic browser
+        timeout: maximum time to wait
+        absent: XPath which has to match no element
+        present: XPath which has to match an element
+    """
+    try:
+        return browser.selenium.execute_async_script(
+            PAGE_IDLE_SCRIPT,
+            {'timeout': int(_timeout_seconds(timeout) * 1000),
+             'quiet': PAGE_IDLE_QUIET,
+             'absent': absent,
+             'present': present})
+    except WebDriverException as e:
+        browser.logger.debug('Page idle script failed: %s', e)
+        return None
+
+
+def wait_until(browser, condition, timeout='10s', very_quiet=True, silent_failure=True,
+               absent=None, present=None):
+    """Waits until the condition returns True, the whole wait takes at most timeout.
+    The condition is checked between idle waits of at most PAGE_IDLE_SLICE seconds,
+    so it is seen on a page which never gets idle. Polling is used when the page is idle
+    but the condition is not met yet or when the idle script is not supported.
+    Args:
+        browser: widgetastic browser
+        condition: function without arguments
+        timeout: maximum time to wait
+        very_quiet, silent_failure: as in wait_for
+        absent, present: XPath conditions of the idle page, see wait_page_idle
+    """
+    _deadline = time.time() + _timeout_seconds(timeout)
+    while True:
+        if condition():
+            return True
+        _remaining = _deadline - time.time()
+        if _remaining <= 0:
+            break
+        _idle = wait_page_idle(browser, timeout=min(_remaining, PAGE_IDLE_SLICE),
+                               absent=absent, present=present)
+        if _idle is not False:
+            time.sleep(max(min(0.2, _deadline - time.time()), 0))
+    if not very_quiet:
+        browser.logger.debug('Condition was not met in %s', timeout)
+    if not silent_failure:
+        raise TimedOutError('Condition was not met in {}'.format(timeout))
+    return False
+
 
 def wait_displayed(obj, timeout='10s'):
-    wait_for(
-        lambda: obj.is_displayed, timeout=timeout,
-        delay=0.2, very_quiet=True, silent_failure=True)
+    wait_until(obj.browser, lambda: obj.is_displayed, timeout=timeout)
 
 
 def wait_not_displayed(obj, timeout='10s'):
-    wait_for(
-        lambda: not obj.is_displayed, timeout=timeout,
-        delay=0.2, very_quiet=True, silent_failure=True)
+    wait_until(obj.browser, lambda: not obj.is_displayed, timeout=timeout)
 
 
 def wait_to_spinner_disappear(browser, timeout='5s', very_quiet=True, silent_failure=True):
-    def _is_disappeared(browser):
-        return len(browser.elements(locator='//*[contains(@class, " spinner ")]',
-                                    parent='//*[contains(@class, "navbar")]')) == 0
-    wait_for(
-        _is_disappeared, func_args=[browser], timeout=timeout,
-        delay=0.2, very_quiet=very_quiet, silent_failure=silent_failure)
+    def _is_disappeared():
+        return len(browser.elements(locator=NAVBAR_SPINNER)) == 0
+    wait_until(
+        browser, _is_disappeared, timeout=timeout,
+        very_quiet=very_quiet, silent_failure=silent_failure, absent=NAVBAR_SPINNER)
 
 
 class Button(Widget):
@@ -673,6 +909,9 @@ class CheckBoxFilter(Widget):
     ROOT = ('//*[@role="tooltip" and contains(@class, "popover")]'
             '//*[contains(@class, "popover-content")]')
     CB_ITEMS = './/label/input[@type="checkbox"]/..'
+    CB_INPUTS = './/label/input[@type="checkbox"]'
+    # name of the item, relative to its checkbox
+    CB_NAME = '..'
     ITEM = './/label/span[normalize-space(text())="{}"]/../input'
     RB_ITEMS = './/label/input[@type="radio"]/..'
     DROP_DOWN = '//*[contains(@class, "dropdown")]/*[@id="{}"]/..'
@@ -704,20 +943,23 @@ class CheckBoxFilter(Widget):
 
             def _is_closed():
                 return not self.is_displayed
-            wait_for(_is_closed, timeout='3s', delay=0.2, very_quiet=True, silent_failure=True)
+            wait_until(self.browser, _is_closed, timeout='3s')
 
     @property
     def layout(self):
         self.open()
         return DropDown(parent=self, locator=self.DROP_DOWN.format('graph_filter_layout'))
 
+    def _cb_items(self):
+        return [
+            self.browser.text(el)
+            for el in self.browser.elements(parent=self, locator=self.CB_ITEMS)]
+
     @property
     def items(self):
         self.open()
         try:
-            return [
-                self.browser.text(el)
-                for el in self.browser.elements(parent=self, locator=self.CB_ITEMS)]
+            return self._cb_items()
         finally:
             self.close()
 
@@ -751,30 +993,68 @@ class CheckBoxFilter(Widget):
         self._cb_action(filter_name, 'fill', False)
 
     def uncheck_all(self):
-        _items = self.items
-        self.open()
-        for _cb_item in _items:
-            self._cb_action(_cb_item, 'fill', False, skipOpen=True)
-        self.close()
+        self.set_checked([])
 
     def is_checked(self, filter_name, skipOpen=False):
         return self._cb_action(filter_name, 'read', skipOpen=skipOpen)
 
+    def _cb_states(self, checked=None):
+        """
+        Returns list of (name, checked) of all the items in one script call,
+        see CHECKBOX_STATES_SCRIPT. None when the script fails, then items are set one by one.
+        """
+        try:
+            return [(_name, _checked) for _name, _checked in self.browser.execute_script(
+                CHECKBOX_STATES_SCRIPT, self.browser.element(self),
+                {'inputs': self.CB_INPUTS, 'name': self.CB_NAME, 'checked': checked})]
+        except WebDriverException as ex:
+            self.logger.warning('Checkboxes by script failed, using elements: %s', ex)
+            return None
+
+    def read_all_states(self):
+        """
+        Returns list of (name, checked) of all the items, the popover is opened once
+        """
+        self.open()
+        try:
+            _states = self._cb_states()
+            if _states is None:
+                _states = [(_cb_item, self.is_checked(_cb_item, skipOpen=True))
+                           for _cb_item in self._cb_items()]
+            return _states
+        finally:
+            self.close()
+
+    def set_checked(self, names):
+        """
+        Checks the supplied items and unchecks all the other items, the popover is opened once
+        Returns list of (name, checked) of all the items
+        Args:
+            names: list of item names to be checked
+        """
+        self.open()
+        try:
+            _states = self._cb_states(checked=list(names))
+            if _states is None:
+                for _cb_item in self._cb_items():
+                    self._cb_action(_cb_item, 'fill', _cb_item in names, skipOpen=True)
+                _states = [(_cb_item, self.is_checked(_cb_item, skipOpen=True))
+                           for _cb_item in self._cb_items()]
+            wait_to_spinner_disappear(self.browser)
+            return _states
+        finally:
+            self.close()
+
     @property
     def checked_items(self):
-        _items = self.items
-        checked_items = []
-        self.open()
-        for _cb_item in _items:
-            if self.is_checked(_cb_item, skipOpen=True):
-                checked_items.append(_cb_item)
-        self.close()
-        return checked_items
+        return [_cb_item for _cb_item, _checked in self.read_all_states() if _checked]
 
 
 class NamespaceFilter(CheckBoxFilter):
     ROOT = ('//*[@id="namespace-list-layers-popover"]')
     CB_ITEMS = './/input[@type="checkbox"]/../span'
+    CB_INPUTS = './/input[@type="checkbox"]'
+    CB_NAME = '../span'
     ITEM = './/span[normalize-space(text())="{}"]/../input'
 
     def __init__(self, parent, locator=None, logger=None):
@@ -813,6 +1093,9 @@ class Pagination(Widget):
     LAST_PAGE = './/*[@title="Last Page"]'
     NEXT_PAGE = './/*[@title="Next Page"]'
     PREVIOUS_PAGE = './/*[@title="Previous Page"]'
+    # query parameters of the list page URL, the page size is not limited to the dropdown options
+    URL_PAGE = 'page'
+    URL_PER_PAGE = 'perPage'
 
     def __init__(self, parent, locator=None, logger=None):
         Widget.__init__(self, parent, logger=logger)
@@ -860,13 +1143,19 @@ class Pagination(Widget):
             self.browser.send_keys(Keys.ENTER, self._page_input)
         wait_to_spinner_disappear(self.browser)
 
+    def _totals(self):
+        # total items and pages in one round trip
+        wait_displayed(self)
+        return items_data(self.browser, '.', root=self,
+                          texts={'items': self.TOTAL_ITEMS, 'pages': self.TOTAL_PAGES})[0]['texts']
+
     @property
     def total_items(self):
-        return int(self.browser.text(self._element(locator=self.TOTAL_ITEMS)))
+        return int(self._totals()['items'])
 
     @property
     def total_pages(self):
-        return int(self.browser.text(self._element(locator=self.TOTAL_PAGES)))
+        return int(self._totals()['pages'])
 
     @property
     def _dropdown_per_page(self):
@@ -878,7 +1167,38 @@ class Pagination(Widget):
         return int(self._dropdown_per_page.selected)
 
     def set_items_per_page(self, items):
+        # pagination is at the bottom of the page, options of the dropdown open below it.
+        # scroll to the bottom, so the options get the focus
+        self.browser.execute_script('window.scrollTo(0, document.body.scrollHeight);')
         self._dropdown_per_page.select(items)
+        wait_to_spinner_disappear(self.browser)
+
+    def show_all_items(self):
+        """
+        Shows all the items on one page, the list is loaded again with the page size
+        in the URL. Returns True when all the items are on the current page,
+        False when the UI did not apply the page size of the URL.
+        """
+        _totals = self._totals()
+        if int(_totals['pages']) <= 1:
+            return True
+        _url = urlsplit(self.browser.url)
+        _params = {self.URL_PAGE: '1', self.URL_PER_PAGE: _totals['items']}
+        _query = [(_key, _value) for _key, _value in parse_qsl(_url.query)
+                  if _key not in _params] + sorted(_params.items())
+        self.browser.url = urlunsplit(_url._replace(query=urlencode(_query)))
+        wait_to_spinner_disappear(self.browser)
+        return int(self._totals()['pages']) <= 1
+
+    def set_max_items_per_page(self):
+        """
+        Selects the largest items per page option of the dropdown,
+        at most PaginationPerPage.FIFTEEN items.
+        """
+        _options = self.items_per_page_options
+        if len(_options) == 0:
+            _options = [_item.value for _item in PaginationPerPage]
+        self.set_items_per_page(max(_options))
 
     @property
     def items_per_page_options(self):
@@ -966,6 +1286,7 @@ class MainMenu(Widget):
     ROOT = ('//*[contains(@class, "pf-c-page__sidebar")]')
     MENU_ITEMS = './/*[contains(@class, "pf-c-nav__link")]/..'
     MENU_ITEM = './/*[contains(@class, "pf-c-nav__link") and text()="{}"]/..'
+    MENU_LINK = './/*[contains(@class, "pf-c-nav__link") and text()="{}"]'
     MENU_ITEM_ACTIVE = ('.//*[contains(@class, "pf-m-current")'
                         ' and contains(@class, "pf-c-nav__link")]/..')
 
@@ -976,6 +1297,10 @@ class MainMenu(Widget):
     def select(self, menu):
         self.browser.click(self.browser.element(self.MENU_ITEM.format(menu), parent=self))
 
+    def link(self, menu):
+        return self.browser.get_attribute(
+            'href', self.browser.element(self.MENU_LINK.format(menu), parent=self))
+
     @property
     def selected(self):
         return self.browser.text(self.browser.element(self.MENU_ITEM_ACTIVE, parent=self))
@@ -1028,6 +1353,7 @@ class ListViewAbstract(Widget):
     DIALOG_ROOT = '//*[@role="dialog"]'
     ITEMS = './/*[contains(@class, "list-group-item")]//*[contains(@class, "list-view-pf-body")]'
     ITEM_TEXT = './/*[contains(@class, "list-group-item-heading")]'
+    ITEM_NAMESPACE = ITEM_TEXT + '//small'
     SELECT_ITEM = ITEMS + '//*[text()="{}"]'
     SELECT_ITEM_WITH_NAMESPACE = SELECT_ITEM + '/small[text()="{}"]'
     OBJECT_TYPE = './/*[contains(@class, "list-group-item-text")]//td'
@@ -1053,6 +1379,23 @@ class ListViewAbstract(Widget):
     HEALTH = 'strong[normalize-space(text()="{}:")]/../'.format(HEALTH_TEXT)
     CONFIG_TEXT = "Config"
     CONFIG = 'strong[normalize-space(text()="{}:")]/..//'.format(CONFIG_TEXT)
+    ITEM_HEALTH = {
+        'healthy': './/{}*[contains(@class, "pficon-ok")]'.format(HEALTH),
+        'not_healthy': './/{}*[contains(@class, "pficon-error-circle-o")]'.format(HEALTH),
+        'degraded': './/{}*[contains(@class, "pficon-warning-triangle-o")]'.format(HEALTH),
+        'not_available': './/{}*[text()="N/A"]'.format(HEALTH)
+    }
+    ITEM_VALIDATION = {
+        'valid': './/{}*[contains(@class, "pficon-ok")]'.format(CONFIG),
+        'not_valid': './/{}*[contains(@class, "pficon-error-circle-o")]'.format(CONFIG),
+        'warning': './/{}*[contains(@class, "pficon-warning-triangle-o")]'.format(CONFIG)
+    }
+    ITEM_LABEL_KEYS = ('.//strong[normalize-space(text())="Label Validation :"]'
+                       '/../*[contains(@class, "badge")]')
+    NAMESPACE_TLS_PARTIAL = ('.//*[contains(@class, "card-pf-title")]'
+                             '//img[contains(@src, "mtls-status-partial-dark")]')
+    NAMESPACE_TLS_FULL = ('.//*[contains(@class, "card-pf-title")]'
+                          '//img[contains(@src, "mtls-status-full-dark")]')
 
     def __init__(self, parent, locator=None, logger=None):
         Widget.__init__(self, parent, logger=logger)
@@ -1062,6 +1405,62 @@ class ListViewAbstract(Widget):
             self.locator = self.ROOT
         self._pagination = Pagination(parent=self.parent)
 
+    def _items_data(self, texts={}, counts={}, lists={}):
+        """
+        Returns data of all the items of the page in one script call,
+        see ITEMS_DATA_SCRIPT. None when the script fails, then items are read element by element.
+        """
+        try:
+            return items_data(self.browser, self.ITEMS, root=self,
+                              texts=texts, counts=counts, lists=lists)
+        except WebDriverException as ex:
+            self.logger.warning('Reading items by script failed, reading by elements: %s', ex)
+            return None
+
+    def _parse_heading(self, text, namespace=None, count=2):
+        """
+        Returns list of name, namespace and the count - 2 following lines of the item heading.
+        The namespace line is found by the namespace text when given, other lines are skipped.
+        Raises ValueError with the heading text when the heading has less lines.
+        """
+        _lines = [_line.strip() for _line in (text or '').split('\n') if _line.strip()]
+        _namespace = (namespace or '').strip()
+        _index = _lines.index(_namespace, 1) if _namespace in _lines[1:] else 1
+        _values = _lines[:1] + _lines[_index:_index + count - 1]
+        if len(_values) < count:
+            raise ValueError('Item heading {} has less than {} lines of name, namespace{}'.format(
+                repr(text), count, ' and type' if count > 2 else ''))
+        return _values
+
+    def _item_heading(self, element, count=2):
+        return self._parse_heading(
+            self.browser.element(locator=self.ITEM_TEXT, parent=element).text,
+            namespace=self.browser.text_or_default(
+                self.ITEM_NAMESPACE, default=None, parent=element),
+            count=count)
+
+    def _to_health(self, healthy, not_healthy, degraded, not_available):
+        _health = None
+        if healthy:
+            _health = HealthType.HEALTHY
+        elif not_healthy:
+            _health = HealthType.FAILURE
+        elif degraded:
+            _health = HealthType.DEGRADED
+        elif not_available:
+            _health = HealthType.NA
+        return _health
+
+    def _data_health(self, data):
+        _counts = data['counts']
+        return self._to_health(*[_counts[_key] > 0 for _key in
+                                 ['healthy', 'not_healthy', 'degraded', 'not_available']])
+
+    def _data_validation(self, data):
+        _counts = data['counts']
+        return get_validation(*[_counts[_key] > 0 for _key in
+                                ['valid', 'not_valid', 'warning']])
+
     def __locator__(self):
         return self.locator
 
@@ -1129,42 +1528,14 @@ class ListViewAbstract(Widget):
         return _health
 
     def _get_item_health(self, element):
-        _healthy = len(self.browser.elements(
-            parent=element,
-            locator='.//{}*[contains(@class, "pficon-ok")]'.format(self.HEALTH))) > 0
-        _not_healthy = len(self.browser.elements(
-            parent=element,
-            locator='.//{}*[contains(@class, "pficon-error-circle-o")]'.format(self.HEALTH))) > 0
-        _degraded = len(self.browser.elements(
-            parent=element,
-            locator='.//{}*[contains(@class, "pficon-warning-triangle-o")]'
-                    .format(self.HEALTH))) > 0
-        _not_available = len(self.browser.elements(
-            parent=element,
-            locator='.//{}*[text()="N/A"]'.format(self.HEALTH))) > 0
-        _health = None
-        if _healthy:
-            _health = HealthType.HEALTHY
-        elif _not_healthy:
-            _health = HealthType.FAILURE
-        elif _degraded:
-            _health = HealthType.DEGRADED
-        elif _not_available:
-            _health = HealthType.NA
-        return _health
+        return self._to_health(*[
+            len(self.browser.elements(parent=element, locator=self.ITEM_HEALTH[_key])) > 0
+            for _key in ['healthy', 'not_healthy', 'degraded', 'not_available']])
 
     def _get_item_validation(self, element):
-        _valid = len(self.browser.elements(
-            parent=element,
-            locator='.//{}*[contains(@class, "pficon-ok")]'.format(self.CONFIG))) > 0
-        _not_valid = len(self.browser.elements(
-            parent=element,
-            locator='.//{}*[contains(@class, "pficon-error-circle-o")]'.format(self.CONFIG))) > 0
-        _warning = len(self.browser.elements(
-            parent=element,
-            locator='.//{}*[contains(@class, "pficon-warning-triangle-o")]'
-                    .format(self.CONFIG))) > 0
-        return get_validation(_valid, _not_valid, _warning)
+        return get_validation(*[
+            len(self.browser.elements(parent=element, locator=self.ITEM_VALIDATION[_key])) > 0
+            for _key in ['valid', 'not_valid', 'warning']])
 
     def _get_details_validation(self):
         _not_valid = len(self.browser.elements(
@@ -1181,15 +1552,14 @@ class ListViewAbstract(Widget):
             return IstioConfigValidation.VALID
 
     def _get_item_label_keys(self, element):
-        _label_keys = []
-        _labels = self.browser.elements(
-            parent=element,
-            locator='.//strong[normalize-space(text())="Label Validation :"]\
-                /../*[contains(@class, "badge")]')
-        if _labels:
-            for _label in _labels:
-                _label_keys.append(_label.text)
-        return _label_keys
+        return items_data(self.browser, '.', root=element,
+                          lists={'label_keys': self.ITEM_LABEL_KEYS})[0]['lists']['label_keys']
+
+    def _get_label_pairs(self, locator):
+        """ Returns dict of label key: value of the label pairs matching the locator """
+        return dict([(_data['texts']['key'], _data['texts']['value']) for _data in items_data(
+            self.browser, locator,
+            texts={'key': LABEL_KEY, 'value': LABEL_VALUE})])
 
     def _get_details_labels(self):
         _label_dict = {}
@@ -1200,19 +1570,9 @@ class ListViewAbstract(Widget):
         except NoSuchElementException:
             pass
         wait_displayed(self)
-        _labels = self.browser.elements(
-            parent=self.DETAILS_ROOT,
-            locator='.//strong[contains(text(), "Labels")]\
-                /../../../div[@id="labels"]//*[contains(@class, "label-pair")]')
-        if _labels:
-            for _label in _labels:
-                _label_key = self.browser.element(
-                    parent=_label,
-                    locator='.//*[contains(@class, "label-key")]').text
-                _label_value = self.browser.element(
-                    parent=_label,
-                    locator='.//*[contains(@class, "label-value")]').text
-                _label_dict[_label_key] = _label_value
+        _label_dict.update(self._get_label_pairs(
+            '//strong[contains(text(), "Labels")]'
+            '/../../../div[@id="labels"]//*[contains(@class, "label-pair")]'))
         return _label_dict
 
     def _get_details_selectors(self):
@@ -1224,19 +1584,9 @@ class ListViewAbstract(Widget):
         except NoSuchElementException:
             pass
         wait_displayed(self)
-        _selectors = self.browser.elements(
-            parent=self.DETAILS_ROOT,
-            locator='.//strong[contains(text(), "Selectors")]\
-                /../../../div[@id="selectors"]//*[contains(@class, "label-pair")]')
-        if _selectors:
-            for _selector in _selectors:
-                _label_key = self.browser.element(
-                    parent=_selector,
-                    locator='.//*[contains(@class, "label-key")]').text
-                _label_value = self.browser.element(
-                    parent=_selector,
-                    locator='.//*[contains(@class, "label-value")]').text
-                _selector_dict[_label_key] = _label_value
+        _selector_dict.update(self._get_label_pairs(
+            '//strong[contains(text(), "Selectors")]'
+            '/../../../div[@id="selectors"]//*[contains(@class, "label-pair")]'))
         return _selector_dict
 
     def get_mesh_wide_tls(self):
@@ -1261,30 +1611,36 @@ class ListViewAbstract(Widget):
     def get_namespace_wide_tls(self, element):
         _partial = len(self.browser.elements(
             parent=element,
-            locator='.//*[contains(@class, "card-pf-title")]'
-            '//img[contains(@src, "mtls-status-partial-dark")]')) > 0
+            locator=self.NAMESPACE_TLS_PARTIAL)) > 0
         _full = len(self.browser.elements(
             parent=element,
-            locator='.//*[contains(@class, "card-pf-title")]'
-            '//img[contains(@src, "mtls-status-full-dark")]')) > 0
-        if _full:
+            locator=self.NAMESPACE_TLS_FULL)) > 0
+        return self._to_tls_type(_partial, _full)
+
+    def _to_tls_type(self, partial, full):
+        if full:
             return MeshWideTLSType.ENABLED
-        elif _partial:
+        elif partial:
             return MeshWideTLSType.PARTLY_ENABLED
         else:
             return MeshWideTLSType.DISABLED
 
     @property
     def all_items(self):
+        """
+        Returns the items of all the pages.
+        All the items are read from one page, see Pagination.show_all_items. When the UI
+        does not apply it, the pages are read one by one with the largest page size.
+        """
+        if self._pagination.show_all_items():
+            return self.items
         items = []
+        # set per page to maximum size, so there are less pages to read
+        self._pagination.set_max_items_per_page()
         self._pagination.move_to_first_page()
-        # set per page to maximum size
-        # TODO: set to maximum size. right now problem with focus,
-        # hence setting it to minimum size
-        self._pagination.set_items_per_page(5)
         for _page in range(1, self._pagination.total_pages + 1):
-            self._pagination.move_to_page(_page)
-            wait_to_spinner_disappear(self.browser)
+            if _page > 1:
+                self._pagination.move_to_next_page()
             items.extend(self.items)
         return items
 
@@ -1305,46 +1661,83 @@ class ListViewOverview(ListViewAbstract):
 
     @property
     def items(self):
-        _items = []
         self.browser.click(self.browser.element(
             parent=self.ROOT,
             locator=('//button[text()="Compact"]')))
         wait_to_spinner_disappear(self.browser)
+        _items_data = self._items_data(
+            texts={'namespace': self.ITEM_TITLE,
+                   'item_text': self.ITEM_TEXT,
+                   'unhealthy': self.UNHEALTHY_TEXT,
+                   'degraded': self.DEGRADED_TEXT,
+                   'healthy': self.HEALTHY_TEXT},
+            counts={'tls_partial': self.NAMESPACE_TLS_PARTIAL,
+                    'tls_full': self.NAMESPACE_TLS_FULL})
+        if _items_data is None:
+            return self._element_items
         _overview_type = self.browser.element(
                 locator=self.OVERVIEW_TYPE, parent=self.ROOT).text
-        for el in self.browser.elements(self.ITEMS, parent=self):
-            _namespace = self.browser.element(
-                locator=self.ITEM_TITLE, parent=el).text
-            _item_numbers = int(re.search(r'\d+', self.browser.element(
-                locator=self.ITEM_TEXT, parent=el).text).group())
-            _unhealthy = 0
-            _healthy = 0
-            _degraded = 0
-            # update health
-            if len(self.browser.elements(
-                    parent=el, locator=self.UNHEALTHY_TEXT)) > 0:
-                _unhealthy = int(self.browser.element(
-                    locator=self.UNHEALTHY_TEXT, parent=el).text)
-            if len(self.browser.elements(
-                    parent=el, locator=self.DEGRADED_TEXT)) > 0:
-                _degraded = int(self.browser.element(
-                    locator=self.DEGRADED_TEXT, parent=el).text)
-            if len(self.browser.elements(
-                    parent=el, locator=self.HEALTHY_TEXT)) > 0:
-                _healthy = int(self.browser.element(
-                    locator=self.HEALTHY_TEXT, parent=el).text)
+        _items = []
+        for _data in _items_data:
+            _texts = _data['texts']
+            _item_numbers = int(re.search(r'\d+', _texts['item_text']).group())
+            # health texts are missing when there is no item with that health
+            _unhealthy = int(_texts['unhealthy']) if _texts['unhealthy'] else 0
+            _degraded = int(_texts['degraded']) if _texts['degraded'] else 0
+            _healthy = int(_texts['healthy']) if _texts['healthy'] else 0
             # overview object creation
-            _overview = Overview(
+            _items.append(Overview(
                 overview_type=_overview_type,
-                namespace=_namespace,
+                namespace=_texts['namespace'],
                 items=_item_numbers,
                 healthy=_healthy,
                 unhealthy=_unhealthy,
                 degraded=_degraded,
                 na=(_item_numbers - (_healthy + _unhealthy + _degraded)),
-                tls_type=self.get_namespace_wide_tls(el))
-            # append this item to the final list
-            _items.append(_overview)
+                tls_type=self._to_tls_type(_data['counts']['tls_partial'] > 0,
+                                           _data['counts']['tls_full'] > 0)))
+        return _items
+
+    @property
+    def _element_items(self):
+        _items = []
+        _overview_type = self.browser.element(
+                locator=self.OVERVIEW_TYPE, parent=self.ROOT).text
+        # counts and attributes of the items are read from one page source
+        with self.browser.snapshot():
+            for el in self.browser.elements(self.ITEMS, parent=self):
+                _namespace = self.browser.element(
+                    locator=self.ITEM_TITLE, parent=el).text
+                _item_numbers = int(re.search(r'\d+', self.browser.element(
+                    locator=self.ITEM_TEXT, parent=el).text).group())
+                _unhealthy = 0
+                _healthy = 0
+                _degraded = 0
+                # update health
+                if len(self.browser.elements(
+                        parent=el, locator=self.UNHEALTHY_TEXT)) > 0:
+                    _unhealthy = int(self.browser.element(
+                        locator=self.UNHEALTHY_TEXT, parent=el).text)
+                if len(self.browser.elements(
+                        parent=el, locator=self.DEGRADED_TEXT)) > 0:
+                    _degraded = int(self.browser.element(
+                        locator=self.DEGRADED_TEXT, parent=el).text)
+                if len(self.browser.elements(
+                        parent=el, locator=self.HEALTHY_TEXT)) > 0:
+                    _healthy = int(self.browser.element(
+                        locator=self.HEALTHY_TEXT, parent=el).text)
+                # overview object creation
+                _overview = Overview(
+                    overview_type=_overview_type,
+                    namespace=_namespace,
+                    items=_item_numbers,
+                    healthy=_healthy,
+                    unhealthy=_unhealthy,
+                    degraded=_degraded,
+                    na=(_item_numbers - (_healthy + _unhealthy + _degraded)),
+                    tls_type=self.get_namespace_wide_tls(el))
+                # append this item to the final list
+                _items.append(_overview)
         return _items
 
 
@@ -1376,21 +1769,39 @@ class ListViewApplications(ListViewAbstract):
 
     @property
     def items(self):
+        _items_data = self._items_data(
+            texts={'text': self.ITEM_TEXT, 'namespace': self.ITEM_NAMESPACE},
+            counts=dict(self.ITEM_HEALTH, missing_sidecar=self.MISSING_SIDECAR))
+        if _items_data is None:
+            return self._element_items
         _items = []
-        for el in self.browser.elements(self.ITEMS, parent=self):
+        for _data in _items_data:
             # get application name and namespace
-            name, namespace = self.browser.element(
-                locator=self.ITEM_TEXT, parent=el).text.split('\n')
-            _name = name.strip()
-            _namespace = namespace.strip()
-            # TODO Error Rate
+            name, namespace = self._parse_heading(
+                _data['texts']['text'], namespace=_data['texts']['namespace'])
             # application object creation
-            _application = Application(
-                name=_name, namespace=_namespace,
-                istio_sidecar=self._item_sidecar(el),
-                health=self._get_item_health(element=el))
-            # append this item to the final list
-            _items.append(_application)
+            _items.append(Application(
+                name=name, namespace=namespace,
+                istio_sidecar=not _data['counts']['missing_sidecar'] > 0,
+                health=self._data_health(_data)))
+        return _items
+
+    @property
+    def _element_items(self):
+        _items = []
+        # counts and attributes of the items are read from one page source
+        with self.browser.snapshot():
+            for el in self.browser.elements(self.ITEMS, parent=self):
+                # get application name and namespace
+                _name, _namespace = self._item_heading(el)
+                # TODO Error Rate
+                # application object creation
+                _application = Application(
+                    name=_name, namespace=_namespace,
+                    istio_sidecar=self._item_sidecar(el),
+                    health=self._get_item_health(element=el))
+                # append this item to the final list
+                _items.append(_application)
         return _items
 
 
@@ -1439,24 +1850,45 @@ class ListViewWorkloads(ListViewAbstract):
 
     @property
     def items(self):
+        _items_data = self._items_data(
+            texts={'text': self.ITEM_TEXT, 'namespace': self.ITEM_NAMESPACE},
+            counts=dict(self.ITEM_HEALTH, missing_sidecar=self.MISSING_SIDECAR),
+            lists={'label_keys': self.ITEM_LABEL_KEYS})
+        if _items_data is None:
+            return self._element_items
         _items = []
-        for el in self.browser.elements(self.ITEMS, parent=self):
-            # get workload name and namespace
-            name, namespace, _type = self.browser.element(
-                locator=self.ITEM_TEXT, parent=el).text.split('\n')
-            _name = name.strip()
-            _namespace = namespace.strip()
-            _type = _type.strip()
-            _label_keys = self._get_item_label_keys(el)
+        for _data in _items_data:
+            # get workload name, namespace and type
+            name, namespace, _type = self._parse_heading(
+                _data['texts']['text'], namespace=_data['texts']['namespace'], count=3)
+            _label_keys = _data['lists']['label_keys']
             # workload object creation
-            _workload = Workload(
-                name=_name, namespace=_namespace, workload_type=_type,
-                istio_sidecar=self._item_sidecar(el),
+            _items.append(Workload(
+                name=name, namespace=namespace, workload_type=_type,
+                istio_sidecar=not _data['counts']['missing_sidecar'] > 0,
                 app_label='app' in _label_keys,
                 version_label='version' in _label_keys,
-                health=self._get_item_health(element=el))
-            # append this item to the final list
-            _items.append(_workload)
+                health=self._data_health(_data)))
+        return _items
+
+    @property
+    def _element_items(self):
+        _items = []
+        # counts and attributes of the items are read from one page source
+        with self.browser.snapshot():
+            for el in self.browser.elements(self.ITEMS, parent=self):
+                # get workload name, namespace and type
+                _name, _namespace, _type = self._item_heading(el, count=3)
+                _label_keys = self._get_item_label_keys(el)
+                # workload object creation
+                _workload = Workload(
+                    name=_name, namespace=_namespace, workload_type=_type,
+                    istio_sidecar=self._item_sidecar(el),
+                    app_label='app' in _label_keys,
+                    version_label='version' in _label_keys,
+                    health=self._get_item_health(element=el))
+                # append this item to the final list
+                _items.append(_workload)
         return _items
 
 
@@ -1509,22 +1941,41 @@ class ListViewServices(ListViewAbstract):
 
     @property
     def items(self):
+        _items_data = self._items_data(
+            texts={'text': self.ITEM_TEXT, 'namespace': self.ITEM_NAMESPACE},
+            counts=dict(self.ITEM_HEALTH, missing_sidecar=self.MISSING_SIDECAR))
+        if _items_data is None:
+            return self._element_items
         _items = []
-        for el in self.browser.elements(self.ITEMS, parent=self):
-            # get rule name and namespace
-            name, namespace = self.browser.element(
-                locator=self.ITEM_TEXT, parent=el).text.split('\n')
-            _name = name.strip()
-            _namespace = namespace.strip()
-
+        for _data in _items_data:
+            # get service name and namespace
+            name, namespace = self._parse_heading(
+                _data['texts']['text'], namespace=_data['texts']['namespace'])
             # create service instance
-            _service = Service(
-                name=_name,
-                namespace=_namespace,
-                istio_sidecar=self._item_sidecar(el),
-                health=self._get_item_health(element=el))
-            # append this item to the final list
-            _items.append(_service)
+            _items.append(Service(
+                name=name,
+                namespace=namespace,
+                istio_sidecar=not _data['counts']['missing_sidecar'] > 0,
+                health=self._data_health(_data)))
+        return _items
+
+    @property
+    def _element_items(self):
+        _items = []
+        # counts and attributes of the items are read from one page source
+        with self.browser.snapshot():
+            for el in self.browser.elements(self.ITEMS, parent=self):
+                # get service name and namespace
+                _name, _namespace = self._item_heading(el)
+
+                # create service instance
+                _service = Service(
+                    name=_name,
+                    namespace=_namespace,
+                    istio_sidecar=self._item_sidecar(el),
+                    health=self._get_item_health(element=el))
+                # append this item to the final list
+                _items.append(_service)
         return _items
 
     @property
@@ -1551,50 +2002,76 @@ class ListViewIstioConfig(ListViewAbstract):
         return IstioConfigDetails(name=name, _type=object_type, text=_text,
                                   validation=self._get_details_validation())
 
+    def _is_rule(self, object_type):
+        return str(object_type) == IstioConfigObjectType.RULE.text or \
+            '{}: '.format(IstioConfigObjectType.ADAPTER.text) in str(object_type) or \
+            '{}: '.format(IstioConfigObjectType.TEMPLATE.text) in str(object_type)
+
     @property
     def items(self):
+        _items_data = self._items_data(
+            texts={'text': self.ITEM_TEXT, 'namespace': self.ITEM_NAMESPACE,
+                   'object_type': self.OBJECT_TYPE},
+            counts=self.ITEM_VALIDATION)
+        if _items_data is None:
+            return self._element_items
         _items = []
-        for el in self.browser.elements(self.ITEMS, parent=self):
-            # get rule name and namespace
-            name, namespace = self.browser.element(
-                locator=self.ITEM_TEXT, parent=el).text.split('\n')
-            _name = name.strip()
-            _namespace = namespace.strip()
-            # disable handler and other features. UI changed
-            # _actions = []
-            # _match = None
-            # get handler
-            # _handler = self.browser.element(
-            #     locator=self.ACTION_HEADER.format('Handler'),
-            #     parent=el).text.split('Handler:', 1)[1].strip()
-            # # get instances
-            # _instances = self.browser.element(
-            #     locator=self.ACTION_HEADER.format('Instances'),
-            #     parent=el).text.split('Instances:', 1)[1].strip().split(',')
-            # _actions.append(Action(handler=_handler, instances=_instances))
-            # # get Match
-            # if 'Match:' in el.text:
-            #     match = self.browser.element(
-            #         locator=self.ACTION_HEADER.format('Match'),
-            #         parent=el).text.split('Match:', 1)[1].strip()
-            #     _match = match.strip()
-
-            # create istio config instance
-            _object_type = self.browser.text(
-                self.browser.element(locator=self.OBJECT_TYPE, parent=el))
-            if str(_object_type) == IstioConfigObjectType.RULE.text or \
-                    '{}: '.format(IstioConfigObjectType.ADAPTER.text) in str(_object_type) or \
-                    '{}: '.format(IstioConfigObjectType.TEMPLATE.text) in str(_object_type):
-                _rule = Rule(name=_name, namespace=_namespace, object_type=_object_type)
-                # append this item to the final list
-                _items.append(_rule)
+        for _data in _items_data:
+            # get config name and namespace
+            name, namespace = self._parse_heading(
+                _data['texts']['text'], namespace=_data['texts']['namespace'])
+            _object_type = _data['texts']['object_type']
+            if self._is_rule(_object_type):
+                _items.append(Rule(name=name, namespace=namespace,
+                                   object_type=_object_type))
             else:
-                _config = IstioConfig(name=_name,
-                                      namespace=_namespace,
-                                      object_type=_object_type,
-                                      validation=self._get_item_validation(el))
-                # append this item to the final list
-                _items.append(_config)
+                _items.append(IstioConfig(name=name,
+                                          namespace=namespace,
+                                          object_type=_object_type,
+                                          validation=self._data_validation(_data)))
+        return _items
+
+    @property
+    def _element_items(self):
+        _items = []
+        # counts and attributes of the items are read from one page source
+        with self.browser.snapshot():
+            for el in self.browser.elements(self.ITEMS, parent=self):
+                # get rule name and namespace
+                _name, _namespace = self._item_heading(el)
+                # disable handler and other features. UI changed
+                # _actions = []
+                # _match = None
+                # get handler
+                # _handler = self.browser.element(
+                #     locator=self.ACTION_HEADER.format('Handler'),
+                #     parent=el).text.split('Handler:', 1)[1].strip()
+                # # get instances
+                # _instances = self.browser.element(
+                #     locator=self.ACTION_HEADER.format('Instances'),
+                #     parent=el).text.split('Instances:', 1)[1].strip().split(',')
+                # _actions.append(Action(handler=_handler, instances=_instances))
+                # # get Match
+                # if 'Match:' in el.text:
+                #     match = self.browser.element(
+                #         locator=self.ACTION_HEADER.format('Match'),
+                #         parent=el).text.split('Match:', 1)[1].strip()
+                #     _match = match.strip()
+
+                # create istio config instance
+                _object_type = self.browser.text(
+                    self.browser.element(locator=self.OBJECT_TYPE, parent=el))
+                if self._is_rule(_object_type):
+                    _rule = Rule(name=_name, namespace=_namespace, object_type=_object_type)
+                    # append this item to the final list
+                    _items.append(_rule)
+                else:
+                    _config = IstioConfig(name=_name,
+                                          namespace=_namespace,
+                                          object_type=_object_type,
+                                          validation=self._get_item_validation(el))
+                    # append this item to the final list
+                    _items.append(_config)
         return _items
 
     def delete(self, name, namespace=None):
@@ -1629,6 +2106,12 @@ class TableViewAbstract(Widget):
     LABELS = 'Labels'
     TRAFFIC_POLICY = 'Traffic Policy'
     SUBSETS = 'Subsets'
+    LABEL_PAIR = '//*[contains(@class, "label-pair")]/'
+    STATUS = {
+        'valid': '//*[contains(@class, "pficon-ok")]',
+        'not_valid': '//*[contains(@class, "pficon-error-circle-o")]',
+        'warning': '//*[contains(@class, "pficon-warning-triangle-o")]'
+    }
 
     def __init__(self, parent, locator=None, logger=None):
         Widget.__init__(self, parent, logger=logger)
@@ -1640,6 +2123,43 @@ class TableViewAbstract(Widget):
     def __locator__(self):
         return self.locator
 
+    def _column(self, index):
+        """ Returns XPath of the column of a row, index starts from 0 """
+        return '(.//td)[{}]'.format(index + 1)
+
+    def _rows_data(self, rows, columns={}, status=None, labels=None, texts={}, counts={},
+                   lists={}):
+        """
+        Returns data of all the rows of the table in one script call, see items_data.
+        Args:
+            rows: XPath of the rows
+            columns: key: column index, text of the column is read as texts[key]
+            status: XPath relative to the row of the element with the status icons,
+                read by _data_status
+            labels: column index of the labels, read by _data_labels
+            texts, counts, lists: as in items_data
+        """
+        _texts = dict(texts)
+        _texts.update([(_key, self._column(_index)) for _key, _index in columns.items()])
+        _counts = dict(counts)
+        if status is not None:
+            _counts.update([(_key, status + _xpath) for _key, _xpath in self.STATUS.items()])
+        _lists = dict(lists)
+        if labels is not None:
+            _lists['label_keys'] = self._column(labels) + self.LABEL_PAIR + LABEL_KEY
+            _lists['label_values'] = self._column(labels) + self.LABEL_PAIR + LABEL_VALUE
+        return items_data(self.browser, rows, texts=_texts, counts=_counts, lists=_lists)
+
+    def _data_text(self, data, key):
+        return data['texts'][key] or ''
+
+    def _data_status(self, data):
+        _counts = data['counts']
+        return get_validation(*[_counts[_key] > 0 for _key in ['valid', 'not_valid', 'warning']])
+
+    def _data_labels(self, data):
+        return dict(zip(data['lists']['label_keys'], data['lists']['label_values']))
+
     def back_to_service_info(self, parent):
         # TODO find a better way after KIALI-2251
         self.browser.click('.//a[contains(@href, "/services/")]', parent)
@@ -1663,36 +2183,6 @@ class TableViewAbstract(Widget):
         else:
             return IstioConfigValidation.VALID
 
-    def _get_item_status(self, element):
-        wait_displayed(self)
-        _valid = len(self.browser.elements(
-            parent=element,
-            locator='.//*[contains(@class, "pficon-ok")]')) > 0
-        _not_valid = len(self.browser.elements(
-            parent=element,
-            locator='.//*[contains(@class, "pficon-error-circle-o")]')) > 0
-        _warning = len(self.browser.elements(
-            parent=element,
-            locator='.//*[contains(@class, "pficon-warning-triangle-o")]')) > 0
-        return get_validation(_valid, _not_valid, _warning)
-
-    def _get_labels(self, el):
-        _label_dict = {}
-        wait_displayed(self)
-        _labels = self.browser.elements(
-            parent=el,
-            locator='.//*[contains(@class, "label-pair")]')
-        if _labels:
-            for _label in _labels:
-                _label_key = self.browser.element(
-                    parent=_label,
-                    locator='.//*[contains(@class, "label-key")]').text
-                _label_value = self.browser.element(
-                    parent=_label,
-                    locator='.//*[contains(@class, "label-value")]').text
-                _label_dict[_label_key] = _label_value
-        return _label_dict
-
     @property
     def all_items(self):
         return self.items
@@ -1708,15 +2198,14 @@ class TableViewAppWorkloads(TableViewAbstract):
     def items(self):
 
         _items = []
-        for el in self.browser.elements(locator=self.ROWS,
-                                        parent=self.ROOT):
-            _values = self.browser.element(
-                locator=self.COLUMN, parent=el).text.split('\n')
+        for _data in self._rows_data(self.ROWS, texts={'text': self.COLUMN},
+                                     counts={'missing_sidecar': self.MISSING_SIDECAR}):
+            _values = self._data_text(_data, 'text').split('\n')
             # create Workload instance
             if _values[0] == 'WORKLOAD':
                 _workload = AppWorkload(
                     name=_values[1] if len(_values) >= 2 else '',
-                    istio_sidecar=self._item_sidecar(el))
+                    istio_sidecar=not _data['counts']['missing_sidecar'] > 0)
                 # append this item to the final list
                 _items.append(_workload)
         return _items
@@ -1732,10 +2221,8 @@ class TableViewAppServices(TableViewAbstract):
     def items(self):
 
         _items = []
-        for el in self.browser.elements(locator=self.ROWS,
-                                        parent=self.ROOT):
-            _values = self.browser.element(
-                locator=self.COLUMN, parent=el).text.split('\n')
+        for _data in self._rows_data(self.ROWS, texts={'text': self.COLUMN}):
+            _values = self._data_text(_data, 'text').split('\n')
             # create Service instance
             if _values[0] == 'SERVICE':
                 # append this item to the final list
@@ -1766,23 +2253,17 @@ class TableViewWorkloads(TableViewAbstract):
         self.open()
 
         _items = []
-        for el in self.browser.elements(locator=self.ROWS.format(
-            'service-tabs-pane-workloads'),
-                                        parent=self.ROOT):
-            _columns = list(self.browser.elements(locator=self.COLUMN, parent=el))
-
-            _name = _columns[0].text.strip()
-            _type = _columns[1].text.strip()
-            _created_at = _columns[3].text.strip()
-            _resource_version = _columns[4].text.strip()
-
+        for _data in self._rows_data(
+                self.ROWS.format('service-tabs-pane-workloads'),
+                columns={'name': 0, 'type': 1, 'created_at': 3, 'resource_version': 4},
+                labels=2):
             # workload object creation
             _workload = WorkloadDetails(
-                name=_name,
-                workload_type=_type,
-                labels=self._get_labels(_columns[2]),
-                created_at=parse_from_ui(_created_at),
-                resource_version=_resource_version)
+                name=self._data_text(_data, 'name'),
+                workload_type=self._data_text(_data, 'type'),
+                labels=self._data_labels(_data),
+                created_at=parse_from_ui(self._data_text(_data, 'created_at')),
+                resource_version=self._data_text(_data, 'resource_version'))
             # append this item to the final list
             _items.append(_workload)
         return _items
@@ -1816,18 +2297,13 @@ class TableViewSourceWorkloads(TableViewAbstract):
         self.open()
 
         _items = []
-        for el in self.browser.elements(locator=self.ROWS.format(
-            'service-tabs-pane-sources'),
-                                        parent=self.ROOT):
-            _to = self.browser.element(locator=self.DEST, parent=el).text.replace('To:', '').strip()
-            _columns = list(self.browser.elements(locator=self.COLUMN, parent=el))
-            _workloads = []
-            for _column in _columns:
-                _workloads.append(_column.text.strip())
+        for _data in self._rows_data(self.ROWS.format('service-tabs-pane-sources'),
+                                     texts={'to': self.DEST},
+                                     lists={'workloads': self.COLUMN}):
             # source workload object creation
             _workload = SourceWorkload(
-                to=_to,
-                workloads=_workloads)
+                to=self._data_text(_data, 'to').replace('To:', '').strip(),
+                workloads=_data['lists']['workloads'])
             # append this item to the final list
             _items.append(_workload)
         return _items
@@ -1914,20 +2390,16 @@ class TableViewVirtualServices(TableViewAbstract):
         self.open()
 
         _items = []
-        for el in self.browser.elements(locator=self.ROWS.format(
-            'service-tabs-pane-virtualservices'),
-                                        parent=self.ROOT):
-            _columns = list(self.browser.elements(locator=self.COLUMN, parent=el))
-
-            _name = _columns[1].text.strip()
-            _created_at = _columns[2].text.strip()
-            _resource_version = _columns[3].text.strip()
+        for _data in self._rows_data(
+                self.ROWS.format('service-tabs-pane-virtualservices'),
+                columns={'name': 1, 'created_at': 2, 'resource_version': 3},
+                status=self._column(0)):
             # create Virtual Service instance
             _virtual_service = VirtualService(
-                status=self._get_item_status(_columns[0]),
-                name=_name,
-                created_at=parse_from_ui(_created_at),
-                resource_version=_resource_version)
+                status=self._data_status(_data),
+                name=self._data_text(_data, 'name'),
+                created_at=parse_from_ui(self._data_text(_data, 'created_at')),
+                resource_version=self._data_text(_data, 'resource_version'))
             # append this item to the final list
             _items.append(_virtual_service)
         return _items
@@ -2005,24 +2477,20 @@ class TableViewDestinationRules(TableViewAbstract):
         self.open()
 
         _items = []
-        for el in self.browser.elements(locator=self.ROWS.format(
-                'service-tabs-pane-destinationrules'),
-                                        parent=self.ROOT):
-            _columns = list(self.browser.elements(locator=self.COLUMN, parent=el))
-
-            _name = _columns[1].text.strip()
-            _traffic_policy = _columns[2].text.strip()
-            _subsets = _columns[3].text.strip()
-            _host = _columns[4].text.strip()
-            _created_at = _columns[5].text.strip()
-            _resource_version = _columns[6].text.strip()
+        for _data in self._rows_data(
+                self.ROWS.format('service-tabs-pane-destinationrules'),
+                columns={'name': 1, 'traffic_policy': 2, 'subsets': 3, 'host': 4,
+                         'created_at': 5, 'resource_version': 6},
+                status=self._column(0)):
+            _traffic_policy = self._data_text(_data, 'traffic_policy')
+            _subsets = self._data_text(_data, 'subsets')
             # create Destination Rule instance
             _destination_rule = DestinationRule(
-                status=self._get_item_status(_columns[0]),
-                name=_name,
-                host=_host,
-                created_at=parse_from_ui(_created_at),
-                resource_version=_resource_version,
+                status=self._data_status(_data),
+                name=self._data_text(_data, 'name'),
+                host=self._data_text(_data, 'host'),
+                created_at=parse_from_ui(self._data_text(_data, 'created_at')),
+                resource_version=self._data_text(_data, 'resource_version'),
                 traffic_policy=to_linear_string(
                     _traffic_policy if _traffic_policy != 'None' else ''),
                 subsets=to_linear_string(_subsets if _subsets != 'None' else ''))
@@ -2054,27 +2522,20 @@ class TableViewWorkloadPods(TableViewAbstract):
         self.open()
 
         _items = []
-        for el in self.browser.elements(locator=self.ROWS.format(
-            'service-tabs-pane-pods'),
-                                        parent=self.ROOT):
-            _columns = list(self.browser.elements(locator=self.COLUMN, parent=el))
-
-            _name = _columns[1].text.strip()
-            _created_at = _columns[2].text.strip()
-            _created_by = _columns[3].text.strip()
-            _istio_init_containers = _columns[5].text.strip()
-            _istio_containers = _columns[6].text.strip()
-            _phase = _columns[7].text.strip()
-
+        for _data in self._rows_data(
+                self.ROWS.format('service-tabs-pane-pods'),
+                columns={'name': 1, 'created_at': 2, 'created_by': 3,
+                         'istio_init_containers': 5, 'istio_containers': 6, 'phase': 7},
+                status='.', labels=4):
             _items.append(WorkloadPod(
-                        name=str(_name),
-                        created_at=_created_at,
-                        created_by=_created_by,
-                        labels=self._get_labels(_columns[4]),
-                        istio_init_containers=_istio_init_containers,
-                        istio_containers=_istio_containers,
-                        status=self._get_item_status(el),
-                        phase=_phase))
+                        name=str(self._data_text(_data, 'name')),
+                        created_at=self._data_text(_data, 'created_at'),
+                        created_by=self._data_text(_data, 'created_by'),
+                        labels=self._data_labels(_data),
+                        istio_init_containers=self._data_text(_data, 'istio_init_containers'),
+                        istio_containers=self._data_text(_data, 'istio_containers'),
+                        status=self._data_status(_data),
+                        phase=self._data_text(_data, 'phase')))
         return _items
 
 
@@ -2101,26 +2562,19 @@ class TableViewServices(TableViewAbstract):
         self.open()
 
         _items = []
-        for el in self.browser.elements(locator=self.ROWS.format(
-            'service-tabs-pane-services'),
-                                        parent=self.ROOT):
-            _columns = list(self.browser.elements(locator=self.COLUMN, parent=el))
-
-            _name = _columns[0].text.strip()
-            _created_at = _columns[1].text.strip()
-            _type = _columns[2].text.strip()
-            _resource_version = _columns[4].text.strip()
-            _ip = _columns[5].text.strip()
-            _ports = _columns[6].text.strip()
-
+        for _data in self._rows_data(
+                self.ROWS.format('service-tabs-pane-services'),
+                columns={'name': 0, 'created_at': 1, 'type': 2, 'resource_version': 4,
+                         'ip': 5, 'ports': 6},
+                labels=3):
             _items.append(ServiceDetails(
-                        name=_name,
-                        created_at=parse_from_ui(_created_at),
-                        service_type=str(_type),
-                        labels=self._get_labels(_columns[3]),
-                        resource_version=str(_resource_version),
-                        ip=str(_ip),
-                        ports=str(_ports.replace('\n', ' '))))
+                        name=self._data_text(_data, 'name'),
+                        created_at=parse_from_ui(self._data_text(_data, 'created_at')),
+                        service_type=str(self._data_text(_data, 'type')),
+                        labels=self._data_labels(_data),
+                        resource_version=str(self._data_text(_data, 'resource_version')),
+                        ip=str(self._data_text(_data, 'ip')),
+                        ports=str(self._data_text(_data, 'ports').replace('\n', ' '))))
         return _items
 
 
@@ -1,14 +1,55 @@
+import json
+import os
+import time
+from contextlib import contextmanager
+
+from smartloc import Locator
 from widgetastic.browser import Browser
-from selenium.common.exceptions import NoSuchElementException
+from widgetastic.widget import Widget
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+from selenium.webdriver.common.by import By
+from six.moves.urllib.parse import urlparse
+
+from kiali_qe.components import snapshot
+from kiali_qe.components.snapshot import DomSnapshot, SnapshotElement
+
+LOCAL_STORAGE_READ = """
+var items = {};
+for (var i = 0; i < window.localStorage.length; i++) {
+    var key = window.localStorage.key(i);
+    items[key] = window.localStorage.getItem(key);
+}
+return items;
+"""
+LOCAL_STORAGE_WRITE = """
+var items = arguments[0];
+for (var key in items) {
+    window.localStorage.setItem(key, items[key]);
+}
+"""
+
+# logged in sessions of this process, by host
+_sessions = {}
 
 
 class KialiBrowser(Browser):
 
     def __init__(
             self, selenium, kiali_versions,
-            plugin_class=None, logger=None, extra_objects=None):
+            plugin_class=None, logger=None, extra_objects=None, profiler=None,
+            session_ttl=0, session_cache_file=None):
         Browser.__init__(self, selenium, plugin_class=None, logger=None, extra_objects=None)
         self.kiali_versions = kiali_versions
+        # logged in session is reused for session_ttl seconds, 0 disables the reuse
+        self.session_ttl = session_ttl
+        self.session_cache_file = session_cache_file
+        self._session_expires = 0
+        # records the WebDriver commands, see kiali_qe.utils.profiler
+        self.profiler = profiler
+        if profiler is not None:
+            profiler.instrument(selenium)
+        self._snapshot_depth = 0
+        self._dom = None
 
     @property
     def product_version(self):
@@ -20,6 +61,248 @@ class KialiBrowser(Browser):
         except NoSuchElementException:
             return default
 
+    @property
+    def is_session_valid(self):
+        """Returns True while the logged in session is known to be valid"""
+        return time.time() < self.root_browser._session_expires
+
+    def _session_key(self):
+        return urlparse(self.selenium.current_url).netloc
+
+    def _read_session_cache(self):
+        _file = self.root_browser.session_cache_file
+        if not _file or not os.path.exists(_file):
+            return {}
+        try:
+            with open(_file) as _cache:
+                return json.load(_cache)
+        except ValueError:
+            self.logger.warning('Ignoring invalid session cache: %s', _file)
+            return {}
+
+    def _write_session_cache(self, sessions):
+        _file = self.root_browser.session_cache_file
+        if not _file:
+            return
+        # the cache holds credentials, only the owner can read it
+        with os.fdopen(os.open(_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w') \
+                as _cache:
+            json.dump(sessions, _cache)
+
+    def save_session(self):
+        """Captures cookies and local storage of the logged in session,
+        the session is known to be valid for session_ttl seconds
+        """
+        _browser = self.root_browser
+        if not _browser.session_ttl:
+            return
+        _session = {
+            'expires': time.time() + _browser.session_ttl,
+            'cookies': self.selenium.get_cookies(),
+            'local_storage': self.selenium.execute_script(LOCAL_STORAGE_READ)}
+        _browser._session_expires = _session['expires']
+        _key = self._session_key()
+        _sessions[_key] = _session
+        if _browser.session_cache_file:
+            _cached = self._read_session_cache()
+            _cached[_key] = _session
+            self._write_session_cache(_cached)
+
+    def restore_session(self):
+        """Injects the saved session of the current host into the browser and reloads the page.
+        Returns False when there is no saved session or it is expired.
+        The restored session has to be verified by the next page load.
+        """
+        if not self.root_browser.session_ttl:
+            return False
+        _key = self._session_key()
+        _session = _sessions.get(_key) or self._read_session_cache().get(_key)
+        if not _session or _session['expires'] < time.time():
+            return False
+        self.logger.debug('Restoring logged in session of %s', _key)
+        for _cookie in _session['cookies']:
+            try:
+                self.selenium.add_cookie(_cookie)
+            except WebDriverException as e:
+                self.logger.warning('Failed to restore cookie %s: %s', _cookie.get('name'), e)
+        self.selenium.execute_script(LOCAL_STORAGE_WRITE, _session['local_storage'])
+        self.refresh()
+        return True
+
+    def invalidate_session(self):
+        """Forgets the saved session of the current host, next page load checks the login"""
+        self.root_browser._session_expires = 0
+        _key = self._session_key()
+        _sessions.pop(_key, None)
+        _cached = self._read_session_cache()
+        if _cached.pop(_key, None) is not None:
+            self._write_session_cache(_cached)
+
     # def element(self, locator, *args, **kwargs):
     #    kwargs['force_check_safe'] = True
     #    super(KialiBrowser, self).element(locator, *args, **kwargs)
+
+    @contextmanager
+    def snapshot(self):
+        """Snapshot mode: XPath queries of the block are answered from one page source,
+        parsed locally with lxml, instead of remote calls.
+        The snapshot is taken on the first query and taken again after an interaction
+        (click, keyboard input, refresh). Queries with widget locators which do not resolve
+        to XPath, visibility checks and interactions use the live page.
+        Use it for attribute, existence and count queries. Text of the elements is read
+        from the live page, one element at a time, the snapshot can not lay it out like
+        the browser does: read texts of many elements by one script, see
+        kiali_qe.components.items_data.
+        Without lxml installed the block uses the live page.
+        """
+        _browser = self.root_browser
+        _browser._snapshot_depth += 1
+        try:
+            yield
+        finally:
+            _browser._snapshot_depth -= 1
+            if _browser._snapshot_depth == 0:
+                _browser._dom = None
+
+    def invalidate_snapshot(self):
+        self.root_browser._dom = None
+
+    @property
+    def dom(self):
+        """Returns DomSnapshot of the page in snapshot mode, None otherwise"""
+        _browser = self.root_browser
+        if _browser._snapshot_depth == 0 or not snapshot.is_supported():
+            return None
+        if _browser._dom is None:
+            _browser._dom = DomSnapshot(self.selenium.page_source, text_reader=self._live_text)
+        return _browser._dom
+
+    def _snapshot_xpath(self, locator):
+        # returns XPath of the locator, None when it can not be queried in the snapshot
+        if hasattr(locator, '__locator__'):
+            locator = locator.__locator__()
+        try:
+            _locator = Locator(locator)
+        except TypeError:
+            return None
+        return _locator.locator if _locator.by == By.XPATH else None
+
+    def _snapshot_parent(self, dom, parent):
+        # returns SnapshotElement or None for the document, raises LookupError when
+        # the parent can not be resolved in the snapshot
+        if parent is None or isinstance(parent, (Browser, str)):
+            # string parents are not resolved by widgetastic either
+            return None
+        if isinstance(parent, SnapshotElement):
+            return parent
+        if not hasattr(parent, '__locator__'):
+            return None
+        _xpath = self._snapshot_xpath(parent.__locator__())
+        if _xpath is None:
+            raise LookupError(parent)
+        _elements = dom.elements(
+            _xpath, parent=self._snapshot_parent(dom, getattr(parent, 'locatable_parent', None)))
+        if not _elements:
+            raise NoSuchElementException('Could not find an element {}'.format(repr(parent)))
+        return _elements[0]
+
+    def _live(self, locator):
+        # snapshot elements are located in the live page by their absolute path
+        if isinstance(locator, SnapshotElement):
+            return self.selenium.find_element(By.XPATH, locator.path)
+        return locator
+
+    def _live_text(self, element):
+        return self._live(element).text
+
+    def execute_script(self, script, *args, **kwargs):
+        # scripts run in the live page, snapshot elements are located there
+        return Browser.execute_script(
+            self, script,
+            *[self._live(self.element(_arg) if isinstance(_arg, Widget) else _arg)
+              for _arg in args], **kwargs)
+
+    def elements(
+            self, locator, parent=None, check_visibility=False, check_safe=True,
+            force_check_safe=False):
+        _dom = self.dom
+        if _dom is not None and not check_visibility:
+            if isinstance(locator, SnapshotElement):
+                return [locator]
+            _xpath = self._snapshot_xpath(locator)
+            if parent is None:
+                # widgets are located within their locatable parent
+                parent = getattr(locator, 'locatable_parent', None)
+            if _xpath is not None:
+                try:
+                    return _dom.elements(_xpath, parent=self._snapshot_parent(_dom, parent))
+                except (LookupError, snapshot.etree.XPathError):
+                    # not supported in the snapshot, let the live page answer
+                    pass
+        return Browser.elements(
+            self, self._live(locator), parent=self._live(parent),
+            check_visibility=check_visibility, check_safe=check_safe,
+            force_check_safe=force_check_safe)
+
+    def element(self, locator, *args, **kwargs):
+        if self.dom is None:
+            return Browser.element(self, locator, *args, **kwargs)
+        _vcheck = self._locator_force_visibility_check(locator)
+        if _vcheck is not None:
+            kwargs['check_visibility'] = _vcheck
+        _elements = self.elements(locator, *args, **kwargs)
+        if not _elements:
+            raise NoSuchElementException('Could not find an element {}'.format(repr(locator)))
+        if len(_elements) == 1:
+            return _elements[0]
+        # prefer visible element, as widgetastic does
+        if isinstance(_elements[0], SnapshotElement):
+            _displayed = [_element for _element in _elements if _element.is_displayed()]
+        else:
+            _displayed = [_element for _element in _elements if self.is_displayed(_element)]
+        return (_displayed or _elements)[0]
+
+    def text(self, locator, *args, **kwargs):
+        if self.dom is None:
+            return Browser.text(self, locator, *args, **kwargs)
+        return Browser.text(self, self._live(self.element(locator, *args, **kwargs)))
+
+    @contextmanager
+    def _live_page(self, invalidate=True):
+        # interactions and visibility checks always use the live page
+        _browser = self.root_browser
+        _depth, _browser._snapshot_depth = _browser._snapshot_depth, 0
+        try:
+            yield
+        finally:
+            _browser._snapshot_depth = _depth
+            if invalidate:
+                _browser._dom = None
+
+    def move_to_element(self, locator, *args, **kwargs):
+        with self._live_page(invalidate=False):
+            return Browser.move_to_element(self, locator, *args, **kwargs)
+
+    def click(self, locator, *args, **kwargs):
+        with self._live_page():
+            return Browser.click(self, locator, *args, **kwargs)
+
+    def double_click(self, locator, *args, **kwargs):
+        with self._live_page():
+            return Browser.double_click(self, locator, *args, **kwargs)
+
+    def raw_click(self, locator, *args, **kwargs):
+        with self._live_page():
+            return Browser.raw_click(self, locator, *args, **kwargs)
+
+    def send_keys(self, text, locator, *args, **kwargs):
+        with self._live_page():
+            return Browser.send_keys(self, text, locator, *args, **kwargs)
+
+    def clear(self, locator, *args, **kwargs):
+        with self._live_page():
+            return Browser.clear(self, locator, *args, **kwargs)
+
+    def refresh(self):
+        with self._live_page():
+            return Browser.refresh(self)
@@ -0,0 +1,144 @@
+""" Read only snapshot of the page DOM, queried locally with lxml """
+import re
+
+try:
+    from lxml import etree, html
+except ImportError:
+    etree = html = None
+
+# tags rendered on their own line, used to approximate the text of WebElement
+BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'dd', 'div', 'dl', 'dt', 'fieldset',
+    'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header',
+    'hr', 'li', 'main', 'nav', 'ol', 'p', 'pre', 'section', 'table', 'tbody', 'thead',
+    'tfoot', 'tr', 'ul'}
+# table cells are separated by a space in the text of the row
+CELL_TAGS = {'td', 'th'}
+SKIPPED_TAGS = {'script', 'style', 'noscript', 'template'}
+
+
+def is_supported():
+    """ Returns True when lxml is installed """
+    return html is not None
+
+
+def _is_hidden(node):
+    # hidden by attribute or inline style, CSS rules are not evaluated
+    _style = re.sub(r'\s+', '', node.get('style', '')).lower()
+    return node.get('hidden') is not None or 'display:none' in _style \
+        or 'visibility:hidden' in _style
+
+
+def _collapse(text):
+    # white space of the source is not a line break, only the tags break lines
+    return re.sub(r'\s+', ' ', text)
+
+
+def _collect_text(node, parts):
+    _tag = node.tag if isinstance(node.tag, str) else None
+    if _tag in SKIPPED_TAGS or (_tag is not None and _is_hidden(node)):
+        if node.tail:
+            parts.append(_collapse(node.tail))
+        return
+    if _tag == 'br' or _tag in BLOCK_TAGS:
+        parts.append('\n')
+    if _tag is not None and node.text:
+        parts.append(_collapse(node.text))
+    for _child in node:
+        _collect_text(_child, parts)
+    if _tag in BLOCK_TAGS:
+        parts.append('\n')
+    elif _tag in CELL_TAGS:
+        parts.append(' ')
+    if node.tail:
+        parts.append(_collapse(node.tail))
+
+
+def rendered_text(node):
+    """ Returns the text of the node split to lines, an approximation of the text of WebElement.
+    Only the tags and inline styles are known, elements laid out by CSS rules (flex, block
+    spans, hidden by class) differ from the rendered page.
+    """
+    _parts = []
+    _collect_text(node, _parts)
+    # tail of the node itself is not part of its text
+    if node.tail:
+        _parts.pop()
+    _lines = [re.sub(r'\s+', ' ', _line).strip() for _line in ''.join(_parts).split('\n')]
+    return '\n'.join([_line for _line in _lines if _line])
+
+
+class SnapshotElement(object):
+    """ Element of DomSnapshot, provides the read only part of WebElement.
+    Note: styles are not evaluated, hidden elements are found
+    Args:
+        node: lxml element
+        text_reader: function returning the text of the element in the live page,
+            rendered_text of the node when None
+    """
+
+    def __init__(self, node, text_reader=None):
+        self.node = node
+        self.text_reader = text_reader
+
+    def __eq__(self, other):
+        return isinstance(other, SnapshotElement) and self.node is other.node
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self.node)
+
+    def __repr__(self):
+        return "{}({})".format(type(self).__name__, repr(self.path))
+
+    @property
+    def path(self):
+        """ Absolute XPath of the element, locates the element in the live page """
+        return self.node.getroottree().getpath(self.node)
+
+    @property
+    def tag_name(self):
+        return self.node.tag
+
+    @property
+    def text(self):
+        if self.text_reader is not None:
+            return self.text_reader(self)
+        return rendered_text(self.node)
+
+    def get_attribute(self, name):
+        return self.node.get(name)
+
+    def is_displayed(self):
+        """ Returns False when the element or an ancestor is hidden by attribute or inline style """
+        _node = self.node
+        while _node is not None:
+            if _is_hidden(_node):
+                return False
+            _node = _node.getparent()
+        return True
+
+
+class DomSnapshot(object):
+    """ Page source parsed once, answers XPath queries locally
+    Args:
+        page_source: html of the page
+        text_reader: text_reader of the elements, see SnapshotElement
+    """
+
+    def __init__(self, page_source, text_reader=None):
+        self.root = html.fromstring(page_source)
+        self.text_reader = text_reader
+
+    def elements(self, xpath, parent=None):
+        """ Returns list of SnapshotElement matching the XPath
+        Args:
+            xpath: XPath expression, relative to parent
+            parent: SnapshotElement, the document when None
+        Raises: lxml.etree.XPathError for invalid XPath
+        """
+        _context = parent.node if parent is not None else self.root
+        return [SnapshotElement(_node, text_reader=self.text_reader)
+                for _node in _context.xpath(xpath) if isinstance(_node, html.HtmlElement)]
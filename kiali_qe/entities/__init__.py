@@ -1,9 +1,22 @@
 from kiali_qe.components.enums import HealthType
+from kiali_qe.utils.matcher import EntityMatcher
 
 
 class EntityBase(object):
 
+    @property
+    def identity_key(self):
+        """ Fields which should be equal on equal entities, used to index entities.
+        Only the name by default, entities comparing more fields in is_equal
+        (namespace, type) extend the key. None for entities without name,
+        they are compared one by one.
+        """
+        _name = getattr(self, 'name', None)
+        return None if _name is None else (_name,)
+
     def is_in(self, items):
+        if isinstance(items, EntityMatcher):
+            return items.find(self) is not None
         for item in items:
             if self.is_equal(item):
                 return True
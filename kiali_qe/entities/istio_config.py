@@ -25,6 +25,10 @@ class IstioConfig(EntityBase):
     def __hash__(self):
         return (hash(self.name) ^ hash(self.namespace) ^ hash(self.object_type))
 
+    @property
+    def identity_key(self):
+        return (self.name, self.namespace)
+
     def is_equal(self, other, advanced_check=True):
         # basic check
         if not isinstance(other, IstioConfig):
@@ -123,6 +127,10 @@ class Rule(EntityBase):
     def __eq__(self, other):
         return self.is_equal(other, advanced_check=True)
 
+    @property
+    def identity_key(self):
+        return (self.name, self.namespace)
+
     def is_equal(self, other, advanced_check=True):
         # basic check
         if not isinstance(other, Rule):
@@ -32,6 +32,10 @@ class Overview(EntityBase):
     def __eq__(self, other):
         return self.is_equal(other, advanced_check=True)
 
+    @property
+    def identity_key(self):
+        return (self.overview_type, self.namespace)
+
     def is_equal(self, other, advanced_check=True):
         # basic check
         if not isinstance(other, Overview):
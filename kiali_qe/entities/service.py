@@ -101,6 +101,10 @@ class Service(EntityBase):
     def __eq__(self, other):
         return self.is_equal(other, advanced_check=True)
 
+    @property
+    def identity_key(self):
+        return (self.name, self.namespace)
+
     def is_equal(self, other, advanced_check=True):
         # basic check
         if not isinstance(other, Service):
@@ -32,6 +32,10 @@ class Workload(EntityBase):
     def __hash__(self):
         return (hash(self.name) ^ hash(self.namespace) ^ hash(self.workload_type))
 
+    @property
+    def identity_key(self):
+        return (self.name, self.namespace, self.workload_type)
+
     def is_equal(self, other, advanced_check=True):
         # basic check
         if not isinstance(other, Workload):
@@ -1,5 +1,8 @@
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from threading import Lock
 from time import sleep
 
 import pytest
@@ -11,19 +14,100 @@ from kiali_qe.components.browser import KialiBrowser
 from kiali_qe.fixtures.zalenium import set_browser, update_suite_status
 from kiali_qe.utils.conf import env as cfg
 from kiali_qe.utils.log import logger
+from kiali_qe.utils.profiler import command_profiler
+
+#: environment variable with the json of a driver session created by the scheduler process
+SESSION_ENV = 'KIALI_QE_SELENIUM_SESSION'
+
+
+class DriverPool(object):
+    """ Web drivers created in background threads, so the driver startup overlaps
+    the other session setup. Drivers not taken are quit by close.
+    Args:
+        factory: creates a driver, _get_selenium when None
+    """
+
+    def __init__(self, factory=None):
+        self._factory = factory
+        self._futures = []
+        self._executor = None
+        self._lock = Lock()
+
+    def add(self, count=1):
+        """ Starts creating count drivers in background """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=max(count, 1))
+            for _ in range(count):
+                self._futures.append(self._executor.submit(self._create))
+
+    def get(self):
+        """ Returns the earliest requested driver, creates one when none was requested """
+        with self._lock:
+            _future = self._futures.pop(0) if self._futures else None
+        if _future is None:
+            return self._create()
+        return _future.result()
+
+    def _create(self):
+        return (self._factory or _get_selenium)()
+
+    def close(self):
+        with self._lock:
+            _futures, self._futures = self._futures, []
+        for _future in _futures:
+            try:
+                _driver = _future.result()
+                if _driver is not None:
+                    _driver.quit()
+            except WebDriverException as ex:
+                logger.warning('Failed to quit pooled driver. Exception:{}'.format(ex))
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+
+driver_pool = DriverPool()
+
+
+def uses_browser(items):
+    """ Returns True when any of the test items uses the browser fixture """
+    return any(['browser' in getattr(_item, 'fixturenames', ()) for _item in items])
+
+
+def pytest_collection_finish(session):
+    config = session.config
+    # the scheduler process starts its pool for the workers, see kiali_qe.fixtures.scheduler
+    _scheduler = config.getoption('p_workers', 1) > 1 and not config.getoption('p_lane', None)
+    if cfg.selenium.pool.prewarm and not config.option.collectonly and not _scheduler \
+            and not os.environ.get(SESSION_ENV) and uses_browser(session.items):
+        logger.debug('Requesting web driver in background')
+        driver_pool.add(1)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    driver_pool.close()
 
 
 @pytest.fixture(scope='session')
 def browser(kiali_client):
-    selenium = _get_selenium()
+    selenium = _attach_selenium() if os.environ.get(SESSION_ENV) else driver_pool.get()
     selenium.maximize_window()
     logger.debug('Launching kiali instance: {}'.format(cfg.kiali.hostname))
     selenium.get(
         'https://{}'.format(cfg.kiali.hostname))
     # load KialiBrowser
+    _profiler = None
+    if cfg.selenium.profiler.enabled:
+        command_profiler.top = cfg.selenium.profiler.top or command_profiler.top
+        _profiler = command_profiler
     kiali_browser = KialiBrowser(
         selenium, logger=logger,
-        kiali_versions={'core': cfg.kiali.version.core, 'console': cfg.kiali.version.console})
+        kiali_versions={'core': cfg.kiali.version.core, 'console': cfg.kiali.version.console},
+        profiler=_profiler,
+        session_ttl=cfg.kiali.session.ttl or 0,
+        session_cache_file=cfg.kiali.session.cache_file or None)
+    # reuse the logged in session of a previous browser
+    kiali_browser.restore_session()
     # ugly hack to pass browser object to zalenium fixtures
     # needs to remove this global assignment
     set_browser(kiali_browser)
@@ -59,6 +143,40 @@ def _get_selenium():
     return driver
 
 
+def session_json(driver):
+    """ Returns json of the driver session, the session can be attached in another process """
+    return json.dumps({'session_id': driver.session_id,
+                       'w3c': driver.w3c,
+                       'capabilities': driver.capabilities})
+
+
+class _AttachedRemote(webdriver.Remote):
+    """ Remote driver of an existing session """
+
+    def __init__(self, command_executor, session):
+        self._session = session
+        webdriver.Remote.__init__(self, command_executor, keep_alive=True)
+
+    def start_session(self, *args, **kwargs):
+        self.session_id = self._session['session_id']
+        self.w3c = self._session['w3c']
+        self.capabilities = self._session['capabilities']
+
+
+def _attach_selenium():
+    _session = json.loads(os.environ[SESSION_ENV])
+    logger.debug('Attaching web driver session: {}'.format(_session['session_id']))
+    driver = _AttachedRemote(
+        RemoteConnection(cfg.selenium.web_driver, resolve_ip=False), _session)
+    try:
+        # the session might be expired while waiting
+        driver.current_url
+        return driver
+    except WebDriverException as ex:
+        logger.warning('Failed to attach web driver session. Exception:{}'.format(ex))
+        return _get_selenium()
+
+
 def _get_driver(capabilities):
     logger.debug('Creating web driver')
     start_time = datetime.now()
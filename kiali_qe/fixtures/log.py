@@ -4,6 +4,7 @@ import attr
 import pytest
 
 from kiali_qe.utils import log
+from kiali_qe.utils.profiler import command_profiler
 
 #: A dict of tests, and their state at various test phases
 test_tracking = collections.defaultdict(dict)
@@ -25,6 +26,7 @@ def pytest_runtest_setup(item):
     logger().info(
         log.format_marker(_format_nodeid(item.nodeid), mark="-"),
         extra={'source_file': path, 'source_lineno': lineno})
+    command_profiler.start_test(_format_nodeid(item.nodeid))
     yield
 
 
@@ -52,6 +54,8 @@ class LogExtraData(object):
             logger().info(log.format_marker('{} result: {}'.format(
                 _format_nodeid(report.nodeid), test_status)),
                 extra={'source_file': path, 'source_lineno': lineno})
+            for _line in command_profiler.finish_test():
+                logger().info(_line)
         if report.outcome == "skipped":
             logger().info(log.format_marker(report.longreprtext))
 
@@ -78,6 +82,8 @@ def pytest_sessionfinish(session, exitstatus):
     summary = ', '.join(results)
     logger().info(log.format_marker('Finished test run', mark='='))
     logger().info(log.format_marker(str(summary), mark='='))
+    for _line in command_profiler.session_report():
+        logger().info(_line)
 
 
 def _test_status(test_name):
@@ -5,6 +5,17 @@ from kiali_qe.rest.kiali_api import KialiExtendedClient
 from kiali_qe.rest.openshift_api import OpenshiftExtendedClient
 from kiali_qe.utils.conf import env as cfg
 from kiali_qe.utils.log import logger
+from kiali_qe.utils.parallel import configure_background, shutdown_background
+
+
+def pytest_sessionstart(session):
+    # REST and OC items are fetched in background while reading the UI,
+    # with the same concurrency limit as the requests of the REST client
+    configure_background(cfg.kiali.rest.max_workers)
+
+
+def pytest_sessionfinish(session):
+    shutdown_background()
 
 
 @pytest.fixture(scope='session')
@@ -14,7 +25,13 @@ def kiali_client():
     _client = KialiExtendedClient(hostname=cfg.kiali.hostname,
                                   username=cfg.kiali.username,
                                   password=cfg.kiali.password,
-                                  swagger_address=cfg.kiali.swagger_address)
+                                  swagger_address=cfg.kiali.swagger_address,
+                                  bulk_health=cfg.kiali.rest.bulk_health,
+                                  bulk_validations=cfg.kiali.rest.bulk_validations,
+                                  max_workers=cfg.kiali.rest.max_workers,
+                                  cache_size=cfg.kiali.rest.cache.size,
+                                  cache_ttl=cfg.kiali.rest.cache.ttl,
+                                  cache_ttls=cfg.kiali.rest.cache.ttls.toDict())
     # update kiali version details
     _response = _client.get_response('getStatus')
     _status = _response['status']
@@ -33,13 +50,22 @@ def kiali_client():
 
 
 @pytest.fixture(scope='session')
-def openshift_client():
+def openshift_client(kiali_client):
     if cfg.kiali.skip_oc:
         logger.debug('Skipping Openshift rest client because of cfg.kiali.skip_oc')
         # TODO Temporary solution as OC client does not support OCP4
-        return kiali_client()
+        yield kiali_client
     else:
         logger.debug('Creating Openshift rest client')
-        _client = OpenshiftExtendedClient()
+        _client = OpenshiftExtendedClient(
+            max_workers=cfg.openshift.max_workers,
+            discovery_cache_file=cfg.openshift.discovery_cache.file,
+            discovery_cache_ttl=cfg.openshift.discovery_cache.ttl,
+            page_size=cfg.openshift.page_size,
+            # changes done through Openshift are not seen by kiali client cache
+            on_change=kiali_client.invalidate_cache,
+            informers=cfg.openshift.informers.enabled,
+            informer_watch_timeout=cfg.openshift.informers.watch_timeout)
         logger.info('Openshift versions:\n{}'.format(json.dumps(_client.version, indent=2)))
-        return _client
+        yield _client
+        _client.close()
@@ -0,0 +1,261 @@
+""" Runs the p_group lanes of tests concurrently, one pytest worker process per lane.
+
+Tests of a p_groupN marker form a lane and run in order in one worker process with its own
+browser session, tests without group form the 'default' lane. Up to --p-workers lanes run
+at a time, p_group_last tests run after all the other lanes, in one worker.
+With selenium.pool.prewarm the scheduler keeps up to --p-workers web drivers ready and
+hands their sessions over to the workers of the lanes using the browser fixture.
+
+The workers take resource locks from the scheduler before each test, by the p_ro_* / p_crud_*
+markers of the test, so read-only tests never overlap the CRUD tests they would see:
+    p_crud_top          conflicts with every test
+    p_crud_namespace    conflicts with every test except p_ro_top_safe
+    p_crud_resource     conflicts with p_ro_resource, p_ro_namespace, p_ro_top and the tests above
+Tests without these markers hold the implicit p_unmarked mode, which conflicts with p_crud_top.
+
+The workers report their failed tests count to the scheduler, the session of the scheduler
+fails with the sum of them.
+"""
+import binascii
+import os
+import subprocess
+import sys
+import threading
+
+from collections import Counter, OrderedDict
+from multiprocessing.managers import BaseManager
+
+import pytest
+
+from kiali_qe.fixtures.browser import SESSION_ENV, driver_pool, session_json, uses_browser
+from kiali_qe.utils.conf import env as cfg
+from kiali_qe.utils.log import logger
+from kiali_qe.utils.parallel import parallel_map
+
+GROUP_PREFIX = 'p_group'
+LAST_GROUP = 'p_group_last'
+DEFAULT_LANE = 'default'
+LOCK_MODES = ('p_ro_top_safe', 'p_ro_top', 'p_ro_namespace', 'p_ro_resource',
+              'p_crud_resource', 'p_crud_namespace', 'p_crud_top')
+# lock mode of the tests without lock markers
+UNMARKED_MODE = 'p_unmarked'
+
+
+def _conflicts():
+    _result = {_mode: set() for _mode in LOCK_MODES + (UNMARKED_MODE,)}
+    _result['p_crud_top'] = set(LOCK_MODES)
+    _result['p_crud_namespace'] = set(LOCK_MODES) - {'p_ro_top_safe'}
+    _result['p_crud_resource'] = {'p_ro_top', 'p_ro_namespace', 'p_ro_resource',
+                                  'p_crud_namespace', 'p_crud_top'}
+    _result[UNMARKED_MODE] = {'p_crud_top'}
+    # conflicts are symmetric
+    for _mode, _conflicting in list(_result.items()):
+        for _other in _conflicting:
+            _result[_other].add(_mode)
+    return _result
+
+
+#: lock mode: lock modes which can not be held at the same time
+CONFLICTS = _conflicts()
+
+
+class ResourceLocks(object):
+    """ Locks shared by the workers, served by the scheduler process """
+
+    def __init__(self):
+        self._holders = Counter()
+        self._condition = threading.Condition()
+
+    def _is_free(self, modes):
+        return not any([self._holders[_held] > 0 and _held in CONFLICTS[_mode]
+                        for _mode in modes for _held in list(self._holders)])
+
+    def acquire(self, modes):
+        """ Blocks until none of the modes conflicts with a held mode, then holds the modes """
+        with self._condition:
+            while not self._is_free(modes):
+                self._condition.wait()
+            self._holders.update(modes)
+
+    def release(self, modes):
+        with self._condition:
+            self._holders.subtract(modes)
+            self._condition.notify_all()
+
+
+class LaneResults(object):
+    """ Failed tests count reported by each lane, served by the scheduler process """
+
+    def __init__(self):
+        self._failed = {}
+        self._lock = threading.Lock()
+
+    def report(self, lane, failed):
+        with self._lock:
+            self._failed[lane] = failed
+
+    def failed(self, lane):
+        """ Returns the failed tests count of the lane, None when the lane did not report """
+        with self._lock:
+            return self._failed.get(lane)
+
+
+class LockManager(BaseManager):
+    pass
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('kiali_qe scheduler')
+    group.addoption('--p-workers', type=int, default=1,
+                    help='number of p_group lanes running at a time, 1 runs the tests in process')
+    group.addoption('--p-lane', default=None, help='internal: lane of a worker process')
+    group.addoption('--p-lock-server', default=None, help='internal: host:port of the locks')
+    group.addoption('--p-lock-authkey', default=None, help='internal: authkey of the locks')
+
+
+def _lane(item):
+    if LAST_GROUP in item.keywords:
+        return LAST_GROUP
+    for _keyword in item.keywords:
+        if _keyword.startswith(GROUP_PREFIX) and _keyword[len(GROUP_PREFIX):].isdigit():
+            return _keyword
+    return DEFAULT_LANE
+
+
+def _lock_modes(item):
+    _modes = [_mode for _mode in LOCK_MODES if _mode in item.keywords]
+    return _modes or [UNMARKED_MODE]
+
+
+def _failed_count(code, reported):
+    """ Returns the failed tests count of a lane
+    Args:
+        code: exit code of the lane worker, 0: all passed, 5: no tests collected in the lane
+        reported: failed tests count reported by the worker, None when it did not report
+    """
+    # a worker failing without failed tests, i.e. on collection or crash, counts as one failure
+    if code not in (0, 5):
+        return max(reported or 0, 1)
+    return reported or 0
+
+
+class Scheduler(object):
+
+    def __init__(self, config):
+        self.config = config
+        self._output_lock = threading.Lock()
+        self._pool_lock = threading.Lock()
+        self._drivers_requested = 0
+        self._lanes_count = 0
+        self._results = LaneResults()
+
+    def _request_drivers(self, count):
+        with self._pool_lock:
+            count = min(count, self._lanes_count - self._drivers_requested)
+            self._drivers_requested += count
+        if count > 0:
+            driver_pool.add(count)
+
+    def _lane_env(self, items):
+        _env = dict(os.environ)
+        if not cfg.selenium.pool.prewarm or not uses_browser(items):
+            return _env
+        _driver = driver_pool.get()
+        # keep a driver ready for the next lane
+        self._request_drivers(1)
+        if _driver is not None:
+            _env[SESSION_ENV] = session_json(_driver)
+        return _env
+
+    def _start_lock_server(self):
+        _locks = ResourceLocks()
+        LockManager.register('locks', callable=lambda: _locks)
+        LockManager.register('results', callable=lambda: self._results)
+        self.authkey = binascii.hexlify(os.urandom(16))
+        _server = LockManager(address=('127.0.0.1', 0), authkey=self.authkey).get_server()
+        _thread = threading.Thread(target=_server.serve_forever)
+        _thread.daemon = True
+        _thread.start()
+        return '{}:{}'.format(*_server.address)
+
+    def _run_lane(self, lane):
+        _name, _items = lane
+        _command = [sys.executable, '-m', 'pytest', '-p', 'no:cacheprovider',
+                    '--p-lane', _name,
+                    '--p-lock-server', self.lock_server,
+                    '--p-lock-authkey', self.authkey.decode()] + \
+            [_item.nodeid for _item in _items]
+        _env = self._lane_env(_items)
+        logger.info('Starting lane {} with {} tests'.format(_name, len(_items)))
+        _process = subprocess.Popen(
+            _command, cwd=str(self.config.rootdir), env=_env,
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        _output = _process.communicate()[0]
+        logger.info('Lane {} finished with exit code {}'.format(_name, _process.returncode))
+        _reporter = self.config.pluginmanager.get_plugin('terminalreporter')
+        if _reporter is not None:
+            with self._output_lock:
+                _reporter.write_sep('-', 'lane {}'.format(_name))
+                _reporter.write(_output.decode('utf-8', 'replace'))
+        return _name, _process.returncode
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtestloop(self, session):
+        if session.config.option.collectonly:
+            return None
+        _lanes = OrderedDict()
+        for _item in session.items:
+            _lanes.setdefault(_lane(_item), []).append(_item)
+        _last = _lanes.pop(LAST_GROUP, [])
+        self.lock_server = self._start_lock_server()
+        _workers = self.config.getoption('p_workers')
+        # drivers are kept ready only for the lanes using the browser
+        self._lanes_count = len([_items for _items in list(_lanes.values()) + [_last]
+                                 if uses_browser(_items)])
+        if cfg.selenium.pool.prewarm:
+            self._request_drivers(_workers)
+        _results = parallel_map(self._run_lane, list(_lanes.items()), max_workers=_workers)
+        # p_group_last runs alone, after all the other lanes
+        if _last:
+            _results.append(self._run_lane((LAST_GROUP, _last)))
+        session.testsfailed = sum([_failed_count(_code, self._results.failed(_name))
+                                   for _name, _code in _results])
+        return True
+
+
+class LockClient(object):
+    """ Holds the lock modes of each test of a worker for the duration of the test
+    and reports the failed tests count of the lane
+    """
+
+    def __init__(self, lane, address, authkey):
+        self._lane = lane
+        _host, _port = address.rsplit(':', 1)
+        LockManager.register('locks')
+        LockManager.register('results')
+        _manager = LockManager(address=(_host, int(_port)), authkey=authkey.encode())
+        _manager.connect()
+        self._locks = _manager.locks()
+        self._results = _manager.results()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        _modes = _lock_modes(item)
+        self._locks.acquire(_modes)
+        try:
+            yield
+        finally:
+            self._locks.release(_modes)
+
+    def pytest_sessionfinish(self, session):
+        self._results.report(self._lane, session.testsfailed)
+
+
+def pytest_configure(config):
+    if config.getoption('p_lock_server'):
+        config.pluginmanager.register(
+            LockClient(config.getoption('p_lane'), config.getoption('p_lock_server'),
+                       config.getoption('p_lock_authkey')),
+            'p_lock_client')
+    elif config.getoption('p_workers') > 1:
+        config.pluginmanager.register(Scheduler(config), 'p_scheduler')
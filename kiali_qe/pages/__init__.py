@@ -1,4 +1,5 @@
 """update this doc"""
+from six.moves.urllib.parse import urlencode
 from widgetastic.widget import View, Text
 from kiali_qe.components import (
     Button,
@@ -16,13 +17,18 @@ from kiali_qe.components import (
     SortDropDown,
     CheckBoxFilter,
     NamespaceFilter,
-    Actions)
+    Actions,
+    wait_to_spinner_disappear,
+    wait_until)
 from kiali_qe.components.enums import (
     MainMenuEnum as MENU,
-    UserMenuEnum as USER_MENU)
+    UserMenuEnum as USER_MENU,
+    ApplicationsPageFilter,
+    WorkloadsPageFilter,
+    ServicesPageFilter,
+    IstioConfigPageFilter)
 from kiali_qe.utils.log import logger
 from kiali_qe.utils.conf import env as cfg
-from wait_for import wait_for
 
 XP_DROP_DOWN = '//*[contains(@class, "dropdown")]/*[@id="{}"]/..'
 XP_BUTTON_SWITCH = '//*[contains(@class, "bootstrap-switch")]//*[text()="{}"]/../..'
@@ -31,6 +37,8 @@ REFRESH_BUTTON = './/button//*[contains(@class, "fa-refresh")]'
 
 class RootPage(View):
     PAGE_MENU = None
+    # filter name: query parameter of the filter in the page URL
+    URL_FILTERS = {}
 
     def __init__(self, parent, auto_login=True, logger=logger):
         View.__init__(self, parent, logger=logger)
@@ -45,8 +53,10 @@ class RootPage(View):
     def load(self, force_load=False, force_refresh=False):
         # if auto login enabled, do login. else do logout
         if self._auto_login:
-            # if login page displayed, do login
-            self.login()
+            # if login page displayed, do login.
+            # login check is skipped while the logged in session is known to be valid
+            if not self.browser.is_session_valid:
+                self.login()
         else:
             self.logout()
         # load particular page, only if PAGE_MENU is supplied
@@ -71,15 +81,43 @@ class RootPage(View):
             # wait till login complete
             def _is_displayed():
                 return not self._login.is_displayed
-            wait_for(_is_displayed, timeout='3s', delay=0.2, very_quiet=True, silent_failure=True)
+            wait_until(self.browser, _is_displayed, timeout='3s')
 
-        return not self._login.is_displayed
+        _logged_in = not self._login.is_displayed
+        if _logged_in:
+            self.browser.save_session()
+        return _logged_in
 
     def logout(self):
+        self.browser.invalidate_session()
         if not self._login.is_displayed:
             self.navbar.user_menu.select(USER_MENU.LOGOUT.text)
         return self._login.is_displayed
 
+    def load_url(self, namespaces=[], filters=[]):
+        """Loads the page with the namespaces and filters encoded in the URL,
+        one page load instead of applying them one by one in the UI.
+        Returns False without loading when the page or a filter has no URL encoding.
+        Args:
+            namespaces: list of namespace names
+            filters: list of filters, filter = {'name': 'Health', 'value': 'Healthy'}
+        """
+        if self.PAGE_MENU is None or not self.URL_FILTERS:
+            return False
+        _params = []
+        if namespaces:
+            _params.append(('namespaces', ','.join(namespaces)))
+        for _filter in filters:
+            if _filter['name'] not in self.URL_FILTERS:
+                return False
+            _params.append((self.URL_FILTERS[_filter['name']], _filter['value']))
+        _link = self.main_menu.link(self.PAGE_MENU)
+        if not _link:
+            return False
+        self.browser.url = '{}?{}'.format(_link.split('?')[0], urlencode(_params))
+        wait_to_spinner_disappear(self.browser)
+        return True
+
     def reload(self):
         self.browser.refresh()
         self.load()
@@ -124,6 +162,10 @@ class OverviewPage(RootPage):
 
 class ApplicationsPage(RootPage):
     PAGE_MENU = MENU.APPLICATIONS.text
+    URL_FILTERS = {
+        ApplicationsPageFilter.APP_NAME.text: 'appname',
+        ApplicationsPageFilter.ISTIO_SIDECAR.text: 'istiosidecar',
+        ApplicationsPageFilter.HEALTH.text: 'health'}
 
     namespace = NamespaceFilter()
     filter = Filter()
@@ -135,6 +177,13 @@ class ApplicationsPage(RootPage):
 
 class WorkloadsPage(RootPage):
     PAGE_MENU = MENU.WORKLOADS.text
+    URL_FILTERS = {
+        WorkloadsPageFilter.WORKLOAD_NAME.text: 'workloadname',
+        WorkloadsPageFilter.WORKLOAD_TYPE.text: 'workloadtype',
+        WorkloadsPageFilter.ISTIO_SIDECAR.text: 'istiosidecar',
+        WorkloadsPageFilter.HEALTH.text: 'health',
+        WorkloadsPageFilter.APP_LABEL.text: 'applabel',
+        WorkloadsPageFilter.VERSION_LABEL.text: 'versionlabel'}
 
     namespace = NamespaceFilter()
     filter = Filter()
@@ -146,6 +195,10 @@ class WorkloadsPage(RootPage):
 
 class ServicesPage(RootPage):
     PAGE_MENU = MENU.SERVICES.text
+    URL_FILTERS = {
+        ServicesPageFilter.SERVICE_NAME.text: 'servicename',
+        ServicesPageFilter.ISTIO_SIDECAR.text: 'istiosidecar',
+        ServicesPageFilter.HEALTH.text: 'health'}
 
     namespace = NamespaceFilter()
     filter = Filter()
@@ -159,6 +212,10 @@ class ServicesPage(RootPage):
 
 class IstioConfigPage(RootPage):
     PAGE_MENU = MENU.ISTIO_CONFIG.text
+    URL_FILTERS = {
+        IstioConfigPageFilter.ISTIO_TYPE.text: 'istiotype',
+        IstioConfigPageFilter.ISTIO_NAME.text: 'istioname',
+        IstioConfigPageFilter.CONFIG.text: 'configvalidation'}
 
     namespace = NamespaceFilter()
     filter = Filter()
@@ -0,0 +1,173 @@
+""" Local cache of the API server resources, kept up to date by list + watch """
+import json
+import time
+
+from threading import Lock, Thread
+
+from kiali_qe.utils.log import logger
+
+# watch event types
+ADDED = 'ADDED'
+MODIFIED = 'MODIFIED'
+DELETED = 'DELETED'
+ERROR = 'ERROR'
+# status code of an expired resource version, the resource is listed again
+GONE = 410
+
+
+def _metadata(item):
+    _metadata = item['metadata']
+    return _metadata.get('namespace'), _metadata['name'], _metadata.get('labels') or {}
+
+
+class Store(object):
+    """ Items of one resource kind indexed by namespace, name and labels.
+    Items are the raw items (decoded JSON) of the API server, shared between readers,
+    must not be modified.
+    """
+
+    def __init__(self):
+        # (namespace, name): item
+        self._items = {}
+        # namespace: set of (namespace, name)
+        self._namespaces = {}
+        # (label, value): set of (namespace, name)
+        self._labels = {}
+        self._lock = Lock()
+
+    def _add(self, item):
+        _namespace, _name, _labels = _metadata(item)
+        _key = (_namespace, _name)
+        self._remove(_key)
+        self._items[_key] = item
+        self._namespaces.setdefault(_namespace, set()).add(_key)
+        for _label in _labels.items():
+            self._labels.setdefault(_label, set()).add(_key)
+
+    def _remove(self, key):
+        _item = self._items.pop(key, None)
+        if _item is None:
+            return
+        _namespace, _name, _labels = _metadata(_item)
+        self._namespaces[_namespace].discard(key)
+        for _label in _labels.items():
+            self._labels[_label].discard(key)
+
+    def replace(self, items):
+        """ Replaces all the items, on list """
+        with self._lock:
+            self._items = {}
+            self._namespaces = {}
+            self._labels = {}
+            for _item in items:
+                self._add(_item)
+
+    def upsert(self, item):
+        with self._lock:
+            self._add(item)
+
+    def delete(self, namespace, name):
+        with self._lock:
+            self._remove((namespace, name))
+
+    def get(self, namespace, name):
+        """ Returns the item or None when missing, namespace is None for cluster resources """
+        with self._lock:
+            return self._items.get((namespace, name))
+
+    def list(self, namespaces=[], labels={}):
+        """ Returns items ordered by namespace and name, like the API server lists them
+        Args:
+            namespaces: Namespaces of the items, optional. All namespaces when empty
+            labels: label: value the items have, optional
+        """
+        with self._lock:
+            if len(namespaces) > 0:
+                _keys = set()
+                for _namespace in namespaces:
+                    _keys.update(self._namespaces.get(_namespace, ()))
+                # cluster resources are listed for any namespace, like the API server does
+                _keys.update(self._namespaces.get(None, ()))
+            else:
+                _keys = set(self._items.keys())
+            for _label in labels.items():
+                _keys &= self._labels.get(_label, set())
+            return [self._items[_key]
+                    for _key in sorted(_keys, key=lambda _key: (_key[0] or '', _key[1]))]
+
+
+class Informer(object):
+    """ Lists the resource once, then keeps its Store up to date through a watch stream
+    in a background thread.
+    Args:
+        resource: resource of the dynamic client
+        watch_timeout: seconds after which the watch stream is started again
+    """
+
+    def __init__(self, resource, watch_timeout=300):
+        self.resource = resource
+        self.watch_timeout = watch_timeout
+        self.store = Store()
+        self._resource_version = None
+        self._stopped = False
+        self._thread = None
+
+    @property
+    def kind(self):
+        return self.resource.kind
+
+    def start(self):
+        """ Lists the resource and starts the watch, the store is up to date on return """
+        self._list()
+        self._thread = Thread(target=self._watch, name='informer-{}'.format(self.kind))
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """ The watch stream ends at its next event or timeout """
+        self._stopped = True
+
+    def _list(self):
+        _response = json.loads(self.resource.get(serialize=False).data.decode('utf8'))
+        self.store.replace(_response.get('items') or [])
+        self._resource_version = _response['metadata']['resourceVersion']
+        logger.debug('Informer {} listed at version {}'.format(
+            self.kind, self._resource_version))
+
+    def _watch(self):
+        while not self._stopped:
+            try:
+                for _event in self.resource.watch(
+                        resource_version=self._resource_version, timeout=self.watch_timeout):
+                    if self._stopped:
+                        return
+                    if not self._handle(_event):
+                        # resource version expired, the changes are listed
+                        self._list()
+                        break
+            except Exception as ex:
+                if self._stopped:
+                    return
+                logger.warning('Informer {} watch failed, listing again: {}'.format(
+                    self.kind, ex))
+                time.sleep(1)
+                try:
+                    self._list()
+                except Exception as ex:
+                    logger.warning('Informer {} list failed: {}'.format(self.kind, ex))
+
+    def _handle(self, event):
+        """ Applies the event to the store, returns False when the stream has to be restarted """
+        if event['type'] == ERROR:
+            if event['raw_object'].get('code') == GONE:
+                return False
+            raise ValueError(event['raw_object'].get('message'))
+        _item = event['raw_object']
+        _namespace, _name, _labels = _metadata(_item)
+        if event['type'] == DELETED:
+            self.store.delete(_namespace, _name)
+        elif event['type'] in (ADDED, MODIFIED):
+            self.store.upsert(_item)
+        self._resource_version = _item['metadata']['resourceVersion']
+        return True
@@ -1,6 +1,8 @@
 import json
 
 from itertools import groupby
+from operator import itemgetter
+from threading import BoundedSemaphore
 
 from kiali.client import KialiClient
 from kiali_qe.components.enums import (
@@ -33,8 +35,11 @@ from kiali_qe.entities.applications import (
     ApplicationHealth
 )
 from kiali_qe.entities.overview import Overview
-from kiali_qe.utils import to_linear_string
+from kiali_qe.utils import filter_by_names, to_linear_string
+from kiali_qe.utils.cache import ResponseCache
 from kiali_qe.utils.date import parse_from_rest, from_rest_to_ui
+from kiali_qe.utils.log import logger
+from kiali_qe.utils.parallel import parallel_map
 
 ISTIO_CONFIG_TYPES = {'DestinationRule': 'destinationrules',
                       'VirtualService': 'virtualservices',
@@ -49,9 +54,69 @@ ISTIO_CONFIG_TYPES = {'DestinationRule': 'destinationrules',
                       'ServiceRole': 'serviceroles',
                       'ServiceRoleBinding': 'servicerolebindings'}
 
+# Istio Config types in istioConfigList response, in the order of the list:
+# (response key, key of the items or None when the value is the list,
+#  object type, key of the subtype shown in object type or None,
+#  config type used for validation or None for the types listed as Rule)
+ISTIO_CONFIG_LIST_TYPES = [
+    ('destinationRules', 'items', OBJECT_TYPE.DESTINATION_RULE, None, 'destinationrules'),
+    ('rules', None, OBJECT_TYPE.RULE, None, None),
+    ('adapters', None, OBJECT_TYPE.ADAPTER, 'adapter', None),
+    ('templates', None, OBJECT_TYPE.TEMPLATE, 'template', None),
+    ('virtualServices', 'items', OBJECT_TYPE.VIRTUAL_SERVICE, None, 'virtualservices'),
+    ('quotaSpecs', None, OBJECT_TYPE.QUOTA_SPEC, None, 'quotaspecs'),
+    ('quotaSpecBindings', None, OBJECT_TYPE.QUOTA_SPEC_BINDING, None, 'quotaspecbindings'),
+    ('policies', None, OBJECT_TYPE.POLICY, None, 'policies'),
+    ('meshPolicies', None, OBJECT_TYPE.MESH_POLICY, None, 'meshpolicies'),
+    ('gateways', None, OBJECT_TYPE.GATEWAY, None, 'gateways'),
+    ('serviceEntries', None, OBJECT_TYPE.SERVICE_ENTRY, None, 'serviceentries'),
+    ('clusterRbacConfigs', None, OBJECT_TYPE.CLUSTER_RBAC_CONFIG, None, 'clusterrbacconfigs'),
+    ('rbacConfigs', None, OBJECT_TYPE.RBAC_CONFIG, None, 'rbacconfigs'),
+    ('serviceRoles', None, OBJECT_TYPE.SERVICE_ROLE, None, 'serviceroles'),
+    ('serviceRoleBindings', None, OBJECT_TYPE.SERVICE_ROLE_BINDING, None, 'servicerolebindings'),
+]
+
+HEALTH_PARSERS = {'app': ApplicationHealth,
+                  'service': ServiceHealth,
+                  'workload': WorkloadHealth}
+
 
 class KialiExtendedClient(KialiClient):
 
+    def __init__(self, bulk_health=False, bulk_validations=False, max_workers=1,
+                 cache_size=0, cache_ttl=60, cache_ttls=None, **kwargs):
+        """
+        Args:
+            bulk_health: if True, health of list items is fetched once per namespace
+                and per item lookup is used only for items missing in that response
+            bulk_validations: if True, validations of Istio Configs are fetched once per namespace
+                and per item lookup is used only for items missing in that response
+            max_workers: maximum number of requests in flight at the same time,
+                1 runs all the requests sequentially
+            cache_size: maximum number of cached GET responses, 0 disables the cache
+            cache_ttl: default time to live of cached responses in seconds
+            cache_ttls: time to live in seconds per method name, 0 disables caching of the method
+            kwargs: passed to KialiClient
+        """
+        super(KialiExtendedClient, self).__init__(**kwargs)
+        self.bulk_health = bulk_health
+        self.bulk_validations = bulk_validations
+        self.max_workers = max_workers if max_workers else 1
+        self._in_flight = BoundedSemaphore(self.max_workers)
+        self._cache = ResponseCache(size=cache_size, ttl=cache_ttl, ttls=cache_ttls) \
+            if cache_size else None
+
+    def invalidate_cache(self, namespace=None):
+        """ Removes all the cached responses, the lists over namespaces include every namespace
+        Args:
+            namespace: namespace of the change
+        """
+        if self._cache:
+            self._cache.invalidate()
+
+    def _map(self, func, items):
+        return parallel_map(func, items, max_workers=self.max_workers)
+
     def namespace_list(self):
         """ Returns list of namespaces """
         entities = []
@@ -77,41 +142,48 @@ class KialiExtendedClient(KialiClient):
         else:
             namespace_list = self.namespace_list()
         # update items
-        for _namespace in namespace_list:
-            _data = self.get_response('serviceList', namespace=_namespace)
-            _services = _data['services']
-            # update all the services to our custom entity
-            for _service_rest in _services:
-                _service = Service(
-                    namespace=_namespace,
-                    name=_service_rest['name'],
-                    istio_sidecar=_service_rest['istioSidecar'],
-                    health=self.get_service_health(
-                        namespace=_namespace,
-                        service_name=_service_rest['name'],
-                        istioSidecar=_service_rest['istioSidecar']))
-                items.append(_service)
-        # filter by service name
-        if len(service_names) > 0:
-            filtered_list = []
-            for _name in service_names:
-                filtered_list.extend([_i for _i in items if _name in _i.name])
-            return set(filtered_list)
+        for _services in self._map(
+                lambda _namespace: self._namespace_service_list(_namespace, service_names),
+                namespace_list):
+            items.extend(_services)
         return items
 
+    def _namespace_service_list(self, namespace, service_names=[]):
+        _data = self.get_response('serviceList', namespace=namespace)
+        # filter by service name before health lookups
+        _services = filter_by_names(_data['services'], service_names, key=itemgetter('name'))
+        _health_map = self._get_health_map(namespace, 'service', _services)
+
+        # update all the services to our custom entity
+        def _to_service(_service_rest):
+            _health = None
+            if _service_rest['istioSidecar']:
+                _health = _health_map.get(_service_rest['name'])
+            if _health is None:
+                _health = self.get_service_health(
+                    namespace=namespace,
+                    service_name=_service_rest['name'],
+                    istioSidecar=_service_rest['istioSidecar'])
+            return Service(
+                namespace=namespace,
+                name=_service_rest['name'],
+                istio_sidecar=_service_rest['istioSidecar'],
+                health=_health)
+        return self._map(_to_service, _services)
+
     def overview_list(self, namespaces=[], overview_type=OverviewPageType.APPS):
         """Returns list of overviews.
         Args:
             namespaces: can be zero or any number of namespaces
         """
-        overviews = []
         namespace_list = []
         if len(namespaces) > 0:
             namespace_list.extend(namespaces)
         else:
             namespace_list = self.namespace_list()
+
         # update items
-        for _namespace in namespace_list:
+        def _to_overview(_namespace):
             if overview_type == OverviewPageType.SERVICES:
                 _items = self.service_list([_namespace])
             elif overview_type == OverviewPageType.WORKLOADS:
@@ -132,7 +204,7 @@ class KialiExtendedClient(KialiClient):
                     _unhealthy += 1
                 if _item.health == HEALTH_TYPE.NA:
                     _na += 1
-            _overview = Overview(
+            return Overview(
                 overview_type=overview_type.text,
                 namespace=_namespace,
                 items=len(_items),
@@ -140,8 +212,7 @@ class KialiExtendedClient(KialiClient):
                 unhealthy=_unhealthy,
                 degraded=_degraded,
                 na=_na)
-            overviews.append(_overview)
-        return overviews
+        return self._map(_to_overview, namespace_list)
 
     def application_list(self, namespaces=[], application_names=[]):
         """Returns list of applications.
@@ -156,27 +227,34 @@ class KialiExtendedClient(KialiClient):
         else:
             namespace_list = self.namespace_list()
         # update items
-        for _namespace in namespace_list:
-            _data = self.get_response('appList', namespace=_namespace)
-            _applications = _data['applications']
-            if _applications:
-                for _application_rest in _applications:
-                    _application = Application(
-                        namespace=_namespace,
-                        name=_application_rest['name'],
-                        istio_sidecar=_application_rest['istioSidecar'],
-                        health=self.get_app_health(
-                            namespace=_namespace,
-                            app_name=_application_rest['name']))
-                    items.append(_application)
-        # filter by application name
-        if len(application_names) > 0:
-            filtered_list = []
-            for _name in application_names:
-                filtered_list.extend([_i for _i in items if _name in _i.name])
-            return set(filtered_list)
+        for _applications in self._map(
+                lambda _namespace: self._namespace_application_list(_namespace, application_names),
+                namespace_list):
+            items.extend(_applications)
         return items
 
+    def _namespace_application_list(self, namespace, application_names=[]):
+        _data = self.get_response('appList', namespace=namespace)
+        if not _data['applications']:
+            return []
+        # filter by application name before health lookups
+        _applications = filter_by_names(_data['applications'], application_names,
+                                        key=itemgetter('name'))
+        _health_map = self._get_health_map(namespace, 'app', _applications)
+
+        def _to_application(_application_rest):
+            _health = _health_map.get(_application_rest['name'])
+            if _health is None:
+                _health = self.get_app_health(
+                    namespace=namespace,
+                    app_name=_application_rest['name'])
+            return Application(
+                namespace=namespace,
+                name=_application_rest['name'],
+                istio_sidecar=_application_rest['istioSidecar'],
+                health=_health)
+        return self._map(_to_application, _applications)
+
     def workload_list(self, namespaces=[], workload_names=[]):
         """Returns list of workloads.
         Args:
@@ -190,35 +268,43 @@ class KialiExtendedClient(KialiClient):
         else:
             namespace_list = self.namespace_list()
         # update items
-        for _namespace in namespace_list:
-            _data = self.get_response('workloadList', namespace=_namespace)
-            _workloads = _data['workloads']
-            if _workloads:
-                for _workload_rest in _workloads:
-                    _labels = self.get_labels(_workload_rest)
-                    _workload = Workload(
-                        namespace=_namespace,
-                        name=_workload_rest['name'],
-                        workload_type=_workload_rest['type'],
-                        istio_sidecar=_workload_rest['istioSidecar'],
-                        app_label='app' in _labels.keys(),
-                        version_label='version' in _labels.keys(),
-                        health=self.get_workload_health(
-                            namespace=_namespace,
-                            workload_name=_workload_rest['name']))
-                    items.append(_workload)
-        # filter by workload name
-        if len(workload_names) > 0:
-            filtered_list = []
-            for _name in workload_names:
-                filtered_list.extend([_i for _i in items if _name in _i.name])
-            return set(filtered_list)
+        for _workloads in self._map(
+                lambda _namespace: self._namespace_workload_list(_namespace, workload_names),
+                namespace_list):
+            items.extend(_workloads)
         return items
 
-    def istio_config_list(self, namespaces=[], config_names=[]):
+    def _namespace_workload_list(self, namespace, workload_names=[]):
+        _data = self.get_response('workloadList', namespace=namespace)
+        if not _data['workloads']:
+            return []
+        # filter by workload name before health lookups
+        _workloads = filter_by_names(_data['workloads'], workload_names, key=itemgetter('name'))
+        _health_map = self._get_health_map(namespace, 'workload', _workloads)
+
+        def _to_workload(_workload_rest):
+            _labels = self.get_labels(_workload_rest)
+            _health = _health_map.get(_workload_rest['name'])
+            if _health is None:
+                _health = self.get_workload_health(
+                    namespace=namespace,
+                    workload_name=_workload_rest['name'])
+            return Workload(
+                namespace=namespace,
+                name=_workload_rest['name'],
+                workload_type=_workload_rest['type'],
+                istio_sidecar=_workload_rest['istioSidecar'],
+                app_label='app' in _labels.keys(),
+                version_label='version' in _labels.keys(),
+                health=_health)
+        return self._map(_to_workload, _workloads)
+
+    def istio_config_list(self, namespaces=[], config_names=[], object_types=[]):
         """Returns list of istio config.
         Args:
             namespaces: can be zero or any number of namespaces
+            config_names: can be zero or any number of config names
+            object_types: can be zero or any number of IstioConfigObjectType texts
         """
         items = []
         namespace_list = []
@@ -227,191 +313,76 @@ class KialiExtendedClient(KialiClient):
         else:
             namespace_list = self.namespace_list()
         # update items
-        for _namespace in namespace_list:
-            _data = self.get_response('istioConfigList', namespace=_namespace)
-
-            # update DestinationRule
-            if len(_data['destinationRules']) > 0 and len(_data['destinationRules']['items']) > 0:
-                for _policy in _data['destinationRules']['items']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.DESTINATION_RULE.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'destinationrules',
-                                                                    _policy['metadata']['name'])))
-
-            # update Rule
-            if len(_data['rules']) > 0:
-                for _policy in _data['rules']:
-                    items.append(Rule(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.RULE.text))
-
-            # update Rule with Adapter
-            if len(_data['adapters']) > 0:
-                for _policy in _data['adapters']:
-                    items.append(Rule(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type='{}: {}'.format(OBJECT_TYPE.ADAPTER.text, _policy['adapter'])))
-
-            # update Rule with Template
-            if len(_data['templates']) > 0:
-                for _policy in _data['templates']:
-                    items.append(Rule(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type='{}: {}'.format(
-                            OBJECT_TYPE.TEMPLATE.text, _policy['template'])))
-
-            # update VirtualService
-            if len(_data['virtualServices']) > 0 and len(_data['virtualServices']['items']) > 0:
-                for _policy in _data['virtualServices']['items']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.VIRTUAL_SERVICE.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'virtualservices',
-                                                                    _policy['metadata']['name'])))
-
-            # update QuotaSpec
-            if len(_data['quotaSpecs']) > 0:
-                for _policy in _data['quotaSpecs']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.QUOTA_SPEC.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'quotaspecs',
-                                                                    _policy['metadata']['name'])))
-
-            # update QuotaSpecBindings
-            if len(_data['quotaSpecBindings']) > 0:
-                for _policy in _data['quotaSpecBindings']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.QUOTA_SPEC_BINDING.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'quotaspecbindings',
-                                                                    _policy['metadata']['name'])))
-
-            # update Policy
-            if len(_data['policies']) > 0:
-                for _policy in _data['policies']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.POLICY.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'policies',
-                                                                    _policy['metadata']['name'])))
-
-            # update MeshPolicy
-            if len(_data['meshPolicies']) > 0:
-                for _policy in _data['meshPolicies']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.MESH_POLICY.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'meshpolicies',
-                                                                    _policy['metadata']['name'])))
-
-            # update Gateway
-            if len(_data['gateways']) > 0:
-                for _policy in _data['gateways']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.GATEWAY.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'gateways',
-                                                                    _policy['metadata']['name'])))
-
-            # update serviceEntries
-            if len(_data['serviceEntries']) > 0:
-                for _policy in _data['serviceEntries']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.SERVICE_ENTRY.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'serviceentries',
-                                                                    _policy['metadata']['name'])))
-
-            # update clusterRbacConfigs
-            if len(_data['clusterRbacConfigs']) > 0:
-                for _policy in _data['clusterRbacConfigs']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.CLUSTER_RBAC_CONFIG.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'clusterrbacconfigs',
-                                                                    _policy['metadata']['name'])))
-
-            # update rbacConfigs
-            if len(_data['rbacConfigs']) > 0:
-                for _policy in _data['rbacConfigs']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.RBAC_CONFIG.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'rbacconfigs',
-                                                                    _policy['metadata']['name'])))
-
-            # update serviceRoles
-            if len(_data['serviceRoles']) > 0:
-                for _policy in _data['serviceRoles']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.SERVICE_ROLE.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'serviceroles',
-                                                                    _policy['metadata']['name'])))
-
-            # update serviceRoleBindings
-            if len(_data['serviceRoleBindings']) > 0:
-                for _policy in _data['serviceRoleBindings']:
-                    items.append(IstioConfig(
-                        name=_policy['metadata']['name'],
-                        namespace=_namespace,
-                        object_type=OBJECT_TYPE.SERVICE_ROLE_BINDING.text,
-                        validation=self.get_istio_config_validation(_namespace,
-                                                                    'servicerolebindings',
-                                                                    _policy['metadata']['name'])))
-
-            # not required at this stage. These options not availabe in UI
-            # # update all the rules to our custom entity
-            # for _rule_rest in _rules:
-            #     # update actions
-            #     _actions = []
-            #     for _action_r in _rule_rest['actions']:
-            #         _actions.append(Action.get_from_rest(_action_r))
-            #     _match = None
-            #     if 'match' in _rule_rest:
-            #         _match = _rule_rest['match']
-            #     _rule = Rule(
-            #         namespace=_namespace,
-            #         name=_rule_rest['name'],
-            #         actions=_actions,
-            #         match=_match)
-            #     items.append(_rule)
-
-        # apply filters
-        if len(config_names) > 0:
-            name_filtered_list = []
-            for _name in config_names:
-                name_filtered_list.extend([_i for _i in items if _name in _i.name])
-            return set(name_filtered_list)
+        for _configs in self._map(
+                lambda _namespace: self._namespace_istio_config_list(
+                    _namespace, config_names, object_types),
+                namespace_list):
+            items.extend(_configs)
         return items
 
+    def _namespace_istio_config_list(self, namespace, config_names=[], object_types=[]):
+        _items = []
+        # validations are fetched at the end, concurrently
+        _to_validate = []
+        _data = self.get_response('istioConfigList', namespace=namespace)
+
+        for _key, _items_key, _object_type, _subtype_key, _config_type in ISTIO_CONFIG_LIST_TYPES:
+            # skip types which are not asked for
+            if len(object_types) > 0 and _object_type.text not in object_types:
+                continue
+            _configs_rest = _data.get(_key)
+            if _configs_rest and _items_key:
+                _configs_rest = _configs_rest[_items_key]
+            if not _configs_rest:
+                continue
+            # filter by config name before validation lookups
+            for _config_rest in filter_by_names(_configs_rest, config_names,
+                                                key=lambda _config: _config['metadata']['name']):
+                if _subtype_key:
+                    _type_text = '{}: {}'.format(_object_type.text, _config_rest[_subtype_key])
+                else:
+                    _type_text = _object_type.text
+                if _config_type:
+                    _items.append(IstioConfig(
+                        name=_config_rest['metadata']['name'],
+                        namespace=namespace,
+                        object_type=_type_text))
+                    _to_validate.append((_items[-1], _config_type))
+                else:
+                    _items.append(Rule(
+                        name=_config_rest['metadata']['name'],
+                        namespace=namespace,
+                        object_type=_type_text))
+
+        # not required at this stage. These options not availabe in UI
+        # # update all the rules to our custom entity
+        # for _rule_rest in _rules:
+        #     # update actions
+        #     _actions = []
+        #     for _action_r in _rule_rest['actions']:
+        #         _actions.append(Action.get_from_rest(_action_r))
+        #     _match = None
+        #     if 'match' in _rule_rest:
+        #         _match = _rule_rest['match']
+        #     _rule = Rule(
+        #         namespace=namespace,
+        #         name=_rule_rest['name'],
+        #         actions=_actions,
+        #         match=_match)
+        #     _items.append(_rule)
+
+        _validation_map = self._get_validation_map(namespace, _to_validate)
+
+        def _update_validation(_item):
+            _config, _config_type = _item
+            _config.validation = _validation_map.get((_config_type, _config.name))
+            if _config.validation is None:
+                _config.validation = self.get_istio_config_validation(namespace,
+                                                                      _config_type,
+                                                                      _config.name)
+        self._map(_update_validation, _to_validate)
+        return _items
+
     def istio_config_details(self, namespace, object_type, object_name):
         """Returns details of istio config.
         Args:
@@ -607,8 +578,6 @@ class KialiExtendedClient(KialiClient):
                                            workload=workload_name)
         _workload = None
         if _workload_data:
-            _workload_rest = self.workload_list(namespaces=[namespace],
-                                                workload_names=[workload_name]).pop()
             _services = []
             if _workload_data['services']:
                 for _ws_data in _workload_data['services']:
@@ -692,7 +661,7 @@ class KialiExtendedClient(KialiClient):
 
             _workload = WorkloadDetails(
                 name=_workload_data['name'],
-                istio_sidecar=_workload_rest.istio_sidecar,
+                istio_sidecar=_workload_data['istioSidecar'],
                 workload_type=_workload_data['type'],
                 created_at=parse_from_rest(_workload_data['createdAt']),
                 resource_version=_workload_data['resourceVersion'],
@@ -789,6 +758,34 @@ class KialiExtendedClient(KialiClient):
         else:
             return None
 
+    def get_namespace_health(self, namespace, health_type):
+        """Returns Health of all items of one type in Namespace, in one request.
+        Args:
+            namespace: namespace where items are located
+            health_type: type of items, 'app', 'service' or 'workload'
+        Returns:
+            dict of item name and health, empty dict when bulk health is not available
+        """
+
+        try:
+            _health_data = self.get_response('namespaceHealth',
+                                             params={'type': health_type},
+                                             namespace=namespace)
+        except Exception as ex:
+            logger.warning('Namespace health is not available for {}: {}'.format(namespace, ex))
+            return {}
+        _health_map = {}
+        if _health_data:
+            for _name, _health_rest in _health_data.items():
+                _health_map[_name] = HEALTH_PARSERS[health_type].get_from_rest(
+                    _health_rest).is_healthy()
+        return _health_map
+
+    def _get_health_map(self, namespace, health_type, items_rest):
+        if not self.bulk_health or not items_rest:
+            return {}
+        return self.get_namespace_health(namespace=namespace, health_type=health_type)
+
     def get_istio_config_validation(self, namespace, object_type, object_name):
         """Returns Validation of Istio Config.
         Args:
@@ -801,9 +798,12 @@ class KialiExtendedClient(KialiClient):
                                            namespace=namespace,
                                            object_type=object_type,
                                            object=object_name)
-        if _health_data:
-            if len(_health_data['checks']) > 0:
-                if 'error' in set(check['severity'] for check in _health_data['checks']):
+        return self._get_validation_type(_health_data)
+
+    def _get_validation_type(self, validation_rest):
+        if validation_rest:
+            if len(validation_rest['checks']) > 0:
+                if 'error' in set(check['severity'] for check in validation_rest['checks']):
                     return IstioConfigValidation.NOT_VALID
                 else:
                     return IstioConfigValidation.WARNING
@@ -812,6 +812,38 @@ class KialiExtendedClient(KialiClient):
         else:
             return IstioConfigValidation.NA
 
+    def get_namespace_validations(self, namespace):
+        """Returns Validations of all Istio Configs in Namespace, in one request.
+        Args:
+            namespace: namespace where Configs are located
+        Returns:
+            dict of (object_type, object_name) and validation, object_type as in ISTIO_CONFIG_TYPES
+            values, empty dict when bulk validations are not available
+        """
+
+        try:
+            _validations_data = self.get_response('namespaceValidations', namespace=namespace)
+        except Exception as ex:
+            logger.warning('Namespace validations are not available for {}: {}'.format(
+                namespace, ex))
+            return {}
+        # validations are grouped by lower case kind of the config
+        _config_types = {_kind.lower(): _type for _kind, _type in ISTIO_CONFIG_TYPES.items()}
+        _validation_map = {}
+        if _validations_data and namespace in _validations_data:
+            for _kind, _validations in _validations_data[namespace].items():
+                if _kind not in _config_types:
+                    continue
+                for _name, _validation_rest in _validations.items():
+                    _validation_map[(_config_types[_kind], _name)] = \
+                        self._get_validation_type(_validation_rest)
+        return _validation_map
+
+    def _get_validation_map(self, namespace, configs):
+        if not self.bulk_validations or not configs:
+            return {}
+        return self.get_namespace_validations(namespace=namespace)
+
     def get_istio_config_messages(self, namespace, object_type, object_name):
         """Returns Validation Messages of Istio Config.
         Args:
@@ -885,27 +917,48 @@ class KialiExtendedClient(KialiClient):
                     _labels[_subset['name']] = _values
         return _labels
 
-    def get_response(self, method_name, **kwargs):
-        return super(KialiExtendedClient, self).request(method_name=method_name, path=kwargs).json()
+    def _request(self, **kwargs):
+        # limits the number of requests in flight when lists are fetched concurrently
+        with self._in_flight:
+            return super(KialiExtendedClient, self).request(**kwargs)
+
+    def _get_json(self, method_name, path, params=None):
+        if not self._cache:
+            return self._request(method_name=method_name, path=path, params=params).json()
+        _key = ResponseCache.key(method_name, path, params)
+        _response = self._cache.get(_key)
+        if _response is None:
+            _response = self._request(method_name=method_name, path=path, params=params).json()
+            self._cache.put(_key, _response)
+        return _response
+
+    def get_response(self, method_name, params=None, **kwargs):
+        return self._get_json(method_name, path=kwargs, params=params)
+
+    def _change(self, **kwargs):
+        # reads in flight during the request may cache the old state,
+        # so the cache is dropped again when the request returns
+        self.invalidate_cache()
+        try:
+            return self._request(**kwargs)
+        finally:
+            self.invalidate_cache()
 
     def post_response(self, method_name, data, **kwargs):
-        return super(KialiExtendedClient, self).request(
+        return self._change(
             method_name=method_name,
             path=kwargs,
             http_method="POST",
             data=json.dumps(data))
 
     def delete_response(self, method_name, **kwargs):
-        return super(KialiExtendedClient, self).request(
+        return self._change(
             method_name=method_name,
             path=kwargs,
             http_method="DELETE")
 
     def get_validation(self, method_name, **kwargs):
-        response = super(KialiExtendedClient, self).request(
-            method_name=method_name,
-            path=kwargs,
-            params={'validate': 'true'}).json()
+        response = self._get_json(method_name, path=kwargs, params={'validate': 'true'})
         return response['validation'] if 'validation' in response else None
 
     def get_pod_status(self, istioSidecar, pod_data):
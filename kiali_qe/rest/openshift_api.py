@@ -1,5 +1,10 @@
+import json
+import os
 import re
+import time
+from threading import Lock
 from kubernetes import config
+from kubernetes.client import VersionApi
 from openshift.dynamic import DynamicClient
 from openshift.dynamic.exceptions import NotFoundError
 
@@ -12,7 +17,10 @@ from kiali_qe.entities.applications import (
     ApplicationDetails,
     AppWorkload
 )
+from kiali_qe.rest.informer import Informer
+from kiali_qe.utils import filter_by_names
 from kiali_qe.utils.date import parse_from_rest
+from kiali_qe.utils.parallel import parallel_map
 
 
 class OpenshiftExtendedClient(object):
@@ -53,16 +61,92 @@ class OpenshiftExtendedClient(object):
 
     WORKLOAD_NAME_REGEX = re.compile('(-(\\w{1,8}\\d+\\w{1,8}))(-(\\w{0,7}\\d+\\w{0,7})$)?')
 
-    def __init__(self):
+    def __init__(self, max_workers=1, discovery_cache_file=None, discovery_cache_ttl=None,
+                 on_change=None, informers=False, informer_watch_timeout=300, page_size=500):
+        """
+        Args:
+            max_workers: maximum number of API server requests in flight,
+                1 runs all the requests sequentially
+            discovery_cache_file: file to persist the resource discovery between sessions, optional
+            discovery_cache_ttl: seconds after which the discovery cache file is refreshed,
+                never when not set
+            on_change: called with the namespace after an Istio Config is created or deleted,
+                optional
+            informers: lists each resource kind once and keeps it up to date by watching it,
+                the lists are read from memory then
+            informer_watch_timeout: seconds after which the watch streams are started again
+            page_size: number of items per list request of the iter_* methods
+        """
+        self.on_change = on_change
+        self.max_workers = max_workers if max_workers else 1
+        self.page_size = page_size
+        self.informers = informers
+        self.informer_watch_timeout = informer_watch_timeout
+        # resource handles, keyed by (kind, api_version), resolved once per session
+        self._resources = {}
+        # started informers, keyed by (kind, group_version) of the resource
+        self._informers = {}
+        self._informers_lock = Lock()
         self._k8s_client = config.new_client_from_config()
-        self._dyn_client = DynamicClient(self._k8s_client)
+        if discovery_cache_file:
+            self._expire_discovery_cache(discovery_cache_file, discovery_cache_ttl)
+            self._dyn_client = DynamicClient(self._k8s_client, cache_file=discovery_cache_file)
+            self._check_discovery_cache_version()
+        else:
+            self._dyn_client = DynamicClient(self._k8s_client)
 
     @property
     def version(self):
         return self._dyn_client.version
 
+    def _expire_discovery_cache(self, cache_file, ttl):
+        """ Removes the discovery cache file when it is older than ttl seconds """
+        if ttl and os.path.exists(cache_file) \
+                and time.time() - os.path.getmtime(cache_file) > ttl:
+            os.remove(cache_file)
+
+    def _check_discovery_cache_version(self):
+        """ Refreshes the discovery cache loaded from disk when the cluster version changed """
+        _cached_version = self.version.get('kubernetes', {}).get('gitVersion')
+        if _cached_version != VersionApi(self._k8s_client).get_code().git_version:
+            self._dyn_client.resources.invalidate_cache()
+            self._resources = {}
+
     def _resource(self, kind, api_version='v1'):
-        return self._dyn_client.resources.get(kind=kind, api_version=api_version)
+        _key = (kind, api_version)
+        if _key not in self._resources:
+            self._resources[_key] = self._dyn_client.resources.get(
+                kind=kind, api_version=api_version)
+        return self._resources[_key]
+
+    def _informer_key(self, resource):
+        return (resource.kind, resource.group_version)
+
+    def _informers_of(self, resources):
+        """ Returns started Informer per resource, the missing ones are started concurrently """
+        with self._informers_lock:
+            _missing = {}
+            for _resource in resources:
+                _key = self._informer_key(_resource)
+                if _key not in self._informers and _key not in _missing:
+                    _missing[_key] = Informer(_resource, watch_timeout=self.informer_watch_timeout)
+            # the initial lists run concurrently
+            parallel_map(lambda _informer: _informer.start(), list(_missing.values()),
+                         max_workers=self.max_workers)
+            self._informers.update(_missing)
+            return [self._informers[self._informer_key(_resource)] for _resource in resources]
+
+    def _started_informer(self, resource):
+        """ Returns Informer of the resource when it is started, None otherwise """
+        with self._informers_lock:
+            return self._informers.get(self._informer_key(resource))
+
+    def close(self):
+        """ Stops the informers """
+        with self._informers_lock:
+            for _informer in self._informers.values():
+                _informer.stop()
+            self._informers = {}
 
     @property
     def _namespace(self):
@@ -181,14 +265,15 @@ class OpenshiftExtendedClient(object):
 
     def namespace_list(self):
         """ Returns list of namespaces """
-        _response = self._namespace.get()
         namespaces = []
-        for _item in _response.items:
-            namespaces.append(_item.metadata.name)
+        for _item in self._raw_items_list(['_namespace'])[0]:
+            namespaces.append(_item['metadata']['name'])
         return namespaces
 
     def namespace_exists(self, namespace):
         """ Returns True if given namespace exists. False otherwise. """
+        if self.informers:
+            return self._informers_of([self._namespace])[0].store.get(None, namespace) is not None
         try:
             self._namespace.get(name=namespace)
             return True
@@ -207,12 +292,9 @@ class OpenshiftExtendedClient(object):
             result[name+workload.namespace] = Application(name,
                                                           workload.namespace,
                                                           istio_sidecar=workload.istio_sidecar)
-        # filter by service name
+        # filter by application name
         if len(application_names) > 0:
-            filtered_list = []
-            for _name in application_names:
-                filtered_list.extend([_i for _i in result.values() if _name in _i.name])
-            return set(filtered_list)
+            return filter_by_names(list(result.values()), application_names)
         return result.values()
 
     def service_list(self, namespaces=[], service_names=[]):
@@ -220,97 +302,171 @@ class OpenshiftExtendedClient(object):
         Args:
             namespace: Namespace of the service, optional
         """
+        _raw_items = self._raw_items_list(['_service'], namespaces=namespaces)[0]
+        return self._service_list(_raw_items, service_names=service_names)
+
+    def iter_services(self, namespaces=[], service_names=[]):
+        """ Yields services as the pages of the list arrive, see _iter_raw_pages
+        Args:
+            namespaces: Namespaces of the services, optional. All namespaces when empty
+            service_names: Names of the services, optional
+        """
+        for _raw_items in self._iter_raw_pages('_service', namespaces=namespaces):
+            for _service in self._service_list(_raw_items, service_names=service_names):
+                yield _service
+
+    def _service_list(self, raw_items, service_names=[]):
+        """ Returns list of services
+        Args:
+            raw_items: the fetched items of services
+            service_names: Names of the services, optional
+        """
         items = []
-        _raw_items = []
-        if len(namespaces) > 0:
-            # update items
-            for _namespace in namespaces:
-                _response = self._service.get(namespace=_namespace)
-                _raw_items.extend(_response.items)
-        else:
-            _response = self._service.get()
-            _raw_items.extend(_response.items)
-        for _item in _raw_items:
+        # filter by service name
+        for _item in self._filter_raw_items(raw_items, service_names):
             # update all the services to our custom entity
             # TODO: heath needs to be added
             _service = Service(
-                namespace=_item.metadata.namespace,
-                name=_item.metadata.name,
+                namespace=_item['metadata']['namespace'],
+                name=_item['metadata']['name'],
                 istio_sidecar=self._contains_sidecar(_item),
                 app_label=self._get_label(_item, 'app'),
                 version_label=self._get_label(_item, 'version'),
                 health=None)
             items.append(_service)
-        # filter by service name
-        if len(service_names) > 0:
-            filtered_list = []
-            for _name in service_names:
-                filtered_list.extend([_i for _i in items if _name in _i.name])
-            return set(filtered_list)
         return items
 
     def workload_list(self, namespaces=[], workload_names=[]):
         """ Returns list of workloads """
         result = []
-        for _key, _value in self.WORKLOAD_TYPES.items():
+        _types = list(self.WORKLOAD_TYPES.items())
+        # all the workload types and namespaces are fetched concurrently
+        _raw_items_list = self._raw_items_list([_value for _key, _value in _types],
+                                               namespaces=namespaces)
+        for (_key, _value), _raw_items in zip(_types, _raw_items_list):
             # TODO apply Job filters
             # TODO apply Pod filters
-            result.extend(self._workload_list(_value, _key,
-                                              namespaces=namespaces,
+            result.extend(self._workload_list(_raw_items, _key,
                                               workload_names=workload_names))
 
         return result
 
-    def _workload_list(self, attribute_name, workload_type,
-                       namespaces=[], workload_names=[]):
+    def iter_workloads(self, namespaces=[], workload_names=[]):
+        """ Yields workloads as the pages of the lists arrive, one workload type after another,
+        see _iter_raw_pages
+        Args:
+            namespaces: Namespaces of the workloads, optional. All namespaces when empty
+            workload_names: Names of the workloads, optional
+        """
+        for _key, _value in self.WORKLOAD_TYPES.items():
+            for _raw_items in self._iter_raw_pages(_value, namespaces=namespaces):
+                for _workload in self._workload_list(_raw_items, _key,
+                                                     workload_names=workload_names):
+                    yield _workload
+
+    def _workload_list(self, raw_items, workload_type, workload_names=[]):
         """ Returns list of workload
         Args:
-            attribute_name: the attribute of class for getting workload
+            raw_items: the fetched items of workload type
             workload_type: the type of workload
-            namespace: Namespace of the workload, optional
             workload_names: Names of the workloads, optional
         """
         items = []
-        _raw_items = []
-        if len(namespaces) > 0:
-            # update items
-            for _namespace in namespaces:
-                _response = getattr(self, attribute_name).get(namespace=_namespace)
-                if hasattr(_response, 'items'):
-                    _raw_items.extend(_response.items)
-        else:
-            _response = getattr(self, attribute_name).get()
-            if hasattr(_response, 'items'):
-                _raw_items.extend(_response.items)
-        for _item in _raw_items:
+        # filter by workload name
+        for _item in self._filter_raw_items(raw_items, workload_names):
             # update all the workloads to our custom entity
             _workload = Workload(
-                name=_item.metadata.name,
-                namespace=_item.metadata.namespace,
+                name=_item['metadata']['name'],
+                namespace=_item['metadata']['namespace'],
                 workload_type=workload_type,
                 istio_sidecar=self._contains_sidecar(_item),
                 app_label=self._get_label(_item, 'app'),
                 version_label=self._get_label(_item, 'version'))
             items.append(_workload)
-        # filter by workload name
-        if len(workload_names) > 0:
-            filtered_list = []
-            for _name in workload_names:
-                filtered_list.extend([_i for _i in items if _name in _i.name])
-            return set(filtered_list)
         return items
 
+    def _raw_items_list(self, attribute_names, namespaces=[]):
+        """ Returns raw items of the resources, fetched concurrently.
+        Raw items are the decoded JSON items of the list responses, without
+        the ResourceInstance wrapping of the dynamic client
+        Args:
+            attribute_names: the attributes of class for getting resources
+            namespaces: Namespaces of the resources, optional. All namespaces when empty
+        Returns: list of raw items per attribute name, in the same order as attribute_names
+        """
+        if self.informers:
+            return [_informer.store.list(namespaces=namespaces) for _informer in
+                    self._informers_of([getattr(self, _name) for _name in attribute_names])]
+        _namespaces = namespaces if len(namespaces) > 0 else [None]
+        # resources are resolved here, only the list requests run concurrently
+        _requests = []
+        for _attribute_name in attribute_names:
+            _resource = getattr(self, _attribute_name)
+            for _namespace in _namespaces:
+                _requests.append((_resource, _namespace))
+
+        def _get(_request):
+            _resource, _namespace = _request
+            if _namespace is None:
+                _response = _resource.get(serialize=False)
+            else:
+                _response = _resource.get(namespace=_namespace, serialize=False)
+            return json.loads(_response.data.decode('utf8')).get('items') or []
+        _responses = parallel_map(_get, _requests, max_workers=self.max_workers)
+
+        result = []
+        for _index in range(len(attribute_names)):
+            _raw_items = []
+            for _items in _responses[_index * len(_namespaces):(_index + 1) * len(_namespaces)]:
+                _raw_items.extend(_items)
+            result.append(_raw_items)
+        return result
+
+    def _iter_raw_pages(self, attribute_name, namespaces=[]):
+        """ Yields raw items of the resource page by page, page_size items per request.
+        The pages are requested with the limit and continue tokens of the API server,
+        only one page is held in memory at a time.
+        Args:
+            attribute_name: the attribute of class for getting the resource
+            namespaces: Namespaces of the resources, optional. All namespaces when empty
+        """
+        _resource = getattr(self, attribute_name)
+        if self.informers:
+            # already in memory
+            yield self._informers_of([_resource])[0].store.list(namespaces=namespaces)
+            return
+        # cluster resources are listed once
+        _namespaces = namespaces if len(namespaces) > 0 and _resource.namespaced else [None]
+        for _namespace in _namespaces:
+            _continue = None
+            while True:
+                _response = json.loads(_resource.get(
+                    namespace=_namespace, limit=self.page_size, _continue=_continue,
+                    serialize=False).data.decode('utf8'))
+                yield _response.get('items') or []
+                _continue = self._raw_value(_response, 'metadata', 'continue')
+                if not _continue:
+                    break
+
+    def _filter_raw_items(self, raw_items, names):
+        # names are matched as substrings like in UI, field selectors match exact names only
+        return filter_by_names(raw_items, names, key=lambda _item: _item['metadata']['name'])
+
+    def _raw_value(self, item, *keys):
+        """ Returns the value at the keys path of the raw item, None when missing """
+        for _key in keys:
+            if not isinstance(item, dict):
+                return None
+            item = item.get(_key)
+        return item
+
     def _contains_sidecar(self, item):
-        try:
-            return item.spec.template.metadata.annotations['sidecar.istio.io/status'] is not None
-        except (KeyError, AttributeError, TypeError):
-            return False
+        return self._raw_value(
+            item, 'spec', 'template', 'metadata', 'annotations',
+            'sidecar.istio.io/status') is not None
 
     def _get_label(self, item, label):
-        try:
-            return item.metadata.labels[label]
-        except (KeyError, AttributeError, TypeError):
-            return None
+        return self._raw_value(item, 'metadata', 'labels', label)
 
     def _get_app_name(self, workload):
         return workload.app_label if workload.app_label else re.sub(
@@ -324,72 +480,80 @@ class OpenshiftExtendedClient(object):
             '',
             workload.name)
 
-    def istio_config_list(self, namespaces=[], config_names=[]):
-        """ Returns list of Istio Configs """
+    def istio_config_list(self, namespaces=[], config_names=[], object_types=[]):
+        """ Returns list of Istio Configs
+        Args:
+            namespaces: Namespaces of the configs, optional
+            config_names: Names of the configs, optional
+            object_types: IstioConfigObjectType texts of the configs, optional
+        """
         result = []
-        for _key, _value in self.CONFIG_TYPES.items():
-            result.extend(self._resource_list(_value, _key,
-                                              namespaces=namespaces,
+        # only the types asked for are fetched
+        _types = [(_key, _value) for _key, _value in self.CONFIG_TYPES.items()
+                  if len(object_types) == 0 or re.sub(': .*', '', _key) in object_types]
+        # all the config types and namespaces are fetched concurrently
+        _raw_items_list = self._raw_items_list([_value for _key, _value in _types],
+                                               namespaces=namespaces)
+        for (_key, _value), _raw_items in zip(_types, _raw_items_list):
+            result.extend(self._resource_list(_raw_items, _key,
                                               resource_names=config_names))
         return result
 
-    def _resource_list(self, attribute_name, resource_type,
-                       namespaces=[], resource_names=[]):
+    def iter_istio_configs(self, namespaces=[], config_names=[], object_types=[]):
+        """ Yields Istio Configs as the pages of the lists arrive, one config type after another,
+        see _iter_raw_pages
+        Args:
+            namespaces: Namespaces of the configs, optional. All namespaces when empty
+            config_names: Names of the configs, optional
+            object_types: IstioConfigObjectType texts of the configs, optional
+        """
+        for _key, _value in self.CONFIG_TYPES.items():
+            if len(object_types) > 0 and re.sub(': .*', '', _key) not in object_types:
+                continue
+            for _raw_items in self._iter_raw_pages(_value, namespaces=namespaces):
+                for _config in self._resource_list(_raw_items, _key,
+                                                   resource_names=config_names):
+                    yield _config
+
+    def _resource_list(self, raw_items, resource_type, resource_names=[]):
         """ Returns list of Resource
         Args:
-            attribute_name: the attribute of class for getting resource
+            raw_items: the fetched items of resource type
             resource_type: the type of resource
-            namespace: Namespace of the resource, optional
             resource_names: Names of the r, optional
         """
         resource_type = re.sub(': .*', '', resource_type)
         items = []
-        _raw_items = []
-        if len(namespaces) > 0:
-            # update items
-            for _namespace in namespaces:
-                _response = getattr(self, attribute_name).get(namespace=_namespace)
-                if hasattr(_response, 'items'):
-                    _raw_items.extend(_response.items)
-        else:
-            _response = getattr(self, attribute_name).get()
-            if hasattr(_response, 'items'):
-                _raw_items.extend(_response.items)
-        for _item in _raw_items:
+        # filter by resource name
+        for _item in self._filter_raw_items(raw_items, resource_names):
             if str(resource_type) == IstioConfigObjectType.RULE.text:
-                _rule = Rule(name=_item.metadata.name,
-                             namespace=_item.metadata.namespace,
+                _rule = Rule(name=_item['metadata']['name'],
+                             namespace=_item['metadata']['namespace'],
                              object_type=resource_type)
                 # append this item to the final list
                 items.append(_rule)
             elif str(resource_type) == IstioConfigObjectType.ADAPTER.text or\
                     str(resource_type) == IstioConfigObjectType.TEMPLATE.text:
-                _rule = Rule(name=_item.metadata.name,
-                             namespace=_item.metadata.namespace,
+                _rule = Rule(name=_item['metadata']['name'],
+                             namespace=_item['metadata']['namespace'],
                              object_type='{}: {}'.format(
-                                 resource_type, _item.kind))
+                                 resource_type, _item.get('kind')))
                 # append this item to the final list
                 items.append(_rule)
             elif str(resource_type) == IstioConfigObjectType.MESH_POLICY.text or\
                     str(resource_type) == IstioConfigObjectType.CLUSTER_RBAC_CONFIG.text:
-                _config = IstioConfig(name=_item.metadata.name,
+                _config = IstioConfig(name=_item['metadata']['name'],
                                       namespace="istio-system",
                                       object_type=resource_type)
                 if _config not in items:
                     # append this item to the final list
                     items.append(_config)
             else:
-                _config = IstioConfig(name=_item.metadata.name,
-                                      namespace=_item.metadata.namespace,
+                _config = IstioConfig(name=_item['metadata']['name'],
+                                      namespace=_item['metadata']['namespace'],
                                       object_type=resource_type)
                 # append this item to the final list
                 items.append(_config)
-        # filter by resource name
-        if len(resource_names) > 0:
-            filtered_list = []
-            for _name in resource_names:
-                filtered_list.extend([_i for _i in items if _name in _i.name])
-            return set(filtered_list)
         return items
 
     def application_details(self, namespace, application_name):
@@ -496,13 +660,30 @@ class OpenshiftExtendedClient(object):
         return config
 
     def delete_istio_config(self, name, namespace, kind, api_version):
+        _resource = self._istio_config(kind=kind, api_version=api_version)
         try:
-            self._istio_config(kind=kind, api_version=api_version).delete(name=name,
-                                                                          namespace=namespace)
+            _resource.delete(name=name, namespace=namespace)
         except NotFoundError:
             pass
+        finally:
+            self._notify_change(namespace)
+        # the change is seen by the next reads, without waiting for the watch event
+        _informer = self._started_informer(_resource)
+        if _informer:
+            _informer.store.delete(namespace if _resource.namespaced else None, name)
 
     def create_istio_config(self, body, namespace, kind, api_version):
-        resp = self._istio_config(kind=kind, api_version=api_version).create(body=body,
-                                                                             namespace=namespace)
+        _resource = self._istio_config(kind=kind, api_version=api_version)
+        try:
+            resp = _resource.create(body=body, namespace=namespace)
+        finally:
+            self._notify_change(namespace)
+        # the change is seen by the next reads, without waiting for the watch event
+        _informer = self._started_informer(_resource)
+        if _informer:
+            _informer.store.upsert(resp.to_dict())
         return resp
+
+    def _notify_change(self, namespace):
+        if self.on_change:
+            self.on_change(namespace)
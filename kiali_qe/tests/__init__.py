@@ -21,6 +21,8 @@ from kiali_qe.components.enums import (
 )
 from kiali_qe.utils import is_equal, is_sublist
 from kiali_qe.utils.log import logger
+from kiali_qe.utils.matcher import match_items
+from kiali_qe.utils.parallel import background
 
 from kiali_qe.pages import (
     ServicesPage,
@@ -42,6 +44,16 @@ class AbstractListPageTest(object):
     def _namespaces_ui(self):
         return self.page.namespace.items
 
+    def _openshift_items(self, iter_name, list_name, **kwargs):
+        """ Returns the items of OpenShift client, read page by page by its iter_name method.
+        Kiali client stands in for OpenShift client with cfg.kiali.skip_oc,
+        its list_name method is used then
+        """
+        _iter = getattr(self.openshift_client, iter_name, None)
+        if _iter is None:
+            return getattr(self.openshift_client, list_name)(**kwargs)
+        return list(_iter(**kwargs))
+
     def get_mesh_wide_tls(self):
         return self.page.content.get_mesh_wide_tls()
 
@@ -79,23 +91,13 @@ class AbstractListPageTest(object):
             Default True.
             If this value is True, all existing applied namespaces will be removed.
         """
-        _pre_filters = []
         # clear all filters
         if force_clear_all:
             self.page.namespace.clear_all()
             assert len(self.page.namespace.checked_items) == 0
-        else:
-            _pre_filters.extend(self.page.namespace.checked_items)
 
-        # apply namespaces
-        for _filter in namespaces:
-            if _filter not in _pre_filters:
-                self.page.namespace.check(_filter)
-            if _filter in _pre_filters:
-                _pre_filters.remove(_filter)
-        # remove filters not in list
-        for _filter in _pre_filters:
-            self.page.namespace.uncheck(_filter)
+        # apply namespaces and remove namespaces not in list, in one go
+        self.page.namespace.set_checked(namespaces)
 
         self.assert_applied_namespaces(namespaces)
 
@@ -135,6 +137,39 @@ class AbstractListPageTest(object):
 
         self.assert_applied_filters(filters)
 
+    def apply_namespaces_and_filters(self, namespaces, filters, force_clear_all=True,
+                                     force_load=False):
+        """
+        Apply supplied namespaces and filters in to UI.
+        Loads the page with namespaces and filters in the URL when supported,
+        otherwise or when the URL state is not applied, applies them one by one.
+
+        Parameters
+        ----------
+        namespaces : list
+            A list for namespace names.
+        filters : list
+            A list for filter. filter should be a dict.
+            filter = {'name': 'Health', 'value': 'Healthy'}
+        force_clear_all : boolean
+            Default True.
+            If this value is False, filters are adjusted one by one with pre filter.
+        force_load : boolean
+            Default False.
+            If this value is True, the page is loaded before applying one by one.
+        """
+        if force_clear_all and self.page.load_url(namespaces=namespaces, filters=filters):
+            _namespaces = self.page.namespace.checked_items
+            _filters = self.page.filter.active_filters
+            if is_equal(namespaces, _namespaces) and is_equal(filters, _filters):
+                return
+            logger.debug('URL state not applied, Namespaces:{}, Filters:{}'.format(
+                _namespaces, _filters))
+        elif force_load:
+            self.page.load(force_load=True)
+        self.apply_namespaces(namespaces, force_clear_all=force_clear_all)
+        self.apply_filters(filters=filters, force_clear_all=force_clear_all)
+
     def assert_filter_options(self):
         # test available options
         options_defined = [item.text for item in self.FILTER_ENUM]
@@ -340,15 +375,17 @@ class OverviewPageTest(AbstractListPageTest):
 
         if force_refresh:
             self.page.page_refresh()
-        # get overviews from ui
-        overviews_ui = self.page.content.all_items
-        # get overviews from rest api
+        # get overviews from rest api, in background while reading the ui
         _ns = self.FILTER_ENUM.NAME.text
         _namespaces = [_f['value'] for _f in filters if _f['name'] == _ns]
         logger.debug('Namespaces:{}'.format(_namespaces))
-        overviews_rest = self.kiali_client.overview_list(
+        _overviews_rest = background(
+            self.kiali_client.overview_list,
             namespaces=_namespaces,
             overview_type=overview_type)
+        # get overviews from ui
+        overviews_ui = self.page.content.all_items
+        overviews_rest = _overviews_rest.result()
 
         # compare all results
         logger.debug('Namespaces:{}'.format(_namespaces))
@@ -359,13 +396,8 @@ class OverviewPageTest(AbstractListPageTest):
 
         assert len(overviews_ui) == len(overviews_rest)
 
-        for overview_ui in overviews_ui:
-            found = False
-            for overview_rest in overviews_rest:
-                if overview_ui.is_equal(overview_rest, advanced_check=False):
-                    found = True
-                    break
-            assert found, '{} not found in REST {}'.format(overview_ui, overviews_rest)
+        _report = match_items(overviews_ui, overviews_rest, advanced_check=False)
+        assert _report.all_found, 'Overviews not found in REST:\n{}'.format(_report)
 
 
 class ApplicationsPageTest(AbstractListPageTest):
@@ -401,15 +433,12 @@ class ApplicationsPageTest(AbstractListPageTest):
 
     def assert_details(self, name, namespace, check_metrics=False, force_refresh=False):
         logger.debug('Details: {}, {}'.format(name, namespace))
-        # load the page first
-        self.page.load(force_load=True)
-
         # TODO apply pagination feature in get_details
-        # apply namespace
-        self.apply_namespaces(namespaces=[namespace])
-        # apply filters
-        self.apply_filters(filters=[
-            {'name': ApplicationsPageFilter.APP_NAME.text, 'value': name}])
+        # load the page with namespace and filters
+        self.apply_namespaces_and_filters(
+            namespaces=[namespace],
+            filters=[{'name': ApplicationsPageFilter.APP_NAME.text, 'value': name}],
+            force_load=True)
         # load application details page
         application_details_ui = self.page.content.get_details(name, namespace, force_refresh)
         assert application_details_ui
@@ -461,25 +490,25 @@ class ApplicationsPageTest(AbstractListPageTest):
             self.assert_metrics_options(application_details_ui.outbound_metrics)
 
     def assert_all_items(self, namespaces=[], filters=[], force_clear_all=True):
-        # apply namespaces
-        self.apply_namespaces(namespaces, force_clear_all=force_clear_all)
-
-        # apply filters
-        self.apply_filters(filters=filters, force_clear_all=force_clear_all)
+        # apply namespaces and filters
+        self.apply_namespaces_and_filters(namespaces, filters, force_clear_all=force_clear_all)
 
         # get applications from rest api
         _sn = self.FILTER_ENUM.APP_NAME.text
         _application_names = [_f['value'] for _f in filters if _f['name'] == _sn]
 
         logger.debug('Namespaces:{}, Application names:{}'.format(namespaces, _application_names))
-        # get applications from ui
-        applications_ui = self.page.content.all_items
-        # get from REST
-        applications_rest = self.kiali_client.application_list(
+        # get from REST and OC in background while reading the ui
+        _applications_rest = background(
+            self.kiali_client.application_list,
             namespaces=namespaces, application_names=_application_names)
-        # get from OC
-        applications_oc = self.openshift_client.application_list(
+        _applications_oc = background(
+            self.openshift_client.application_list,
             namespaces=namespaces, application_names=_application_names)
+        # get applications from ui
+        applications_ui = self.page.content.all_items
+        applications_rest = _applications_rest.result()
+        applications_oc = _applications_oc.result()
 
         # compare all results
         logger.debug('Namespaces:{}, Service names:{}'.format(namespaces, _application_names))
@@ -492,22 +521,10 @@ class ApplicationsPageTest(AbstractListPageTest):
         assert len(applications_ui) == len(applications_rest)
         assert len(applications_rest) <= len(applications_oc)
 
-        for application_ui in applications_ui:
-            found = False
-            for application_rest in applications_rest:
-                if application_ui.is_equal(application_rest, advanced_check=True):
-                    found = True
-                    break
-            if not found:
-                assert found, '{} not found in REST'.format(application_ui)
-            found = False
-            for application_oc in applications_oc:
-                logger.debug('{} {}'.format(application_oc.name, application_oc.namespace))
-                if application_ui.is_equal(application_oc, advanced_check=False):
-                    found = True
-                    break
-            if not found:
-                assert found, '{} not found in OC'.format(application_ui)
+        _report = match_items(applications_ui, applications_rest, advanced_check=True)
+        assert _report.all_found, 'Applications not found in REST:\n{}'.format(_report)
+        _report = match_items(applications_ui, applications_oc, advanced_check=False)
+        assert _report.all_found, 'Applications not found in OC:\n{}'.format(_report)
 
 
 class WorkloadsPageTest(AbstractListPageTest):
@@ -544,14 +561,12 @@ class WorkloadsPageTest(AbstractListPageTest):
     def assert_details(self, name, namespace, workload_type, check_metrics=False,
                        force_refresh=False):
         logger.debug('Details: {}, {}'.format(name, namespace))
-        # load the page first
-        self.page.load(force_load=True)
         # TODO apply pagination feature in get_details
-        # apply namespace
-        self.apply_namespaces(namespaces=[namespace])
-        # apply filters
-        self.apply_filters(filters=[
-            {'name': WorkloadsPageFilter.WORKLOAD_NAME.text, 'value': name}])
+        # load the page with namespace and filters
+        self.apply_namespaces_and_filters(
+            namespaces=[namespace],
+            filters=[{'name': WorkloadsPageFilter.WORKLOAD_NAME.text, 'value': name}],
+            force_load=True)
 
         # load workload details page
         workload_details_ui = self.page.content.get_details(name, namespace, force_refresh)
@@ -625,23 +640,23 @@ class WorkloadsPageTest(AbstractListPageTest):
             self.assert_metrics_options(workload_details_ui.outbound_metrics)
 
     def assert_all_items(self, namespaces=[], filters=[], force_clear_all=True):
-        # apply namespaces
-        self.apply_namespaces(namespaces, force_clear_all=force_clear_all)
+        # apply namespaces and filters
+        self.apply_namespaces_and_filters(namespaces, filters, force_clear_all=force_clear_all)
 
-        # apply filters
-        self.apply_filters(filters=filters, force_clear_all=force_clear_all)
-
-        # get workloads from ui
-        workloads_ui = self.page.content.all_items
-        # get workloads from rest api
+        # get workloads from rest api and OC client, in background while reading the ui
         _sn = self.FILTER_ENUM.WORKLOAD_NAME.text
         _workload_names = [_f['value'] for _f in filters if _f['name'] == _sn]
         logger.debug('Namespaces:{}, Workload names:{}'.format(namespaces, _workload_names))
-        workloads_rest = self.kiali_client.workload_list(
+        _workloads_rest = background(
+            self.kiali_client.workload_list,
             namespaces=namespaces, workload_names=_workload_names)
-        # get workloads from OC client
-        workloads_oc = self.openshift_client.workload_list(
+        _workloads_oc = background(
+            self._openshift_items, 'iter_workloads', 'workload_list',
             namespaces=namespaces, workload_names=_workload_names)
+        # get workloads from ui
+        workloads_ui = self.page.content.all_items
+        workloads_rest = _workloads_rest.result()
+        workloads_oc = _workloads_oc.result()
 
         # compare all results
         logger.debug('Namespaces:{}, Service names:{}'.format(namespaces, _workload_names))
@@ -655,21 +670,10 @@ class WorkloadsPageTest(AbstractListPageTest):
         # TODO when workloads are filtered put == here
         assert len(workloads_rest) <= len(workloads_oc)
 
-        for workload_ui in workloads_ui:
-            found = False
-            for workload_rest in workloads_rest:
-                if workload_ui.is_equal(workload_rest, advanced_check=True):
-                    found = True
-                    break
-            if not found:
-                assert found, '{} not found in REST'.format(workload_ui)
-            found = False
-            for workload_oc in workloads_oc:
-                if workload_ui.is_equal(workload_oc, advanced_check=False):
-                    found = True
-                    break
-            if not found:
-                assert found, '{} not found in OC'.format(workload_ui)
+        _report = match_items(workloads_ui, workloads_rest, advanced_check=True)
+        assert _report.all_found, 'Workloads not found in REST:\n{}'.format(_report)
+        _report = match_items(workloads_ui, workloads_oc, advanced_check=False)
+        assert _report.all_found, 'Workloads not found in OC:\n{}'.format(_report)
 
 
 class ServicesPageTest(AbstractListPageTest):
@@ -682,14 +686,12 @@ class ServicesPageTest(AbstractListPageTest):
         self.browser = browser
 
     def _prepare_load_details_page(self, name, namespace):
-        # load the page first
-        self.page.load(force_load=True)
         # TODO apply pagination feature in get_details
-        # apply namespace
-        self.apply_namespaces(namespaces=[namespace])
-        # apply filters
-        self.apply_filters(filters=[
-            {'name': ServicesPageFilter.SERVICE_NAME.text, 'value': name}])
+        # load the page with namespace and filters
+        self.apply_namespaces_and_filters(
+            namespaces=[namespace],
+            filters=[{'name': ServicesPageFilter.SERVICE_NAME.text, 'value': name}],
+            force_load=True)
 
     def load_details_page(self, name, namespace, force_refresh):
         self._prepare_load_details_page(name, namespace)
@@ -807,23 +809,23 @@ class ServicesPageTest(AbstractListPageTest):
         return set(workload_names)
 
     def assert_all_items(self, namespaces=[], filters=[], force_clear_all=True):
-        # apply namespaces
-        self.apply_namespaces(namespaces, force_clear_all=force_clear_all)
+        # apply namespaces and filters
+        self.apply_namespaces_and_filters(namespaces, filters, force_clear_all=force_clear_all)
 
-        # apply filters
-        self.apply_filters(filters=filters, force_clear_all=force_clear_all)
-
-        # get services from ui
-        services_ui = self.page.content.all_items
-        # get services from rest api
+        # get services from rest api and OC client, in background while reading the ui
         _sn = self.FILTER_ENUM.SERVICE_NAME.text
         _service_names = [_f['value'] for _f in filters if _f['name'] == _sn]
         logger.debug('Namespaces:{}, Service names:{}'.format(namespaces, _service_names))
-        services_rest = self.kiali_client.service_list(
+        _services_rest = background(
+            self.kiali_client.service_list,
             namespaces=namespaces, service_names=_service_names)
-        # get services from OC client
-        services_oc = self.openshift_client.service_list(
+        _services_oc = background(
+            self._openshift_items, 'iter_services', 'service_list',
             namespaces=namespaces, service_names=_service_names)
+        # get services from ui
+        services_ui = self.page.content.all_items
+        services_rest = _services_rest.result()
+        services_oc = _services_oc.result()
 
         # compare all results
         logger.debug('Namespaces:{}, Service names:{}'.format(namespaces, _service_names))
@@ -836,21 +838,10 @@ class ServicesPageTest(AbstractListPageTest):
         assert len(services_ui) == len(services_rest)
         assert len(services_rest) <= len(services_oc)
 
-        for service_ui in services_ui:
-            found = False
-            for service_rest in services_rest:
-                if service_ui.is_equal(service_rest, advanced_check=True):
-                    found = True
-                    break
-            if not found:
-                assert found, '{} not found in REST'.format(service_ui)
-            found = False
-            for service_oc in services_oc:
-                if service_ui.is_equal(service_oc, advanced_check=False):
-                    found = True
-                    break
-            if not found:
-                assert found, '{} not found in OC'.format(service_ui)
+        _report = match_items(services_ui, services_rest, advanced_check=True)
+        assert _report.all_found, 'Services not found in REST:\n{}'.format(_report)
+        _report = match_items(services_ui, services_oc, advanced_check=False)
+        assert _report.all_found, 'Services not found in OC:\n{}'.format(_report)
 
     def get_additional_filters(self, namespaces, current_filters):
         logger.debug('Current filters:{}'.format(current_filters))
@@ -966,49 +957,40 @@ class IstioConfigPageTest(AbstractListPageTest):
 
     def assert_all_items(self, namespaces=[], filters=[], force_clear_all=True):
         logger.debug('Filters:{}'.format(filters))
-        # load the page first
-        self.page.load(force_load=True)
-        # apply namespaces
-        self.apply_namespaces(namespaces, force_clear_all=force_clear_all)
-
-        # apply filters
-        self.apply_filters(filters=filters, force_clear_all=force_clear_all)
+        # load the page with namespaces and filters
+        self.apply_namespaces_and_filters(namespaces, filters, force_clear_all=force_clear_all,
+                                          force_load=True)
 
         _sn = self.FILTER_ENUM.ISTIO_NAME.text
         _istio_names = [_f['value'] for _f in filters if _f['name'] == _sn]
+        _tn = self.FILTER_ENUM.ISTIO_TYPE.text
+        _istio_types = [_f['value'] for _f in filters if _f['name'] == _tn]
+
+        # get rules from rest api and configs from OC api, in background while reading the ui
+        _config_list_rest = background(
+            self.kiali_client.istio_config_list,
+            namespaces=namespaces, config_names=_istio_names, object_types=_istio_types)
+        _config_list_oc = background(
+            self._openshift_items, 'iter_istio_configs', 'istio_config_list',
+            namespaces=namespaces, config_names=_istio_names, object_types=_istio_types)
 
         # get rules from ui
         config_list_ui = self.page.content.all_items
         logger.debug('Istio config list UI:{}]'.format(config_list_ui))
 
-        # get rules from rest api
-        config_list_rest = self.kiali_client.istio_config_list(
-            namespaces=namespaces, config_names=_istio_names)
+        config_list_rest = _config_list_rest.result()
         logger.debug('Istio config list REST:{}]'.format(config_list_rest))
 
-        # get configs from OC api
-        config_list_oc = self.openshift_client.istio_config_list(
-            namespaces=namespaces, config_names=_istio_names)
+        config_list_oc = _config_list_oc.result()
         logger.debug('Istio config list OC API:{}]'.format(config_list_oc))
 
         # compare 3 way results
         assert len(config_list_ui) == len(config_list_rest)
         assert len(config_list_ui) == len(config_list_oc)
-        for config_ui in config_list_ui:
-            found = False
-            for config_rest in config_list_rest:
-                if config_ui.is_equal(config_rest, advanced_check=True):
-                    found = True
-                    break
-            if not found:
-                assert found, '{} not found in REST'.format(config_ui)
-            found = False
-            for config_oc in config_list_oc:
-                if config_ui.is_equal(config_oc, advanced_check=False):
-                    found = True
-                    break
-            if not found:
-                assert found, '{} not found in OC'.format(config_ui)
+        _report = match_items(config_list_ui, config_list_rest, advanced_check=True)
+        assert _report.all_found, 'Istio Configs not found in REST:\n{}'.format(_report)
+        _report = match_items(config_list_ui, config_list_oc, advanced_check=False)
+        assert _report.all_found, 'Istio Configs not found in OC:\n{}'.format(_report)
 
     def assert_random_details(self, namespaces=[], filters=[]):
         # get istio config from rest api
@@ -1030,16 +1012,19 @@ class IstioConfigPageTest(AbstractListPageTest):
     def assert_details(self, name, object_type,
                        namespace=None, error_messages=[], apply_filters=True):
         logger.debug('Details: {}, {}'.format(name, namespace))
-        # load the page first
-        self.page.load(force_load=True)
         # TODO apply pagination feature in get_details
         # this is done for optimization if the necessary item already exists in page
-        # apply namespace
-        self.apply_namespaces(namespaces=[namespace])
         if apply_filters:
-            # apply filters
-            self.apply_filters(filters=[
-                {'name': IstioConfigPageFilter.ISTIO_NAME.text, 'value': name}])
+            # load the page with namespace and filters
+            self.apply_namespaces_and_filters(
+                namespaces=[namespace],
+                filters=[{'name': IstioConfigPageFilter.ISTIO_NAME.text, 'value': name}],
+                force_load=True)
+        else:
+            # load the page first, the URL would clear the filters already applied
+            self.page.load(force_load=True)
+            # apply namespace
+            self.apply_namespaces(namespaces=[namespace])
 
         # load config details page
         config_details_ui = self.page.content.get_details(name, object_type, namespace)
@@ -18,5 +18,6 @@ pytest_plugins = (
     'kiali_qe.fixtures.log',
     'kiali_qe.fixtures.rest_client',
     'kiali_qe.fixtures.zalenium',
-    'kiali_qe.fixtures.checkers'
+    'kiali_qe.fixtures.checkers',
+    'kiali_qe.fixtures.scheduler'
 )
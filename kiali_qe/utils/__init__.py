@@ -4,6 +4,9 @@ import operator
 import os
 from functools import reduce
 from kiali_qe.components.enums import IstioConfigValidation
+from kiali_qe.utils.matcher import EntityMatcher
+
+PRIMITIVE_TYPES = (str, float, int, bytes)
 
 
 class MyDotMap(DotMap):
@@ -35,10 +38,15 @@ def get_yaml_path(path, yaml_file):
 def is_equal(object_a, object_b):
     if isinstance(object_a, list):
         if len(object_a) == len(object_b):
+            # lookups of b are indexed, built on first use
+            _primitives_b = None
+            _matcher_b = None
             for item_a in object_a:
-                if isinstance(item_a, str) or isinstance(item_a, float)\
-                 or isinstance(item_a, int) or isinstance(item_a, bytes):
-                    if item_a not in object_b:
+                if isinstance(item_a, PRIMITIVE_TYPES):
+                    if _primitives_b is None:
+                        _primitives_b = set(
+                            [_item for _item in object_b if isinstance(_item, PRIMITIVE_TYPES)])
+                    if item_a not in _primitives_b:
                         return False
                 elif isinstance(item_a, dict):
                     _is_in = False
@@ -50,7 +58,9 @@ def is_equal(object_a, object_b):
                         return False
 
                 else:
-                    if not item_a.is_in(object_b):
+                    if _matcher_b is None:
+                        _matcher_b = EntityMatcher(object_b)
+                    if not item_a.is_in(_matcher_b):
                         return False
             return True
         else:
@@ -59,6 +69,18 @@ def is_equal(object_a, object_b):
         return _cmp_dict(object_a, object_b)
 
 
+def filter_by_names(items, names, key=operator.attrgetter('name')):
+    """ Returns items which name contains any of the names, as name filter of UI does.
+    Args:
+        items: items to filter
+        names: names to look for, all the items are returned when empty
+        key: function which returns name of an item
+    """
+    if len(names) == 0:
+        return items
+    return [_item for _item in items if any([_name in key(_item) for _name in names])]
+
+
 def _cmp_dict(a, b):
     return a == b
 
@@ -0,0 +1,62 @@
+import time
+
+from collections import OrderedDict
+from threading import Lock
+
+
+class ResponseCache(object):
+    """ In memory cache with time to live and least recently used eviction.
+    Keys are tuples of (method_name, path, params), values are decoded responses.
+    Cached values are shared between callers and must not be modified.
+    """
+
+    def __init__(self, size=256, ttl=60, ttls=None):
+        """
+        Args:
+            size: maximum number of cached responses
+            ttl: default time to live in seconds
+            ttls: time to live in seconds per method name, overrides the default ttl
+        """
+        self.size = size
+        self.ttl = ttl
+        self.ttls = dict(ttls) if ttls else {}
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def key(method_name, path=None, params=None):
+        """ Returns hashable key of the request """
+        return (method_name,
+                tuple(sorted((path or {}).items())),
+                tuple(sorted((params or {}).items())))
+
+    def get(self, key):
+        """ Returns cached value of the key or None when missing or expired """
+        with self._lock:
+            _entry = self._entries.get(key)
+            if _entry is None:
+                return None
+            _expires, _value = _entry
+            if _expires < time.time():
+                del self._entries[key]
+                return None
+            # mark as recently used
+            self._entries.pop(key)
+            self._entries[key] = _entry
+            return _value
+
+    def put(self, key, value):
+        """ Stores the value, evicts the least recently used values above the size """
+        _ttl = self.ttls.get(key[0], self.ttl)
+        if not _ttl or self.size <= 0:
+            return
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.time() + _ttl, value)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self):
+        """ Removes all the cached values """
+        with self._lock:
+            self._entries.clear()
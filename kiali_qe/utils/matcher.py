@@ -0,0 +1,116 @@
+def _identity_key(item):
+    # items without identity key are kept together and compared one by one
+    return getattr(item, 'identity_key', None)
+
+
+def _is_equal(item, candidate, advanced_check=None):
+    if not hasattr(item, 'is_equal'):
+        return item == candidate
+    if advanced_check is None:
+        return item.is_equal(candidate)
+    return item.is_equal(candidate, advanced_check=advanced_check)
+
+
+def _differences(item, candidate):
+    _item_fields = vars(item) if hasattr(item, '__dict__') else {}
+    _candidate_fields = vars(candidate) if hasattr(candidate, '__dict__') else {}
+    _result = {}
+    for _field in sorted(set(_item_fields) | set(_candidate_fields)):
+        _item_value = _item_fields.get(_field)
+        _candidate_value = _candidate_fields.get(_field)
+        if _item_value != _candidate_value:
+            _result[_field] = (_item_value, _candidate_value)
+    return _result
+
+
+class MatchReport(object):
+    """ Result of matching items against candidates.
+    Args:
+        missing: items without any candidate of the same identity key
+        mismatched: list of (item, candidate, differences) for items where the candidate
+            of the same identity key is not equal,
+            differences is a dict of field name: (item value, candidate value)
+        extra: candidates not equal to any item
+    """
+
+    def __init__(self, missing, mismatched, extra):
+        self.missing = missing
+        self.mismatched = mismatched
+        self.extra = extra
+
+    @property
+    def all_found(self):
+        """ True when each item is equal to a candidate """
+        return len(self.missing) == 0 and len(self.mismatched) == 0
+
+    def __str__(self):
+        _lines = []
+        for _item in self.missing:
+            _lines.append('missing: {}'.format(_item))
+        for _item, _candidate, _differences in self.mismatched:
+            _lines.append('mismatched: {}, differences: {}'.format(
+                _item,
+                ', '.join(['{}[{} != {}]'.format(_field, _values[0], _values[1])
+                           for _field, _values in _differences.items()])))
+        for _candidate in self.extra:
+            _lines.append('extra: {}'.format(_candidate))
+        return '\n'.join(_lines)
+
+    def __repr__(self):
+        return "{}({}, {}, {})".format(
+            type(self).__name__, repr(self.missing), repr(self.mismatched), repr(self.extra))
+
+
+class EntityMatcher(object):
+    """ Index of candidates by identity key of entities.
+    Only the candidates with the same identity key are compared with is_equal,
+    so matching n items costs O(n) instead of O(n * candidates).
+    """
+
+    def __init__(self, candidates):
+        self.candidates = list(candidates)
+        self._index = {}
+        for _candidate in self.candidates:
+            self._index.setdefault(_identity_key(_candidate), []).append(_candidate)
+
+    def find(self, item, advanced_check=None):
+        """ Returns the candidate equal to item, None when not found
+        Args:
+            item: item to look for
+            advanced_check: passed to is_equal of the item when it is not None
+        """
+        for _candidate in self._index.get(_identity_key(item), []):
+            if _is_equal(item, _candidate, advanced_check):
+                return _candidate
+        return None
+
+    def match(self, items, advanced_check=None):
+        """ Returns MatchReport of the items against candidates
+        Args:
+            items: items to look for
+            advanced_check: passed to is_equal of the items when it is not None
+        """
+        _missing = []
+        _mismatched = []
+        _matched = set()
+        for _item in items:
+            _key = _identity_key(_item)
+            _same_key = self._index.get(_key, [])
+            _found = None
+            for _candidate in _same_key:
+                if _is_equal(_item, _candidate, advanced_check):
+                    _found = _candidate
+                    break
+            if _found is not None:
+                _matched.add(id(_found))
+            elif _key is not None and len(_same_key) > 0:
+                _mismatched.append((_item, _same_key[0], _differences(_item, _same_key[0])))
+            else:
+                _missing.append(_item)
+        _extra = [_candidate for _candidate in self.candidates if id(_candidate) not in _matched]
+        return MatchReport(missing=_missing, mismatched=_mismatched, extra=_extra)
+
+
+def match_items(items, candidates, advanced_check=None):
+    """ Returns MatchReport of the items against candidates, see EntityMatcher """
+    return EntityMatcher(candidates).match(items, advanced_check=advanced_check)
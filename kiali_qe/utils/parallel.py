@@ -0,0 +1,79 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore, Lock
+
+
+def parallel_map(func, items, max_workers=1):
+    """ Calls the function for each item, running up to max_workers calls at a time.
+    Args:
+        func: function to call with one item as argument
+        items: items to call the function with
+        max_workers: maximum number of concurrent calls, 1 or less runs the calls sequentially
+    Returns: list of results, in the same order as items
+    Note: the first exception raised by a call is raised to the caller
+    """
+    items = list(items)
+    if max_workers is None or max_workers <= 1 or len(items) <= 1:
+        return [func(_item) for _item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+class BackgroundExecutor(object):
+    """ Runs the background calls, up to max_workers calls at a time.
+    The threads are started by the first call and stopped by shutdown,
+    the next call starts them again.
+    """
+
+    def __init__(self, max_workers=1):
+        self.configure(max_workers)
+        self._executor = None
+        self._lock = Lock()
+
+    def configure(self, max_workers):
+        """ Sets the maximum number of concurrent calls, applied when the threads are started
+        Args:
+            max_workers: maximum number of concurrent calls, 1 or less runs one call at a time
+        """
+        self.max_workers = max_workers if max_workers and max_workers > 1 else 1
+        self._in_flight = BoundedSemaphore(self.max_workers)
+
+    def _call(self, func, args, kwargs):
+        with self._in_flight:
+            return func(*args, **kwargs)
+
+    def submit(self, func, *args, **kwargs):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            return self._executor.submit(self._call, func, args, kwargs)
+
+    def shutdown(self, wait=True):
+        """ Stops the threads, waits for the running calls when wait is True """
+        with self._lock:
+            _executor, self._executor = self._executor, None
+        if _executor is not None:
+            _executor.shutdown(wait=wait)
+
+
+# executor of the background calls, shared by the session
+_background_executor = BackgroundExecutor()
+
+
+def configure_background(max_workers):
+    """ Sets the maximum number of concurrent background calls, see BackgroundExecutor """
+    _background_executor.configure(max_workers)
+
+
+def shutdown_background(wait=True):
+    """ Stops the threads of the background calls """
+    _background_executor.shutdown(wait=wait)
+
+
+def background(func, *args, **kwargs):
+    """ Starts the function call in a background thread, to overlap it with other work.
+    Args:
+        func: function to call with the args and kwargs
+    Returns: concurrent.futures.Future, its result() returns the result of the call
+    or raises the exception raised by the call
+    """
+    return _background_executor.submit(func, *args, **kwargs)
@@ -0,0 +1,114 @@
+import sys
+import time
+
+from threading import Lock
+
+# commands are attributed to the first caller in these modules
+CALLER_MODULES = ('kiali_qe.',)
+SKIPPED_MODULES = ('kiali_qe.components.browser', 'kiali_qe.components.snapshot',
+                   'kiali_qe.utils.profiler')
+
+
+def _caller():
+    """ Returns 'Class.method' of the nearest kiali_qe caller, 'module.function' when
+    the caller is not a method """
+    _function = None
+    _frame = sys._getframe(2)
+    while _frame is not None:
+        _module = _frame.f_globals.get('__name__', '')
+        if _module.startswith(CALLER_MODULES) and _module not in SKIPPED_MODULES:
+            _self = _frame.f_locals.get('self')
+            if _self is not None and type(_self).__module__.startswith(CALLER_MODULES):
+                return '{}.{}'.format(type(_self).__name__, _frame.f_code.co_name)
+            if _function is None:
+                _function = '{}.{}'.format(_module, _frame.f_code.co_name)
+        _frame = _frame.f_back
+    return _function or 'unknown'
+
+
+def _merge(target, stats):
+    for _key, (_count, _seconds) in stats.items():
+        _total = target.setdefault(_key, [0, 0.0])
+        _total[0] += _count
+        _total[1] += _seconds
+
+
+def _format(stats, top):
+    _lines = []
+    for (_caller_name, _command), (_count, _seconds) in sorted(
+            stats.items(), key=lambda _item: _item[1][1], reverse=True)[:top]:
+        _lines.append('{:>6} x {:>8} ms  {} {}'.format(
+            _count, int(_seconds * 1000), _caller_name, _command))
+    return _lines
+
+
+class CommandProfiler(object):
+    """ Counts and times the WebDriver commands by caller widget method and by test.
+    Args:
+        top: number of the most expensive (caller, command) pairs in the reports
+    """
+
+    def __init__(self, top=10):
+        self.top = top
+        self.test = None
+        self._test_stats = {}
+        self._session_stats = {}
+        self._lock = Lock()
+
+    def instrument(self, selenium):
+        """ Records every command executed by the selenium driver and its elements """
+        _execute = selenium.execute
+
+        def execute(driver_command, params=None):
+            _caller_name = _caller()
+            _start = time.time()
+            try:
+                return _execute(driver_command, params)
+            finally:
+                self.record(_caller_name, driver_command, time.time() - _start)
+        selenium.execute = execute
+
+    def record(self, caller, command, seconds):
+        with self._lock:
+            _stats = self._test_stats.setdefault((caller, command), [0, 0.0])
+            _stats[0] += 1
+            _stats[1] += seconds
+
+    def start_test(self, test):
+        """ Attributes the next commands to the test, commands recorded before
+        (session fixtures) are kept in the session statistics """
+        with self._lock:
+            _merge(self._session_stats, self._test_stats)
+            self._test_stats = {}
+            self.test = test
+
+    def finish_test(self):
+        """ Returns report lines of the current test, empty when there was no command """
+        with self._lock:
+            _stats, self._test_stats = self._test_stats, {}
+            _merge(self._session_stats, _stats)
+            _test, self.test = self.test, None
+        if not _stats:
+            return []
+        return ['WebDriver commands of {}: {} in {} ms'.format(
+            _test,
+            sum([_count for _count, _seconds in _stats.values()]),
+            int(sum([_seconds for _count, _seconds in _stats.values()]) * 1000))] + \
+            _format(_stats, self.top)
+
+    def session_report(self):
+        """ Returns report lines of the session, empty when there was no command """
+        with self._lock:
+            _merge(self._session_stats, self._test_stats)
+            self._test_stats = {}
+            _stats = dict(self._session_stats)
+        if not _stats:
+            return []
+        return ['WebDriver commands of the session: {} in {} ms, top {}:'.format(
+            sum([_count for _count, _seconds in _stats.values()]),
+            int(sum([_seconds for _count, _seconds in _stats.values()]) * 1000),
+            self.top)] + _format(_stats, self.top)
+
+
+#: profiler of the session browser, instrumented by the browser fixture when enabled
+command_profiler = CommandProfiler()
@@ -0,0 +1,5 @@
+# unit tests of the kiali_qe framework, they run without a kiali instance or a browser
+# kiali_qe.components has to be imported ahead of the entities
+import kiali_qe.components  # noqa: F401
+
+pytest_plugins = ('pytester',)
@@ -0,0 +1,117 @@
+import json
+
+from selenium.common.exceptions import WebDriverException
+
+from kiali_qe.fixtures import browser
+from kiali_qe.fixtures.browser import DriverPool, session_json, uses_browser
+
+
+class StubDriver(object):
+
+    def __init__(self, number, fail_quit=False):
+        self.number = number
+        self.fail_quit = fail_quit
+        self.quit_called = False
+        self.session_id = 'session-{}'.format(number)
+        self.w3c = True
+        self.capabilities = {'browserName': 'chrome'}
+
+    def quit(self):
+        self.quit_called = True
+        if self.fail_quit:
+            raise WebDriverException('session deleted')
+
+
+class StubFactory(object):
+
+    def __init__(self, fail_quit=False):
+        self.drivers = []
+        self.fail_quit = fail_quit
+
+    def __call__(self):
+        _driver = StubDriver(len(self.drivers), fail_quit=self.fail_quit)
+        self.drivers.append(_driver)
+        return _driver
+
+
+class StubItem(object):
+
+    def __init__(self, *fixturenames):
+        self.fixturenames = fixturenames
+
+
+def test_get_returns_added_drivers_in_order():
+    _factory = StubFactory()
+    _pool = DriverPool(factory=_factory)
+    _pool.add(2)
+    _first, _second = _pool.get(), _pool.get()
+    assert set([_first.number, _second.number]) == set([0, 1])
+    assert _first is not _second
+    _pool.close()
+    assert not _first.quit_called and not _second.quit_called
+
+
+def test_get_without_add_creates_driver():
+    _factory = StubFactory()
+    _pool = DriverPool(factory=_factory)
+    _driver = _pool.get()
+    assert _driver is _factory.drivers[0]
+    _pool.close()
+    assert not _driver.quit_called
+
+
+def test_close_quits_drivers_not_taken():
+    _factory = StubFactory()
+    _pool = DriverPool(factory=_factory)
+    _pool.add(3)
+    _taken = _pool.get()
+    _pool.close()
+    assert len(_factory.drivers) == 3
+    assert [_driver.quit_called for _driver in _factory.drivers if _driver is not _taken] == \
+        [True, True]
+    assert not _taken.quit_called
+    # nothing left after close
+    _pool.close()
+
+
+def test_close_tolerates_failed_quit_and_missing_driver():
+    _pool = DriverPool(factory=StubFactory(fail_quit=True))
+    _pool.add(1)
+    _pool.close()
+    _pool = DriverPool(factory=lambda: None)
+    _pool.add(1)
+    _pool.close()
+
+
+def test_default_factory_is_get_selenium(monkeypatch):
+    _factory = StubFactory()
+    monkeypatch.setattr(browser, '_get_selenium', _factory)
+    assert DriverPool().get() is _factory.drivers[0]
+
+
+def test_session_json():
+    _session = json.loads(session_json(StubDriver(7)))
+    assert _session == {'session_id': 'session-7', 'w3c': True,
+                        'capabilities': {'browserName': 'chrome'}}
+
+
+def test_uses_browser():
+    assert uses_browser([StubItem('kiali_client'), StubItem('browser', 'kiali_client')])
+    assert not uses_browser([StubItem('kiali_client'), StubItem('openshift_client')])
+    assert not uses_browser([])
+
+
+def test_scheduler_hands_pooled_session_to_browser_lanes(monkeypatch):
+    from kiali_qe.fixtures import scheduler
+    _factory = StubFactory()
+    monkeypatch.setattr(scheduler, 'driver_pool', DriverPool(factory=_factory))
+    monkeypatch.setattr(scheduler.cfg.selenium.pool, 'prewarm', True)
+    _scheduler = scheduler.Scheduler(config=None)
+    _scheduler._lanes_count = 2
+    _env = _scheduler._lane_env([StubItem('browser')])
+    assert json.loads(_env[browser.SESSION_ENV])['session_id'] == 'session-0'
+    # REST only lanes create no driver
+    assert browser.SESSION_ENV not in _scheduler._lane_env([StubItem('kiali_client')])
+    scheduler.driver_pool.close()
+    # the driver kept ready for the next lane is quit
+    assert len(_factory.drivers) == 2 and _factory.drivers[1].quit_called
@@ -0,0 +1,219 @@
+import json
+import time
+
+from threading import Lock
+
+from six.moves.queue import Empty, Queue
+
+from kiali_qe.rest.informer import Informer, Store
+from kiali_qe.rest.openshift_api import OpenshiftExtendedClient
+
+# ends the watch stream, like the watch timeout does
+END = object()
+
+
+def _item(name, namespace='bookinfo', version='1', labels=None):
+    return {'metadata': {'name': name, 'namespace': namespace, 'resourceVersion': version,
+                         'labels': labels or {}}}
+
+
+def _event(_type, item):
+    return {'type': _type, 'raw_object': item}
+
+
+def _wait(condition, timeout=5):
+    _end = time.time() + timeout
+    while time.time() < _end:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+class StubResponse(object):
+
+    def __init__(self, data):
+        self.data = json.dumps(data).encode('utf8')
+
+
+class StubCreated(object):
+
+    def __init__(self, item):
+        self.item = item
+
+    def to_dict(self):
+        return self.item
+
+
+class StubResource(object):
+    """ Resource of the dynamic client, listing the items and streaming the queued events """
+    kind = 'VirtualService'
+    group_version = 'networking.istio.io/v1alpha3'
+    namespaced = True
+
+    def __init__(self, items, version='1'):
+        self.items = items
+        self.version = version
+        self.events = Queue()
+        self.list_calls = 0
+        self.watch_calls = []
+
+    def get(self, serialize=True):
+        assert not serialize
+        self.list_calls += 1
+        return StubResponse({'metadata': {'resourceVersion': self.version},
+                             'items': self.items})
+
+    def watch(self, resource_version=None, timeout=None):
+        self.watch_calls.append(resource_version)
+        while True:
+            try:
+                _event = self.events.get(timeout=5)
+            except Empty:
+                return
+            if _event is END:
+                return
+            if isinstance(_event, Exception):
+                raise _event
+            yield _event
+
+    def create(self, body, namespace):
+        return StubCreated(body)
+
+    def delete(self, name, namespace):
+        pass
+
+
+def _names(informer, **kwargs):
+    return [_item['metadata']['name'] for _item in informer.store.list(**kwargs)]
+
+
+def _started(resource):
+    _informer = Informer(resource, watch_timeout=10).start()
+    assert _wait(lambda: len(resource.watch_calls) > 0)
+    return _informer
+
+
+def test_store_indexes_namespace_and_labels():
+    _store = Store()
+    _store.replace([_item('reviews', labels={'app': 'reviews'}), _item('ratings'),
+                    _item('details', namespace='istio-system'), _item('node', namespace=None)])
+    assert [_item['metadata']['name'] for _item in _store.list(namespaces=['bookinfo'])] == \
+        ['node', 'ratings', 'reviews']
+    assert [_item['metadata']['name'] for _item in _store.list(labels={'app': 'reviews'})] == \
+        ['reviews']
+    _store.upsert(_item('reviews', version='2'))
+    assert _store.list(labels={'app': 'reviews'}) == []
+    _store.delete('bookinfo', 'ratings')
+    assert _store.get('bookinfo', 'ratings') is None
+
+
+def test_initial_list():
+    _resource = StubResource([_item('reviews'), _item('details', namespace='istio-system')],
+                             version='7')
+    _informer = _started(_resource)
+    assert _names(_informer) == ['reviews', 'details']
+    assert _names(_informer, namespaces=['istio-system']) == ['details']
+    assert _resource.watch_calls == ['7']
+    _informer.stop()
+
+
+def test_events_update_the_store():
+    _resource = StubResource([_item('reviews')])
+    _informer = _started(_resource)
+    _resource.events.put(_event('ADDED', _item('ratings', version='2')))
+    _resource.events.put(_event('MODIFIED', _item('reviews', version='3',
+                                                  labels={'app': 'reviews'})))
+    _resource.events.put(_event('DELETED', _item('ratings', version='4')))
+    assert _wait(lambda: _informer._resource_version == '4')
+    assert _names(_informer) == ['reviews']
+    assert _names(_informer, labels={'app': 'reviews'}) == ['reviews']
+    _informer.stop()
+
+
+def test_watch_resumes_from_last_version():
+    _resource = StubResource([])
+    _informer = _started(_resource)
+    _resource.events.put(_event('ADDED', _item('ratings', version='5')))
+    _resource.events.put(END)
+    assert _wait(lambda: len(_resource.watch_calls) == 2)
+    assert _resource.watch_calls == ['1', '5']
+    # the stream is resumed, not listed again
+    assert _resource.list_calls == 1
+    assert _names(_informer) == ['ratings']
+    _informer.stop()
+
+
+def test_expired_version_lists_again():
+    _resource = StubResource([_item('reviews')])
+    _informer = _started(_resource)
+    # changes missed while the version expired are in the next list
+    _resource.items = [_item('ratings', version='9')]
+    _resource.version = '9'
+    _resource.events.put(_event('ERROR', {'code': 410, 'message': 'too old resource version'}))
+    assert _wait(lambda: len(_resource.watch_calls) == 2)
+    assert _resource.list_calls == 2
+    assert _resource.watch_calls == ['1', '9']
+    assert _names(_informer) == ['ratings']
+    _informer.stop()
+
+
+def test_failed_watch_lists_again():
+    _resource = StubResource([_item('reviews')])
+    _informer = _started(_resource)
+    _resource.items = []
+    _resource.events.put(IOError('connection reset'))
+    assert _wait(lambda: len(_resource.watch_calls) == 2)
+    assert _resource.list_calls == 2
+    assert _names(_informer) == []
+    _informer.stop()
+
+
+def test_stop_ends_the_watch():
+    _resource = StubResource([_item('reviews')])
+    _informer = _started(_resource)
+    _informer.stop()
+    _resource.events.put(_event('ADDED', _item('ratings', version='2')))
+    _informer._thread.join(5)
+    assert not _informer._thread.is_alive()
+    # events after stop are not applied
+    assert _names(_informer) == ['reviews']
+    assert _resource.watch_calls == ['1']
+
+
+def _stub_client(resource, on_change=None):
+    # the client without API server, see OpenshiftExtendedClient.__init__
+    _client = OpenshiftExtendedClient.__new__(OpenshiftExtendedClient)
+    _client.on_change = on_change
+    _client.max_workers = 1
+    _client.informers = True
+    _client.informer_watch_timeout = 10
+    _client._resources = {}
+    _client._informers = {}
+    _client._informers_lock = Lock()
+    _client._istio_config = lambda kind, api_version: resource
+    return _client
+
+
+def test_client_notifies_change_and_updates_started_informer():
+    _resource = StubResource([_item('reviews')])
+    _changes = []
+    _client = _stub_client(_resource, on_change=_changes.append)
+    _informer = _client._informers_of([_resource])[0]
+    assert _client._informers_of([_resource])[0] is _informer
+    assert _client._started_informer(_resource) is _informer
+    _client.create_istio_config(_item('ratings'), 'bookinfo', 'VirtualService', 'v1alpha3')
+    assert _names(_informer) == ['ratings', 'reviews']
+    _client.delete_istio_config('reviews', 'bookinfo', 'VirtualService', 'v1alpha3')
+    assert _names(_informer) == ['ratings']
+    assert _changes == ['bookinfo', 'bookinfo']
+    _client.close()
+    assert _informer._stopped
+    assert _client._started_informer(_resource) is None
+
+
+def test_client_without_informer_notifies_change():
+    _changes = []
+    _client = _stub_client(StubResource([]), on_change=_changes.append)
+    _client.delete_istio_config('reviews', 'bookinfo', 'VirtualService', 'v1alpha3')
+    assert _changes == ['bookinfo']
@@ -0,0 +1,108 @@
+import pytest
+
+from kiali_qe.components import (
+    ListViewAbstract, ListViewApplications, ListViewIstioConfig, ListViewServices,
+    ListViewWorkloads)
+from kiali_qe.components.enums import HealthType
+from kiali_qe.entities.applications import Application
+from kiali_qe.entities.istio_config import IstioConfig
+from kiali_qe.entities.service import Service
+from kiali_qe.entities.workload import Workload
+from kiali_qe.utils.log import logger
+
+COUNTS = {'healthy': 1, 'not_healthy': 0, 'degraded': 0, 'not_available': 0,
+          'missing_sidecar': 0, 'valid': 1, 'not_valid': 0, 'warning': 0}
+
+
+def _data(text, namespace, object_type=None):
+    return {'texts': {'text': text, 'namespace': namespace, 'object_type': object_type},
+            'counts': COUNTS, 'lists': {'label_keys': ['app', 'version']}}
+
+
+class FakeList(object):
+    """ List view reading the given items data, widgets can not be created without a browser """
+    _parse_heading = ListViewAbstract._parse_heading
+    _data_health = ListViewAbstract._data_health
+    _data_validation = ListViewAbstract._data_validation
+    _to_health = ListViewAbstract._to_health
+    _is_rule = ListViewIstioConfig._is_rule
+
+    def __init__(self, items_data):
+        self.items_data = items_data
+        self.logger = logger
+        self._element_items = ['read by elements']
+
+    def _items_data(self, texts={}, counts={}, lists={}):
+        return self.items_data
+
+
+# locators of the list view
+for _name, _value in vars(ListViewAbstract).items():
+    if _name.isupper():
+        setattr(FakeList, _name, _value)
+
+
+@pytest.mark.parametrize(('text', 'namespace', 'count', 'expected'), [
+    ('details\nbookinfo', 'bookinfo', 2, ['details', 'bookinfo']),
+    (' details \n\n bookinfo \n', None, 2, ['details', 'bookinfo']),
+    ('details\nMissing Sidecar\nbookinfo', 'bookinfo', 2, ['details', 'bookinfo']),
+    ('details\nbookinfo\n(Show on graph)', 'bookinfo', 2, ['details', 'bookinfo']),
+    ('details-v1\nMissing Sidecar\nbookinfo\nDeployment', 'bookinfo', 3,
+     ['details-v1', 'bookinfo', 'Deployment'])])
+def test_parse_heading(text, namespace, count, expected):
+    assert FakeList([])._parse_heading(text, namespace=namespace, count=count) == expected
+
+
+@pytest.mark.parametrize('text', [None, '', 'details', 'details\nbookinfo'])
+def test_parse_heading_missing_lines(text):
+    with pytest.raises(ValueError):
+        FakeList([])._parse_heading(text, count=3)
+
+
+def test_applications_with_extra_line():
+    _items = ListViewApplications.items.fget(FakeList([
+        _data('details\nbookinfo', 'bookinfo'),
+        _data('reviews\nMissing Sidecar\nbookinfo\n(Show on graph)', 'bookinfo')]))
+    assert _items == [
+        Application('details', 'bookinfo', istio_sidecar=True, health=HealthType.HEALTHY),
+        Application('reviews', 'bookinfo', istio_sidecar=True, health=HealthType.HEALTHY)]
+
+
+def test_workloads_with_extra_line():
+    _items = ListViewWorkloads.items.fget(FakeList([
+        _data('details-v1\nbookinfo\nDeployment\n(Show on graph)', 'bookinfo')]))
+    assert [(_item.name, _item.namespace, _item.workload_type) for _item in _items] == \
+        [('details-v1', 'bookinfo', 'Deployment')]
+    assert isinstance(_items[0], Workload)
+
+
+def test_services_with_extra_line():
+    _items = ListViewServices.items.fget(FakeList([
+        _data('productpage\nMissing Sidecar\nbookinfo', 'bookinfo')]))
+    assert [(_item.name, _item.namespace) for _item in _items] == [('productpage', 'bookinfo')]
+    assert isinstance(_items[0], Service)
+
+
+def test_istio_config_with_extra_line():
+    _items = ListViewIstioConfig.items.fget(FakeList([
+        _data('reviews\nbookinfo\nwarning', 'bookinfo', object_type='VirtualService')]))
+    assert [(_item.name, _item.namespace, _item.object_type) for _item in _items] == \
+        [('reviews', 'bookinfo', 'VirtualService')]
+    assert isinstance(_items[0], IstioConfig)
+
+
+@pytest.mark.parametrize('view', [ListViewApplications, ListViewServices, ListViewIstioConfig])
+def test_unparsed_heading_fails_with_heading_text(view):
+    with pytest.raises(ValueError, match="'details' has less than 2 lines"):
+        view.items.fget(FakeList([_data('details', None)]))
+
+
+def test_workloads_unparsed_heading_fails_with_heading_text():
+    with pytest.raises(ValueError, match="'details-v1\\\\nbookinfo' has less than 3 lines"):
+        ListViewWorkloads.items.fget(FakeList([_data('details-v1\nbookinfo', None)]))
+
+
+@pytest.mark.parametrize('view', [ListViewApplications, ListViewWorkloads, ListViewServices,
+                                  ListViewIstioConfig])
+def test_failed_script_falls_back_to_elements(view):
+    assert view.items.fget(FakeList(None)) == ['read by elements']
@@ -0,0 +1,80 @@
+import pytest
+
+from kiali_qe.components.enums import HealthType
+from kiali_qe.entities.applications import Application, ApplicationDetails, AppWorkload
+from kiali_qe.entities.istio_config import IstioConfig, IstioConfigDetails, Rule
+from kiali_qe.entities.service import Service, SourceWorkload, VirtualServiceWeight
+from kiali_qe.entities.workload import (
+    DestinationService, Workload, WorkloadDetails, WorkloadPod)
+from kiali_qe.utils.matcher import EntityMatcher, match_items
+
+
+def _with_namespace(entity, namespace):
+    # REST and OC entities know the namespace, the UI does not read it on details pages
+    entity.namespace = namespace
+    return entity
+
+
+def _workload_details(name='details-v1', namespace=None):
+    return _with_namespace(WorkloadDetails(
+        name=name, workload_type='Deployment', created_at=None, resource_version='1',
+        istio_sidecar=True, health=HealthType.HEALTHY), namespace)
+
+
+@pytest.mark.parametrize(('item', 'candidate'), [
+    (DestinationService('reviews', _from='productpage'),
+     DestinationService('reviews', _from='productpage', namespace='bookinfo')),
+    (ApplicationDetails('details', istio_sidecar=True),
+     _with_namespace(ApplicationDetails('details', istio_sidecar=True), 'bookinfo')),
+    (_workload_details(), _workload_details(namespace='bookinfo')),
+    (AppWorkload('details-v1', istio_sidecar=True),
+     _with_namespace(AppWorkload('details-v1', istio_sidecar=True), 'bookinfo')),
+    (WorkloadPod('details-v1-1', created_at=None, created_by='details-v1'),
+     _with_namespace(WorkloadPod('details-v1-1', created_at=None, created_by='details-v1'),
+                     'bookinfo')),
+    (IstioConfigDetails('reviews', _type='VirtualService', text=''),
+     _with_namespace(IstioConfigDetails('reviews', _type='VirtualService', text=''),
+                     'bookinfo'))])
+def test_namespace_is_ignored_as_in_is_equal(item, candidate):
+    assert item.is_equal(candidate)
+    _report = match_items([item], [candidate])
+    assert _report.all_found, str(_report)
+    assert _report.extra == []
+    assert EntityMatcher([candidate]).find(item) is candidate
+
+
+@pytest.mark.parametrize(('item', 'candidate'), [
+    (Service('reviews', 'bookinfo'), Service('reviews', 'istio-system')),
+    (Application('reviews', 'bookinfo'), Application('reviews', 'istio-system')),
+    (Workload('reviews-v1', 'bookinfo', 'Deployment'),
+     Workload('reviews-v1', 'istio-system', 'Deployment')),
+    (IstioConfig('reviews', 'bookinfo', 'VirtualService'),
+     IstioConfig('reviews', 'istio-system', 'VirtualService')),
+    (Rule('denier', 'bookinfo', 'Rule'), Rule('denier', 'istio-system', 'Rule'))])
+def test_namespace_is_compared(item, candidate):
+    _report = match_items([item], [candidate])
+    assert _report.missing == [item]
+    assert _report.mismatched == []
+    assert _report.extra == [candidate]
+
+
+def test_mismatch_of_same_key_is_reported_with_differences():
+    _item = _workload_details()
+    _candidate = _workload_details(namespace='bookinfo')
+    _candidate.resource_version = '2'
+    _report = match_items([_item], [_candidate])
+    assert not _report.all_found
+    assert [(_mismatched[0], _mismatched[1]) for _mismatched in _report.mismatched] == \
+        [(_item, _candidate)]
+    assert _report.mismatched[0][2]['resource_version'] == ('1', '2')
+
+
+def test_nameless_entities_are_compared_one_by_one():
+    _weights = [VirtualServiceWeight('reviews', subset='v1', weight=50),
+                VirtualServiceWeight('reviews', subset='v2', weight=50)]
+    _sources = [SourceWorkload(to='reviews', workloads=['productpage-v1'])]
+    assert _weights[0].identity_key is None
+    _report = match_items(list(reversed(_weights)) + _sources, _weights + _sources)
+    assert _report.all_found, str(_report)
+    _report = match_items([SourceWorkload(to='ratings', workloads=[])], _sources)
+    assert len(_report.missing) == 1 and _report.mismatched == []
@@ -0,0 +1,75 @@
+import json
+
+from kiali_qe.rest.openshift_api import OpenshiftExtendedClient
+from kiali_qe.tests import AbstractListPageTest
+
+
+def _item(name, namespace='bookinfo'):
+    return {'metadata': {'name': name, 'namespace': namespace, 'labels': {'app': name}}}
+
+
+class StubResponse(object):
+
+    def __init__(self, data):
+        self.data = json.dumps(data).encode('utf8')
+
+
+class StubPagedResource(object):
+    """ Resource of the dynamic client, listing limit items per request with continue tokens """
+    namespaced = True
+
+    def __init__(self, items):
+        self.items = items
+        self.calls = []
+
+    def get(self, namespace=None, limit=None, _continue=None, serialize=True):
+        assert not serialize
+        self.calls.append((namespace, _continue))
+        _start = int(_continue or 0)
+        _end = _start + limit
+        _metadata = {'continue': str(_end)} if _end < len(self.items) else {}
+        return StubResponse({'metadata': _metadata, 'items': self.items[_start:_end]})
+
+
+def _stub_client(resources, page_size=2):
+    # the client without API server, see OpenshiftExtendedClient.__init__
+    _client = OpenshiftExtendedClient.__new__(OpenshiftExtendedClient)
+    _client.max_workers = 1
+    _client.informers = False
+    _client.page_size = page_size
+    _client._resource = lambda kind, api_version='v1': resources.get(kind, StubPagedResource([]))
+    return _client
+
+
+def test_iter_services_reads_all_pages():
+    _resource = StubPagedResource([_item('service-{}'.format(_index)) for _index in range(5)])
+    _client = _stub_client({'Service': _resource})
+    assert [_service.name for _service in _client.iter_services(namespaces=['bookinfo'])] == \
+        ['service-{}'.format(_index) for _index in range(5)]
+    assert _resource.calls == [('bookinfo', None), ('bookinfo', '2'), ('bookinfo', '4')]
+
+
+def test_iter_workloads_reads_all_pages_of_each_type():
+    _client = _stub_client({
+        'Deployment': StubPagedResource([_item('reviews-v1'), _item('reviews-v2'),
+                                         _item('ratings-v1')]),
+        'Pod': StubPagedResource([_item('details-v1')])})
+    _workloads = [(_workload.name, _workload.workload_type)
+                  for _workload in _client.iter_workloads(workload_names=['v1', 'v2'])]
+    assert sorted(_workloads) == [('details-v1', 'Pod'), ('ratings-v1', 'Deployment'),
+                                  ('reviews-v1', 'Deployment'), ('reviews-v2', 'Deployment')]
+
+
+def test_openshift_items_fall_back_to_list_method():
+    class KialiClient(object):
+        def service_list(self, namespaces=[], service_names=[]):
+            return ['from list']
+
+    _test = AbstractListPageTest(None, KialiClient(), None)
+    assert _test._openshift_items('iter_services', 'service_list') == ['from list']
+    _client = _stub_client({'Service': StubPagedResource([_item('details'), _item('reviews'),
+                                                          _item('ratings')])})
+    _test = AbstractListPageTest(None, _client, None)
+    assert [_service.name for _service in _test._openshift_items(
+        'iter_services', 'service_list', namespaces=['bookinfo'])] == \
+        ['details', 'reviews', 'ratings']
@@ -0,0 +1,99 @@
+import pytest
+
+from kiali_qe import components
+from kiali_qe.components import ListViewAbstract, Pagination
+
+
+class FakeBrowser(object):
+    def __init__(self, url):
+        self.url = url
+
+
+class FakePagination(object):
+    """ Pagination reading the totals of the loaded URL """
+    URL_PAGE = Pagination.URL_PAGE
+    URL_PER_PAGE = Pagination.URL_PER_PAGE
+    show_all_items = Pagination.show_all_items
+
+    def __init__(self, url, totals):
+        self.browser = FakeBrowser(url)
+        self.totals = totals
+
+    def _totals(self):
+        return self.totals(self.browser.url)
+
+
+@pytest.fixture(autouse=True)
+def no_spinner(monkeypatch):
+    monkeypatch.setattr(components, 'wait_to_spinner_disappear', lambda browser: None)
+
+
+def _per_page_totals(url):
+    # 40 items, the page size of the URL is applied
+    if 'perPage=40' in url:
+        return {'items': '40', 'pages': '1'}
+    return {'items': '40', 'pages': '3'}
+
+
+def test_show_all_items_sets_page_size_in_url():
+    _pagination = FakePagination(
+        'http://kiali/console/services?namespaces=bookinfo&page=3&perPage=15', _per_page_totals)
+    assert _pagination.show_all_items()
+    assert _pagination.browser.url == \
+        'http://kiali/console/services?namespaces=bookinfo&page=1&perPage=40'
+
+
+def test_show_all_items_single_page_keeps_url():
+    _url = 'http://kiali/console/services?namespaces=bookinfo'
+    _pagination = FakePagination(_url, lambda url: {'items': '5', 'pages': '1'})
+    assert _pagination.show_all_items()
+    assert _pagination.browser.url == _url
+
+
+def test_show_all_items_page_size_not_applied():
+    _pagination = FakePagination(
+        'http://kiali/console/services', lambda url: {'items': '40', 'pages': '3'})
+    assert not _pagination.show_all_items()
+
+
+class FakeList(object):
+    """ List view with the given pages """
+
+    def __init__(self, pages, single_page):
+        self.pages = pages
+        self.page = 0
+        self.single_page = single_page
+        self._pagination = self
+
+    def show_all_items(self):
+        return self.single_page
+
+    def set_max_items_per_page(self):
+        pass
+
+    def move_to_first_page(self):
+        self.page = 0
+
+    def move_to_next_page(self):
+        self.page += 1
+
+    @property
+    def total_pages(self):
+        return len(self.pages)
+
+    @property
+    def items(self):
+        if self.single_page:
+            return sum(self.pages, [])
+        return self.pages[self.page]
+
+
+def test_all_items_single_page():
+    _list = FakeList([[1, 2], [3]], single_page=True)
+    assert ListViewAbstract.all_items.fget(_list) == [1, 2, 3]
+    assert _list.page == 0
+
+
+def test_all_items_page_by_page():
+    assert ListViewAbstract.all_items.fget(FakeList([[1, 2], [3]], single_page=False)) == \
+        [1, 2, 3]
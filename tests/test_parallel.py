@@ -0,0 +1,29 @@
+import time
+
+from threading import Lock
+
+from kiali_qe.utils.parallel import BackgroundExecutor
+
+
+def test_background_calls_are_limited_and_restart_after_shutdown():
+    _executor = BackgroundExecutor(max_workers=2)
+    _running = []
+    _peak = []
+    _lock = Lock()
+
+    def _call(value):
+        with _lock:
+            _running.append(value)
+            _peak.append(len(_running))
+        time.sleep(0.05)
+        with _lock:
+            _running.remove(value)
+        return value
+
+    _futures = [_executor.submit(_call, _value) for _value in range(6)]
+    assert [_future.result() for _future in _futures] == list(range(6))
+    assert max(_peak) == 2
+    _executor.shutdown()
+    assert _executor._executor is None
+    assert _executor.submit(_call, 'again').result() == 'again'
+    _executor.shutdown()
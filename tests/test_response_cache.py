@@ -0,0 +1,30 @@
+from threading import BoundedSemaphore
+
+from kiali_qe.rest.kiali_api import KialiExtendedClient
+from kiali_qe.utils.cache import ResponseCache
+
+
+def _cached_client():
+    _client = KialiExtendedClient.__new__(KialiExtendedClient)
+    _client._cache = ResponseCache(size=10)
+    _client._in_flight = BoundedSemaphore(1)
+    return _client
+
+
+def test_change_drops_responses_of_all_namespaces():
+    _client = _cached_client()
+    _keys = [ResponseCache.key('namespaceList'),
+             ResponseCache.key('serviceList', {'namespace': 'bookinfo'}),
+             ResponseCache.key('serviceList', {'namespace': 'istio-system'})]
+    for _key in _keys:
+        _client._cache.put(_key, {})
+    _stale = ResponseCache.key('istioConfigList', {'namespace': 'bookinfo'})
+
+    def _request(**kwargs):
+        # a concurrent read caches the state before the change
+        _client._cache.put(_stale, {})
+        return 'response'
+
+    _client._request = _request
+    assert _client.delete_response('istioConfigDelete', namespace='bookinfo') == 'response'
+    assert [_client._cache.get(_key) for _key in _keys + [_stale]] == [None] * 4
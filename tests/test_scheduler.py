@@ -0,0 +1,171 @@
+import threading
+import time
+
+import pytest
+
+from kiali_qe.fixtures.scheduler import (
+    CONFLICTS, LOCK_MODES, UNMARKED_MODE, ResourceLocks, _failed_count, _lock_modes)
+from kiali_qe.utils.path import project_path
+
+LANES_TEST = """
+import time
+
+import pytest
+
+
+def _record(name):
+    _start = time.time()
+    time.sleep(2)
+    with open('{{}}.interval'.format(name), 'w') as _file:
+        _file.write('{{}} {{}}'.format(_start, time.time()))
+
+
+@pytest.mark.p_group1
+@pytest.mark.{first}
+def test_first():
+    _record('first')
+
+
+@pytest.mark.p_group2
+@pytest.mark.{second}
+def test_second():
+    _record('second')
+"""
+
+
+FAILING_TEST = """
+import pytest
+
+
+@pytest.mark.p_group1
+def test_first():
+    assert False
+
+
+@pytest.mark.p_group1
+def test_second():
+    assert False
+
+
+@pytest.mark.p_group2
+def test_third():
+    assert False
+"""
+
+CONFTEST = """
+import kiali_qe.components  # noqa: F401
+
+pytest_plugins = ('kiali_qe.fixtures.scheduler',)
+
+
+def pytest_sessionfinish(session):
+    if not session.config.getoption('p_lane'):
+        with open('testsfailed', 'w') as _file:
+            _file.write(str(session.testsfailed))
+"""
+
+
+class FakeItem(object):
+    def __init__(self, *keywords):
+        self.keywords = {_keyword: True for _keyword in keywords}
+
+
+def test_conflicts_are_symmetric():
+    for _mode in LOCK_MODES + (UNMARKED_MODE,):
+        for _other in CONFLICTS[_mode]:
+            assert _mode in CONFLICTS[_other]
+
+
+@pytest.mark.parametrize(('mode', 'other'), [
+    ('p_crud_resource', 'p_ro_resource'),
+    ('p_crud_resource', 'p_ro_namespace'),
+    ('p_crud_namespace', 'p_ro_resource'),
+    ('p_crud_top', 'p_ro_top_safe'),
+    ('p_crud_top', UNMARKED_MODE)])
+def test_conflicting_modes(mode, other):
+    assert other in CONFLICTS[mode]
+
+
+@pytest.mark.parametrize(('mode', 'other'), [
+    ('p_ro_resource', 'p_ro_top'),
+    ('p_crud_namespace', 'p_ro_top_safe'),
+    ('p_crud_namespace', UNMARKED_MODE),
+    (UNMARKED_MODE, UNMARKED_MODE)])
+def test_compatible_modes(mode, other):
+    assert other not in CONFLICTS[mode]
+
+
+def test_unmarked_test_lock_mode():
+    assert _lock_modes(FakeItem('p_group1')) == [UNMARKED_MODE]
+    assert _lock_modes(FakeItem('p_group1', 'p_ro_top')) == ['p_ro_top']
+
+
+@pytest.mark.parametrize(('code', 'reported', 'expected'), [
+    (0, 0, 0),
+    (5, None, 0),
+    (1, 3, 3),
+    (1, None, 1),
+    (2, 0, 1)])
+def test_failed_count(code, reported, expected):
+    assert _failed_count(code, reported) == expected
+
+
+def test_acquire_waits_for_conflicting_release():
+    _locks = ResourceLocks()
+    _locks.acquire(['p_crud_resource'])
+    _acquired = threading.Event()
+
+    def _acquire():
+        _locks.acquire(['p_ro_resource'])
+        _acquired.set()
+
+    _thread = threading.Thread(target=_acquire)
+    _thread.daemon = True
+    _thread.start()
+    assert not _acquired.wait(0.3)
+    _locks.release(['p_crud_resource'])
+    assert _acquired.wait(5)
+    # read only modes are held together
+    _locks.acquire(['p_ro_resource', 'p_ro_top'])
+
+
+def _intervals(testdir, monkeypatch, first, second):
+    testdir.makeconftest(CONFTEST)
+    testdir.makepyfile(test_lanes=LANES_TEST.format(first=first, second=second))
+    # the scheduler starts its lanes as python -m pytest processes
+    monkeypatch.setenv('PYTHONPATH', project_path.strpath)
+    _result = testdir.runpytest_subprocess('--p-workers', '2')
+    _output = _result.stdout.str()
+    assert _result.ret == 0, _output
+    assert 'lane p_group1' in _output and 'lane p_group2' in _output
+    return [[float(_time) for _time in testdir.tmpdir.join(
+        '{}.interval'.format(_name)).read().split()] for _name in ('first', 'second')]
+
+
+def _overlap(first, second):
+    return first[0] < second[1] and second[0] < first[1]
+
+
+def test_lanes_run_concurrently(testdir, monkeypatch):
+    assert _overlap(*_intervals(testdir, monkeypatch, 'p_ro_resource', 'p_ro_namespace'))
+
+
+def test_locks_serialize_conflicting_lanes(testdir, monkeypatch):
+    _start = time.time()
+    _first, _second = _intervals(testdir, monkeypatch, 'p_crud_resource', 'p_ro_resource')
+    assert not _overlap(_first, _second)
+    assert min(_first[0], _second[0]) > _start
+
+
+def test_unmarked_lane_waits_for_crud_top(testdir, monkeypatch):
+    _first, _second = _intervals(testdir, monkeypatch, 'p_crud_top', 'no_lock_marker')
+    assert not _overlap(_first, _second)
+
+
+def test_session_fails_with_failed_tests_of_lanes(testdir, monkeypatch):
+    testdir.makeconftest(CONFTEST)
+    testdir.makepyfile(test_failing=FAILING_TEST)
+    monkeypatch.setenv('PYTHONPATH', project_path.strpath)
+    _result = testdir.runpytest_subprocess('--p-workers', '2')
+    assert _result.ret == 1
+    assert testdir.tmpdir.join('testsfailed').read() == '3'
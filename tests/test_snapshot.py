@@ -0,0 +1,111 @@
+from selenium.webdriver.remote.webelement import WebElement
+
+from kiali_qe.components.browser import KialiBrowser
+from kiali_qe.components.snapshot import DomSnapshot, rendered_text
+
+WORKLOADS_TABLE = """
+<html><body>
+<table class="table">
+  <thead><tr><th>Name</th><th>Type</th><th>Labels</th></tr></thead>
+  <tbody>
+    <tr class="row">
+      <td><a href="/workloads/details">details-v1</a></td><td>Deployment</td>
+      <td><span class="label-pair"><span class="label-key">app</span><span
+        class="label-value">details</span></span></td>
+    </tr>
+    <tr class="row">
+      <td>reviews-v2<span style="display: none">hidden</span></td><td>Deployment</td>
+      <td><div hidden>no labels</div></td>
+    </tr>
+  </tbody>
+</table>
+</body></html>
+"""
+
+
+def _element(xpath, page_source=WORKLOADS_TABLE, text_reader=None):
+    return DomSnapshot(page_source, text_reader=text_reader).elements(xpath)[0]
+
+
+def test_table_cells_are_separated():
+    assert rendered_text(_element('//tbody/tr[1]').node) == 'details-v1 Deployment appdetails'
+    assert rendered_text(_element('//thead/tr').node) == 'Name Type Labels'
+
+
+def test_table_rows_are_lines():
+    assert rendered_text(_element('//table').node).split('\n') == [
+        'Name Type Labels', 'details-v1 Deployment appdetails', 'reviews-v2 Deployment']
+
+
+def test_hidden_elements_have_no_text():
+    assert rendered_text(_element('//tbody/tr[2]').node) == 'reviews-v2 Deployment'
+    assert rendered_text(_element('//tbody/tr[2]/td[3]/div').node) == ''
+    assert not _element('//tbody/tr[2]/td[3]/div').is_displayed()
+
+
+def test_text_is_read_from_live_page():
+    _paths = []
+
+    def _reader(element):
+        _paths.append(element.path)
+        return 'live text'
+
+    _cell = _element('//tbody/tr[1]/td[1]', text_reader=_reader)
+    assert _cell.text == 'live text'
+    assert _paths == ['/html/body/table/tbody/tr[1]/td[1]']
+    # attributes are read from the snapshot
+    assert _element('//tbody/tr[1]//a', text_reader=_reader).get_attribute('href') == \
+        '/workloads/details'
+
+
+class StubWebElement(WebElement):
+
+    def __init__(self, text):
+        WebElement.__init__(self, parent=None, id_='stub')
+        self._text = text
+
+    @property
+    def text(self):
+        return self._text
+
+    def is_displayed(self):
+        return True
+
+    def __repr__(self):
+        return 'StubWebElement({})'.format(repr(self._text))
+
+
+class StubSelenium(object):
+
+    def __init__(self):
+        self.page_source = WORKLOADS_TABLE
+        self.found = []
+
+    def find_element(self, by, value):
+        self.found.append(value)
+        return StubWebElement('  details-v1 \n Deployment  ')
+
+    def execute_script(self, script, *args):
+        return args
+
+
+def test_browser_text_in_snapshot_mode_uses_live_element():
+    _selenium = StubSelenium()
+    _browser = KialiBrowser(_selenium, kiali_versions={})
+    with _browser.snapshot():
+        _rows = _browser.elements('//tbody/tr')
+        assert len(_rows) == 2
+        assert _browser.text('./td[1]', parent=_rows[0]) == 'details-v1 Deployment'
+        assert _browser.element('./td[1]', parent=_rows[0]).text == '  details-v1 \n Deployment  '
+    assert _selenium.found == ['/html/body/table/tbody/tr[1]/td[1]'] * 2
+
+
+def test_scripts_get_live_elements_of_snapshot():
+    _selenium = StubSelenium()
+    _browser = KialiBrowser(_selenium, kiali_versions={})
+    with _browser.snapshot():
+        _row = _browser.element('//tbody/tr[2]')
+        _args = _browser.execute_script('return arguments', _row, None, {'items': '.'})
+    assert isinstance(_args[0], StubWebElement)
+    assert _args[1:] == (None, {'items': '.'})
+    assert _selenium.found == ['/html/body/table/tbody/tr[2]']
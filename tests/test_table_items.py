@@ -0,0 +1,108 @@
+from lxml import html
+
+from kiali_qe.components import (
+    ITEMS_DATA_SCRIPT, TableViewAbstract, TableViewServices, TableViewVirtualServices,
+    TableViewWorkloadPods)
+from kiali_qe.components.enums import IstioConfigValidation
+from kiali_qe.components.snapshot import rendered_text
+
+SERVICES_PANE = """
+<html><body><div id="service-tabs-pane-{pane}">
+<table class="table"><thead><tr><th>Name</th></tr></thead><tbody>{rows}</tbody></table>
+</div></body></html>
+"""
+LABELS = """
+<span class="label-pair"><span class="label-key">app</span>
+  <span class="label-value">reviews</span></span>
+<span class="label-pair"><span class="label-key">version</span>
+  <span class="label-value">v1</span></span>
+"""
+
+
+class StubBrowser(object):
+    """ Answers ITEMS_DATA_SCRIPT with lxml, as the page would """
+
+    def __init__(self, page_source):
+        self.root = html.fromstring(page_source)
+        self.calls = 0
+
+    def execute_script(self, script, root, query):
+        assert script == ITEMS_DATA_SCRIPT and root is None
+        self.calls += 1
+        _result = []
+        for _item in self.root.xpath(query['items']):
+            _texts = {}
+            for _key, _xpath in query['texts'].items():
+                _nodes = _item.xpath(_xpath)
+                _texts[_key] = rendered_text(_nodes[0]) if _nodes else None
+            _result.append({
+                'texts': _texts,
+                'counts': dict([(_key, _item.xpath('count({})'.format(_xpath)))
+                                for _key, _xpath in query['counts'].items()]),
+                'lists': dict([(_key, [rendered_text(_node) for _node in _item.xpath(_xpath)])
+                               for _key, _xpath in query['lists'].items()])})
+        return _result
+
+
+class FakeTable(object):
+    """ Table view on the stub browser, widgets can not be created without a browser """
+    _column = TableViewAbstract._column
+    _rows_data = TableViewAbstract._rows_data
+    _data_text = TableViewAbstract._data_text
+    _data_status = TableViewAbstract._data_status
+    _data_labels = TableViewAbstract._data_labels
+
+    def __init__(self, page_source):
+        self.browser = StubBrowser(page_source)
+
+    def open(self):
+        pass
+
+
+# locators of the table view
+for _name, _value in vars(TableViewAbstract).items():
+    if _name.isupper():
+        setattr(FakeTable, _name, _value)
+
+
+def _cells(*cells):
+    return '<tr>{}</tr>'.format(''.join(['<td>{}</td>'.format(_cell) for _cell in cells]))
+
+
+def test_services_are_read_in_one_call():
+    _table = FakeTable(SERVICES_PANE.format(pane='services', rows=''.join([
+        _cells('reviews', '-', 'ClusterIP', LABELS, '1234', '172.30.0.1',
+               '<div>http 9080/TCP</div><div>grpc 9090/TCP</div>'),
+        _cells('ratings', '-', 'ClusterIP', '', '99', '172.30.0.2', 'http 9080/TCP')])))
+    _items = TableViewServices.items.fget(_table)
+    assert _table.browser.calls == 1
+    assert [(_item.name, _item.service_type, _item.resource_version, _item.ip, _item.ports)
+            for _item in _items] == [
+        ('reviews', 'ClusterIP', '1234', '172.30.0.1', 'http 9080/TCP grpc 9090/TCP'),
+        ('ratings', 'ClusterIP', '99', '172.30.0.2', 'http 9080/TCP')]
+    assert _items[0].labels == {'app': 'reviews', 'version': 'v1'}
+    assert _items[1].labels == {}
+
+
+def test_virtual_service_status_is_read_from_first_column():
+    _table = FakeTable(SERVICES_PANE.format(pane='virtualservices', rows=''.join([
+        _cells('<span class="pficon-warning-triangle-o"></span>', 'reviews', '-', '10'),
+        _cells('<span class="pficon-ok"></span>', 'ratings', '-', '11'),
+        _cells('', 'details', '-', '12')])))
+    _items = TableViewVirtualServices.items.fget(_table)
+    assert [(_item.name, _item.status, _item.resource_version) for _item in _items] == [
+        ('reviews', IstioConfigValidation.WARNING, '10'),
+        ('ratings', IstioConfigValidation.VALID, '11'),
+        ('details', IstioConfigValidation.NA, '12')]
+
+
+def test_pod_status_is_read_from_row():
+    _table = FakeTable(SERVICES_PANE.format(pane='pods', rows=_cells(
+        '', 'reviews-v1-1', '-', 'reviews-v1', LABELS, 'istio-init', 'istio-proxy',
+        'Running <span class="pficon-error-circle-o"></span>')))
+    _items = TableViewWorkloadPods.items.fget(_table)
+    assert [(_item.name, _item.created_by, _item.istio_init_containers,
+             _item.istio_containers, _item.phase, _item.status) for _item in _items] == [
+        ('reviews-v1-1', 'reviews-v1', 'istio-init', 'istio-proxy', 'Running',
+         IstioConfigValidation.NOT_VALID)]
+    assert _items[0].labels == {'app': 'reviews', 'version': 'v1'}
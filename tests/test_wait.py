@@ -0,0 +1,88 @@
+import time
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+from wait_for import TimedOutError
+
+from kiali_qe import components
+from kiali_qe.components import (
+    NAVBAR_SPINNER, wait_page_idle, wait_to_spinner_disappear, wait_until)
+from kiali_qe.utils.log import logger
+
+
+class StubSelenium(object):
+    """ Runs the idle script as a page which is never idle, or which does not support it """
+
+    def __init__(self, supported=True):
+        self.supported = supported
+        self.calls = []
+
+    def execute_async_script(self, script, options):
+        self.calls.append(options)
+        if not self.supported:
+            raise WebDriverException('asynchronous scripts are not supported')
+        time.sleep(options['timeout'] / 1000.0)
+        return False
+
+
+class StubBrowser(object):
+
+    def __init__(self, supported=True, spinners=0):
+        self.selenium = StubSelenium(supported=supported)
+        self.logger = logger
+        self.spinners = spinners
+        self.locators = []
+
+    def elements(self, locator):
+        self.locators.append(locator)
+        return [object()] * self.spinners
+
+
+class Condition(object):
+    """ Met after the given time """
+
+    def __init__(self, after):
+        self.met_at = time.time() + after
+
+    def __call__(self):
+        return time.time() >= self.met_at
+
+
+def test_condition_is_checked_while_page_is_busy():
+    _browser = StubBrowser()
+    _start = time.time()
+    assert wait_until(_browser, Condition(1.5), timeout='10s')
+    assert time.time() - _start < 1.5 + components.PAGE_IDLE_SLICE + 0.5
+    assert all([_call['timeout'] <= components.PAGE_IDLE_SLICE * 1000
+                for _call in _browser.selenium.calls])
+
+
+@pytest.mark.parametrize('supported', [True, False])
+def test_timeout_is_one_budget(supported):
+    _start = time.time()
+    assert not wait_until(StubBrowser(supported=supported), lambda: False, timeout='1.5s')
+    assert 1.5 <= time.time() - _start < 2
+
+
+def test_timeout_raises_unless_silent():
+    with pytest.raises(TimedOutError):
+        wait_until(StubBrowser(), lambda: False, timeout='300ms', silent_failure=False)
+
+
+def test_condition_met_without_idle_wait():
+    _browser = StubBrowser()
+    assert wait_until(_browser, lambda: True)
+    assert _browser.selenium.calls == []
+
+
+def test_polling_when_idle_script_not_supported():
+    _browser = StubBrowser(supported=False)
+    assert wait_page_idle(_browser) is None
+    assert wait_until(_browser, Condition(0.5), timeout='3s')
+
+
+def test_spinner_wait_is_scoped_to_navbar():
+    _browser = StubBrowser(spinners=1)
+    wait_to_spinner_disappear(_browser, timeout='300ms')
+    assert set(_browser.locators) == set([NAVBAR_SPINNER])
+    assert set([_call['absent'] for _call in _browser.selenium.calls]) == set([NAVBAR_SPINNER])